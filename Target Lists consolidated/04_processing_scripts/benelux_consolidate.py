@@ -12,8 +12,13 @@ Consolidates research from 6 streams into:
 import csv
 import os
 import re
+import sys
 from collections import defaultdict
 
+# atlas entity resolution (repo src/ when atlas isn't installed)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src"))
+from atlas.etl.common.entity_resolution import EntityResolver
+
 # Output paths
 BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 MASTER_DIR = os.path.join(BASE, "02_master_lists")
@@ -446,24 +451,18 @@ def calculate_data_completeness(company):
     return round(filled / len(fields) * 100)
 
 def deduplicate(companies):
-    """Deduplicate by normalized name, merging source lists"""
-    seen = {}  # normalized_name -> company dict
-    domain_seen = {}  # domain -> normalized_name
-
-    for c in companies:
-        norm = normalize_name(c['company_name'])
-        domain = (c.get('domain') or '').lower().strip()
-
-        # Check domain-based dedup
-        existing_norm = None
-        if domain and domain in domain_seen:
-            existing_norm = domain_seen[domain]
-        elif norm in seen:
-            existing_norm = norm
-
-        if existing_norm and existing_norm in seen:
+    """Deduplicate by domain, normalized name and fuzzy name match, merging source lists"""
+    rows = [dict(c, _dedup_name=normalize_name(c['company_name'])) for c in companies]
+    resolver = EntityResolver(threshold=90, name_key='_dedup_name')
+
+    unique = []
+    for cluster in resolver.clusters(rows):
+        existing = rows[cluster[0]]
+        existing.pop('_dedup_name')
+        for i in cluster[1:]:
+            c = rows[i]
+            c.pop('_dedup_name')
             # Merge: keep best data, merge sources
-            existing = seen[existing_norm]
             existing_sources = set(existing.get('source', '').split('; '))
             new_sources = set(c.get('source', '').split('; '))
             existing['source'] = '; '.join(sorted(existing_sources | new_sources))
@@ -479,12 +478,9 @@ def deduplicate(companies):
                     # Keep the one that seems more precise (not rounded to billions)
                     if existing[key] % 1000000000 == 0 and c[key] % 1000000000 != 0:
                         existing[key] = c[key]
-        else:
-            seen[norm] = dict(c)
-            if domain:
-                domain_seen[domain] = norm
+        unique.append(existing)
 
-    return list(seen.values())
+    return unique
 
 
 def main():
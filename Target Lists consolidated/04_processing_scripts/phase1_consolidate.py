@@ -5,10 +5,14 @@ Reads all 11 target lists, normalizes, filters by ICP, deduplicates, merges.
 import pandas as pd
 import re
 import os
+import sys
 import json
-from rapidfuzz import fuzz, process
 from collections import defaultdict
 
+# atlas entity resolution (repo src/ when atlas isn't installed)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src"))
+from atlas.etl.common.entity_resolution import EntityResolver
+
 BASE = r"C:\Users\mamowi\Clients\AI-KIP\Target Lists unconsolidated"
 OUT = r"C:\Users\mamowi\Clients\AI-KIP"
 
@@ -633,42 +637,16 @@ for reason, count in sorted(filtered_out.items(), key=lambda x: -x[1]):
     print(f"    {reason}: {count}")
 
 # Step 4: Deduplication via fuzzy matching
-print("\n[4/6] Deduplicating (fuzzy match on company name + city)...")
-
-# Build match key
-for row in icp_eligible:
-    cn = clean_company_name(row.get("company_name", ""))
-    city = str(row.get("city", "")).strip().lower()
-    row["_match_key"] = f"{cn.lower()}|{city}"
-    row["_clean_name"] = cn.lower()
+print("\n[4/6] Deduplicating (domain + blocked fuzzy match on company name)...")
 
-# Group by exact match key first
-exact_groups = defaultdict(list)
 for row in icp_eligible:
-    exact_groups[row["_match_key"]].append(row)
-
-# Now fuzzy-match across groups
-group_keys = list(exact_groups.keys())
-merged_groups = []
-used = set()
+    row["_clean_name"] = clean_company_name(row.get("company_name", "")).lower()
 
-for i, key1 in enumerate(group_keys):
-    if key1 in used:
-        continue
-    group = list(exact_groups[key1])
-    used.add(key1)
-    name1 = key1.split("|")[0]
-    for j in range(i + 1, len(group_keys)):
-        key2 = group_keys[j]
-        if key2 in used:
-            continue
-        name2 = key2.split("|")[0]
-        # Fuzzy match on name
-        score = fuzz.token_sort_ratio(name1, name2)
-        if score >= 85:
-            group.extend(exact_groups[key2])
-            used.add(key2)
-    merged_groups.append(group)
+# Same domain, or token_sort_ratio >= 85 on the name within blocks (name prefix, zip)
+resolver = EntityResolver(threshold=85, name_key="_clean_name", postcode_key="zip")
+merged_groups = [
+    [icp_eligible[i] for i in cluster] for cluster in resolver.clusters(icp_eligible)
+]
 
 print(f"  Unique companies after dedup: {len(merged_groups)}")
 
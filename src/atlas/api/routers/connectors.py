@@ -10,10 +10,13 @@ Provides endpoints for:
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, File, UploadFile, Form
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
+from contextlib import AsyncExitStack
 from datetime import datetime
 import json
+import os
 
 router = APIRouter(prefix="/api/connectors", tags=["connectors"])
 
@@ -54,6 +57,30 @@ class EnrichRequest(BaseModel):
     linkedin_url: Optional[str] = None
 
 
+# Upper bound for client-chosen fan-out per batch request
+MAX_BATCH_CONCURRENCY = 20
+
+
+class BatchEnrichRequest(BaseModel):
+    """Request to enrich many companies or people via connector"""
+    connector_id: str
+    auth_config: Dict[str, str]
+    domains: List[str] = []
+    kvk_numbers: List[str] = []
+    company_names: List[str] = []  # KvK: resolved via search
+    emails: List[str] = []
+    linkedin_urls: List[str] = []
+    concurrency: int = Field(5, ge=1, le=MAX_BATCH_CONCURRENCY)
+
+
+class WaterfallEnrichRequest(BaseModel):
+    """Request to enrich companies through the cost-ordered source waterfall"""
+    credentials: Dict[str, Dict[str, str]]  # connector_id -> auth_config
+    entities: List[Dict[str, Any]]          # each with domain / kvk_number / linkedin_url
+    fields: List[str]
+    concurrency: int = Field(5, ge=1, le=MAX_BATCH_CONCURRENCY)
+
+
 class PeopleSearchRequest(BaseModel):
     """Request to find people at a company"""
     connector_id: str
@@ -124,6 +151,27 @@ async def get_connector_info(connector_id: str):
     return connector_class.config.to_dict()
 
 
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    Response cache hit rates per provider (since this API process started).
+    """
+    from atlas.ingestors.common.response_cache import get_response_cache
+
+    cache = get_response_cache()
+    return {"enabled": cache.enabled, "providers": cache.stats()}
+
+
+@router.get("/pool")
+async def get_connector_pool():
+    """
+    Long-lived connector instances held by this API process.
+    """
+    from atlas.connectors.registry import ConnectorRegistry
+
+    return {"instances": ConnectorRegistry.pool_status()}
+
+
 # ─────────────────────────────────────────────────────────────
 # Connection Testing
 # ─────────────────────────────────────────────────────────────
@@ -197,20 +245,19 @@ async def search_companies(request: SearchRequest):
         )
 
     try:
-        connector = connector_class(**request.auth_config)
-        results = await connector.search(
-            request.query,
-            limit=request.limit,
-            filters=request.filters,
-        )
-        await connector.close()
-
-        return {
-            "connector": request.connector_id,
-            "query": request.query,
-            "count": len(results),
-            "results": results,
-        }
+        async with ConnectorRegistry.lease(request.connector_id, **request.auth_config) as connector:
+            results = await connector.search(
+                request.query,
+                limit=request.limit,
+                filters=request.filters,
+            )
+
+            return {
+                "connector": request.connector_id,
+                "query": request.query,
+                "count": len(results),
+                "results": results,
+            }
     except Exception as e:
         raise HTTPException(500, f"Search failed: {str(e)}")
 
@@ -247,36 +294,151 @@ async def enrich_company(request: EnrichRequest):
         )
 
     try:
-        connector = connector_class(**request.auth_config)
+        async with ConnectorRegistry.lease(request.connector_id, **request.auth_config) as connector:
+            result = None
+            if request.connector_id == "kvk" and request.kvk_number:
+                result = await connector.enrich_company(request.kvk_number)
+            elif request.connector_id == "linkedin" and request.linkedin_url:
+                result = await connector.enrich_company(request.linkedin_url)
+            elif request.domain:
+                if hasattr(connector, "enrich_company"):
+                    result = await connector.enrich_company(request.domain)
+                elif hasattr(connector, "enrich_by_domain"):
+                    result = await connector.enrich_by_domain(request.domain)
+
+            if result:
+                return {
+                    "connector": request.connector_id,
+                    "found": True,
+                    "company": result,
+                }
+            else:
+                return {
+                    "connector": request.connector_id,
+                    "found": False,
+                    "company": None,
+                }
+    except Exception as e:
+        raise HTTPException(500, f"Enrichment failed: {str(e)}")
 
-        result = None
-        if request.connector_id == "kvk" and request.kvk_number:
-            result = await connector.enrich_company(request.kvk_number)
-        elif request.connector_id == "linkedin" and request.linkedin_url:
-            result = await connector.enrich_company(request.linkedin_url)
-        elif request.domain:
-            if hasattr(connector, "enrich_company"):
-                result = await connector.enrich_company(request.domain)
-            elif hasattr(connector, "enrich_by_domain"):
-                result = await connector.enrich_by_domain(request.domain)
 
-        await connector.close()
+def _ndjson(results, summary=None, lease=None) -> StreamingResponse:
+    """
+    Stream batch results as NDJSON, one line per input, then a summary line.
 
-        if result:
-            return {
-                "connector": request.connector_id,
-                "found": True,
-                "company": result,
-            }
-        else:
-            return {
-                "connector": request.connector_id,
-                "found": False,
-                "company": None,
-            }
+    `summary`, if given, is called at the end and its dict merged into the
+    summary line. `lease`, an AsyncExitStack holding the pooled connector, is
+    closed when the stream ends (also on client disconnect).
+    """
+
+    async def lines():
+        try:
+            count = found = failed = 0
+            async for item in results:
+                count += 1
+                found += item["found"]
+                failed += item["error"] is not None
+                yield json.dumps(item, default=str) + "\n"
+            done = {"done": True, "count": count, "found": found, "failed": failed}
+            if summary:
+                done.update(summary())
+            yield json.dumps(done, default=str) + "\n"
+        finally:
+            if lease is not None:
+                await lease.aclose()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/enrich/batch")
+async def enrich_batch(request: BatchEnrichRequest):
+    """
+    Enrich many companies (domains / kvk_numbers / company_names / linkedin_urls)
+    or people (emails) at once.
+
+    Uses the provider's bulk endpoint where there is one (Apollo) or batched
+    scraper runs (LinkedIn), otherwise fans out single lookups concurrently under the connector's rate limiter.
+    Streams NDJSON: one {"input", "found", "result", "error"} line per distinct
+    input as it completes, then {"done": true, ...}.
+    """
+    from atlas.connectors.registry import ConnectorRegistry
+    from atlas.connectors.utils.concurrency import (
+        as_completed_bounded,
+        batch_result,
+        distinct_keys,
+    )
+
+    connector_class = ConnectorRegistry.get(request.connector_id)
+    if not connector_class:
+        raise HTTPException(400, f"Unknown connector: {request.connector_id}")
+    if not connector_class.config.supports_enrich:
+        raise HTTPException(
+            400,
+            f"Connector '{request.connector_id}' does not support enrichment"
+        )
+
+    # Held for the whole stream, so the pool can't close it mid-batch
+    lease = AsyncExitStack()
+    try:
+        connector = await lease.enter_async_context(
+            ConnectorRegistry.lease(request.connector_id, **request.auth_config)
+        )
     except Exception as e:
         raise HTTPException(500, f"Enrichment failed: {str(e)}")
 
+    async def fan_out(keys, enrich):
+        async for key, result, error in as_completed_bounded(
+            distinct_keys(keys), enrich, request.concurrency
+        ):
+            yield batch_result(key, result, error)
+
+    if request.linkedin_urls and hasattr(connector, "enrich_companies_by_url"):
+        results = connector.enrich_companies_by_url(request.linkedin_urls, request.concurrency)
+    elif request.emails:
+        if hasattr(connector, "enrich_people"):
+            results = connector.enrich_people(request.emails, request.concurrency)
+        elif hasattr(connector, "enrich_person"):
+            results = fan_out(request.emails, connector.enrich_person)
+        else:
+            await lease.aclose()
+            raise HTTPException(400, f"Connector '{request.connector_id}' cannot enrich people")
+    elif request.connector_id == "kvk" and (request.kvk_numbers or request.company_names):
+        results = connector.enrich_companies(
+            request.kvk_numbers, request.company_names, request.concurrency
+        )
+    elif request.domains and hasattr(connector, "enrich_companies"):
+        results = connector.enrich_companies(request.domains, request.concurrency)
+    elif request.domains and hasattr(connector, "enrich_company"):
+        results = fan_out(request.domains, connector.enrich_company)
+    elif request.domains and hasattr(connector, "enrich_by_domain"):
+        results = fan_out(request.domains, connector.enrich_by_domain)
+    else:
+        await lease.aclose()
+        raise HTTPException(
+            400, "Provide domains, kvk_numbers, company_names, linkedin_urls or emails"
+        )
+
+    return _ndjson(results, lease=lease)
+
+
+@router.post("/enrich/waterfall")
+async def enrich_waterfall(request: WaterfallEnrichRequest):
+    """
+    Enrich companies source by source, cheapest first, until `fields` are filled.
+
+    Only connectors with credentials take part (kvk, apollo, hunter, linkedin).
+    Streams NDJSON: one {"input": index, "found": complete, "result", "error"}
+    line per entity, then a summary line with per-source stats.
+    """
+    from atlas.connectors.waterfall import EnrichmentWaterfall
+
+    waterfall = EnrichmentWaterfall(request.credentials)
+    if not waterfall.sources:
+        raise HTTPException(400, "No credentials for any waterfall source")
+
+    results = waterfall.enrich_many(request.entities, request.fields, request.concurrency)
+    return _ndjson(results, summary=lambda: {"sources": waterfall.stats()})
+
 
 # ─────────────────────────────────────────────────────────────
 # People/Contact Operations
@@ -307,41 +469,38 @@ async def find_people(request: PeopleSearchRequest):
         )
 
     try:
-        connector = connector_class(**request.auth_config)
-
-        # Call the appropriate method based on connector
-        if request.connector_id == "apollo":
-            results = await connector.find_by_company_domain(
-                request.domain,
-                limit=request.limit,
-                titles=request.titles,
-                seniorities=request.seniorities,
-            )
-        elif request.connector_id == "hunter":
-            results = await connector.find_by_company_domain(
-                request.domain,
-                limit=request.limit,
-            )
-        elif request.connector_id == "linkedin":
-            results = await connector.find_by_company_domain(
-                request.domain,
-                limit=request.limit,
-                titles=request.titles,
-            )
-        else:
-            results = await connector.find_by_company_domain(
-                request.domain,
-                limit=request.limit,
-            )
+        async with ConnectorRegistry.lease(request.connector_id, **request.auth_config) as connector:
+            # Call the appropriate method based on connector
+            if request.connector_id == "apollo":
+                results = await connector.find_by_company_domain(
+                    request.domain,
+                    limit=request.limit,
+                    titles=request.titles,
+                    seniorities=request.seniorities,
+                )
+            elif request.connector_id == "hunter":
+                results = await connector.find_by_company_domain(
+                    request.domain,
+                    limit=request.limit,
+                )
+            elif request.connector_id == "linkedin":
+                results = await connector.find_by_company_domain(
+                    request.domain,
+                    limit=request.limit,
+                    titles=request.titles,
+                )
+            else:
+                results = await connector.find_by_company_domain(
+                    request.domain,
+                    limit=request.limit,
+                )
 
-        await connector.close()
-
-        return {
-            "connector": request.connector_id,
-            "domain": request.domain,
-            "count": len(results),
-            "people": results,
-        }
+            return {
+                "connector": request.connector_id,
+                "domain": request.domain,
+                "count": len(results),
+                "people": results,
+            }
     except ValueError as e:
         raise HTTPException(400, str(e))
     except Exception as e:
@@ -353,6 +512,17 @@ async def find_people(request: PeopleSearchRequest):
 # ─────────────────────────────────────────────────────────────
 
 
+def _file_type(filename: str) -> str:
+    """csv / xlsx / xls from the upload's filename"""
+    if filename.endswith(".csv"):
+        return "csv"
+    elif filename.endswith(".xlsx"):
+        return "xlsx"
+    elif filename.endswith(".xls"):
+        return "xls"
+    raise HTTPException(400, "Unsupported file type. Use CSV or Excel.")
+
+
 @router.post("/file/preview")
 async def preview_file(
     file: UploadFile = File(...),
@@ -367,24 +537,16 @@ async def preview_file(
     - Auto-detected column mappings
     - Sheet names (for Excel files)
     """
-    from atlas.connectors.file_import import FileImportConnector
+    from atlas.connectors.file_import import FileImportConnector, spool_upload
 
-    # Determine file type
-    filename = file.filename or ""
-    if filename.endswith(".csv"):
-        file_type = "csv"
-    elif filename.endswith(".xlsx"):
-        file_type = "xlsx"
-    elif filename.endswith(".xls"):
-        file_type = "xls"
-    else:
-        raise HTTPException(400, "Unsupported file type. Use CSV or Excel.")
+    file_type = _file_type(file.filename or "")
 
+    path = None
     try:
-        content = await file.read()
+        path = await spool_upload(file, suffix=f".{file_type}")
         connector = FileImportConnector()
         preview = await connector.preview_file(
-            content,
+            path,
             file_type,
             rows=5,
             sheet_name=sheet_name,
@@ -392,10 +554,14 @@ async def preview_file(
         return preview
     except Exception as e:
         raise HTTPException(500, f"Failed to preview file: {str(e)}")
+    finally:
+        if path and os.path.exists(path):
+            os.remove(path)
 
 
-@router.post("/file/import")
+@router.post("/file/import", status_code=202)
 async def import_file(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     column_mapping: str = Form(...),  # JSON string
     record_type: str = Form("company"),
@@ -403,7 +569,11 @@ async def import_file(
     sheet_name: Optional[str] = Form(None),
 ):
     """
-    Import companies or contacts from a file.
+    Import companies or contacts from a file into the graph.
+
+    The upload is spooled to disk and imported by a background job that
+    upserts records into Neo4j in batches. Poll GET /file/import/{job_id}
+    for progress and validation results.
 
     Args:
         file: CSV or Excel file
@@ -412,18 +582,15 @@ async def import_file(
         skip_rows: Number of header rows to skip
         sheet_name: Sheet name for Excel files
     """
-    from atlas.connectors.file_import import FileImportConnector
+    from atlas.connectors.file_import import (
+        IMPORT_JOBS,
+        FileImportConnector,
+        run_import_job,
+        spool_upload,
+    )
 
-    # Determine file type
     filename = file.filename or ""
-    if filename.endswith(".csv"):
-        file_type = "csv"
-    elif filename.endswith(".xlsx"):
-        file_type = "xlsx"
-    elif filename.endswith(".xls"):
-        file_type = "xls"
-    else:
-        raise HTTPException(400, "Unsupported file type. Use CSV or Excel.")
+    file_type = _file_type(filename)
 
     try:
         mapping = json.loads(column_mapping)
@@ -431,43 +598,51 @@ async def import_file(
         raise HTTPException(400, "Invalid column_mapping JSON")
 
     try:
-        content = await file.read()
-        connector = FileImportConnector()
-
-        if record_type == "company":
-            records = await connector.import_companies(
-                content,
-                file_type,
-                mapping,
-                skip_rows=skip_rows,
-                sheet_name=sheet_name,
-            )
-        elif record_type == "contact":
-            records = await connector.import_contacts(
-                content,
-                file_type,
-                mapping,
-                skip_rows=skip_rows,
-                sheet_name=sheet_name,
-            )
-        else:
-            raise HTTPException(400, "record_type must be 'company' or 'contact'")
-
-        # Validate imported data
-        validation = await connector.validate_data(records, record_type)
-
-        return {
-            "filename": filename,
-            "record_type": record_type,
-            "imported_count": len(records),
-            "validation": validation,
-            "records": records[:100],  # Return first 100 records
-        }
+        FileImportConnector.check_mapping(mapping, record_type)
     except ValueError as e:
         raise HTTPException(400, str(e))
+
+    try:
+        path = await spool_upload(file, suffix=f".{file_type}")
     except Exception as e:
         raise HTTPException(500, f"Failed to import file: {str(e)}")
 
+    job = IMPORT_JOBS.create(filename, record_type)
+    background_tasks.add_task(
+        run_import_job,
+        job,
+        path,
+        file_type,
+        mapping,
+        skip_rows=skip_rows,
+        sheet_name=sheet_name,
+    )
+
+    return {
+        **job.to_dict(),
+        "status_url": f"/api/connectors/file/import/{job.id}",
+    }
+
+
+@router.get("/file/import/jobs")
+async def list_import_jobs():
+    """Recent file import jobs, newest first"""
+    from atlas.connectors.file_import import IMPORT_JOBS
+
+    jobs = IMPORT_JOBS.list()
+    return {"jobs": [job.to_dict() for job in jobs], "count": len(jobs)}
+
+
+@router.get("/file/import/{job_id}")
+async def get_import_job(job_id: str):
+    """Status, progress and validation results of a file import job"""
+    from atlas.connectors.file_import import IMPORT_JOBS
+
+    job = IMPORT_JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(404, f"Import job not found: {job_id}")
+    return job.to_dict()
+
 
 # ─────────────────────────────────────────────────────────────
 # Email Operations (Hunter)
@@ -480,6 +655,13 @@ class EmailVerifyRequest(BaseModel):
     email: str
 
 
+class EmailVerifyBatchRequest(BaseModel):
+    """Request to verify many emails"""
+    api_key: str
+    emails: List[str]
+    concurrency: int = Field(5, ge=1, le=MAX_BATCH_CONCURRENCY)
+
+
 class EmailFindRequest(BaseModel):
     """Request to find a specific person's email"""
     api_key: str
@@ -495,17 +677,32 @@ async def verify_email(request: EmailVerifyRequest):
 
     Uses Hunter.io email verification.
     """
-    from atlas.connectors.hunter import HunterConnector
+    from atlas.connectors.registry import ConnectorRegistry
 
     try:
-        connector = HunterConnector(api_key=request.api_key)
-        result = await connector.verify_email(request.email)
-        await connector.close()
-        return result
+        async with ConnectorRegistry.lease("hunter", api_key=request.api_key) as connector:
+            return await connector.verify_email(request.email)
     except Exception as e:
         raise HTTPException(500, f"Email verification failed: {str(e)}")
 
 
+@router.post("/email/verify/batch")
+async def verify_emails(request: EmailVerifyBatchRequest):
+    """
+    Verify many email addresses, streamed as NDJSON in completion order.
+
+    Uses Hunter.io email verification; each line is
+    {"input", "found", "result", "error"}, followed by a {"done": true} summary.
+    """
+    from atlas.connectors.registry import ConnectorRegistry
+
+    lease = AsyncExitStack()
+    connector = await lease.enter_async_context(
+        ConnectorRegistry.lease("hunter", api_key=request.api_key)
+    )
+    return _ndjson(connector.verify_emails(request.emails, request.concurrency), lease=lease)
+
+
 @router.post("/email/find")
 async def find_email(request: EmailFindRequest):
     """
@@ -513,16 +710,48 @@ async def find_email(request: EmailFindRequest):
 
     Uses Hunter.io email finder.
     """
-    from atlas.connectors.hunter import HunterConnector
+    from atlas.connectors.registry import ConnectorRegistry
 
     try:
-        connector = HunterConnector(api_key=request.api_key)
-        result = await connector.find_email(
-            request.domain,
-            request.first_name,
-            request.last_name,
-        )
-        await connector.close()
-        return result
+        async with ConnectorRegistry.lease("hunter", api_key=request.api_key) as connector:
+            return await connector.find_email(
+                request.domain,
+                request.first_name,
+                request.last_name,
+            )
     except Exception as e:
         raise HTTPException(500, f"Email finding failed: {str(e)}")
+
+
+# ─────────────────────────────────────────────────────────────
+# Webhooks (Apify)
+# ─────────────────────────────────────────────────────────────
+
+
+@router.post("/apify/webhook")
+async def apify_run_webhook(payload: Dict[str, Any], token: Optional[str] = None):
+    """
+    Actor run completion callback.
+
+    Registered per run by ApifyConnector when APIFY_WEBHOOK_URL points here;
+    wakes the coroutines waiting on that run, which then confirm its status
+    with the Apify API (the payload itself is not trusted). The `token` query
+    parameter must match APIFY_WEBHOOK_SECRET; without a secret configured,
+    every call is refused.
+    """
+    import hmac
+
+    from atlas.connectors.apify.webhooks import run_from_payload, run_hub
+
+    secret = os.getenv("APIFY_WEBHOOK_SECRET")
+    if not secret:
+        raise HTTPException(403, "Apify webhooks are disabled (APIFY_WEBHOOK_SECRET not set)")
+    if not hmac.compare_digest(token or "", secret):
+        raise HTTPException(403, "Invalid webhook token")
+
+    run = run_from_payload(payload)
+    if not run:
+        raise HTTPException(400, "Payload has no actor run")
+
+    woken = run_hub.notify(run)
+    return {"run_id": run["id"], "status": run.get("status"), "waiters": woken}
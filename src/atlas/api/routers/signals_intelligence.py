@@ -514,7 +514,7 @@ def create_company(
         c.status = $status,
         c.website = $website,
         c.is_supplier = true,
-        c.updated_at = datetime()
+        c.updated_at = timestamp()
     RETURN c
     """
 
@@ -11,6 +11,9 @@ Usage:
 
     # Load existing data to Neo4j/Qdrant
     python -m atlas.cli etl enriched/raw/2025-11-03T... --qdrant
+
+    # Export batches as neo4j-admin import CSVs (offline initial load)
+    python -m atlas.cli bulk-export enriched/raw/2025-11-03T... --out ./import
 """
 
 import argparse
@@ -41,7 +44,7 @@ def cmd_ingest(args):
     if args.enrich and not hunter_key:
         print("WARNING: --enrich requires HUNTER_API_KEY")
 
-    pipeline = IngestionPipeline(company_ingestor, people_finder)
+    pipeline = IngestionPipeline(company_ingestor, people_finder, concurrency=args.concurrency)
     prefix = pipeline.run(args.query, args.limit)
 
     if args.load:
@@ -62,12 +65,28 @@ def cmd_etl(args):
     neo4j = get_neo4j_driver()
 
     etl = ETLPipeline(mc, neo4j)
-    batch_id = etl.run(args.prefix, load_to_qdrant=args.qdrant)
+    batch_id = etl.run(
+        args.prefix,
+        load_to_qdrant=args.qdrant,
+        chunk_size=args.chunk_size,
+        resume=not args.restart,
+    )
 
     print(f"\nETL complete! Batch: {batch_id}")
     print("Neo4j Browser: http://localhost:7474")
 
 
+def cmd_bulk_export(args):
+    from atlas.etl.bulk_to_graph.neo4j_admin_csv import export_prefixes
+
+    bucket = os.getenv("MINIO_BUCKET", "datalake")
+    writer = export_prefixes(get_minio_client(), bucket, args.prefixes, args.out)
+
+    print(f"\nExport complete! {writer.counts()}")
+    print("Stop Neo4j, then run:")
+    print(f"   {writer.import_command(args.database)}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Atlas Data Pipeline CLI")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -78,12 +97,28 @@ def main():
     ingest_parser.add_argument(
         "--enrich", action="store_true", help="Enrich with people data (Hunter.io)"
     )
+    ingest_parser.add_argument(
+        "--concurrency", type=int, default=4, help="Parallel people lookups when enriching"
+    )
     ingest_parser.add_argument("--load", action="store_true", help="Load to Neo4j immediately")
     ingest_parser.add_argument("--qdrant", action="store_true", help="Also load to Qdrant")
 
     etl_parser = subparsers.add_parser("etl", help="Load existing data to Neo4j/Qdrant")
     etl_parser.add_argument("prefix", help="MinIO prefix (e.g., enriched/raw/2025...)")
     etl_parser.add_argument("--qdrant", action="store_true", help="Also load to Qdrant")
+    etl_parser.add_argument(
+        "--chunk-size", type=int, default=500, help="Companies per checkpointed transaction"
+    )
+    etl_parser.add_argument(
+        "--restart", action="store_true", help="Ignore the checkpoint and reload from the start"
+    )
+
+    bulk_parser = subparsers.add_parser(
+        "bulk-export", help="Export batches as neo4j-admin import CSVs"
+    )
+    bulk_parser.add_argument("prefixes", nargs="+", help="MinIO prefixes to convert")
+    bulk_parser.add_argument("--out", default="import", help="Output directory")
+    bulk_parser.add_argument("--database", default="neo4j", help="Target database name")
 
     args = parser.parse_args()
 
@@ -95,6 +130,8 @@ def main():
         cmd_ingest(args)
     elif args.command == "etl":
         cmd_etl(args)
+    elif args.command == "bulk-export":
+        cmd_bulk_export(args)
 
 
 if __name__ == "__main__":
@@ -12,10 +12,12 @@ Apify provides:
 API Docs: https://docs.apify.com/api/v2
 """
 
-import httpx
 import asyncio
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import json
+import os
+import random
+import time
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable
 
 from atlas.connectors.registry import (
     BaseConnector,
@@ -24,7 +26,15 @@ from atlas.connectors.registry import (
     AuthType,
     ConnectorRegistry,
 )
+from atlas.connectors.utils.concurrency import as_completed_bounded, batch_result, chunked
+from atlas.connectors.utils.http import make_client
 from atlas.connectors.utils.rate_limiter import RateLimiter
+from atlas.connectors.apify.webhooks import (
+    TERMINAL_STATUSES,
+    run_hub,
+    webhook_config,
+    webhooks_param,
+)
 
 
 APIFY_CONFIG = ConnectorConfig(
@@ -57,6 +67,23 @@ APIFY_ACTORS = {
     "contact_extractor": "vdrmota/contact-info-scraper",
 }
 
+# LinkedIn scraper runs: start URLs per run, and runs in flight at once
+LINKEDIN_BATCH_SIZE = 25
+LINKEDIN_BATCH_CONCURRENCY = 3
+
+# Item fields the LinkedIn scrapers echo the scraped page URL in
+LINKEDIN_URL_FIELDS = ("inputUrl", "url", "linkedinUrl", "profileUrl")
+
+
+def linkedin_url_key(url: Optional[str]) -> Optional[str]:
+    """Comparable form of a LinkedIn URL, e.g. "/company/acme" """
+    if not url:
+        return None
+    key = url.strip().lower().split("?")[0].split("#")[0].rstrip("/")
+    if "linkedin.com" in key:
+        key = key.split("linkedin.com", 1)[1]
+    return key or None
+
 
 @ConnectorRegistry.register("apify")
 class ApifyConnector(BaseConnector):
@@ -68,28 +95,49 @@ class ApifyConnector(BaseConnector):
     - Google Maps and search scraping
     - Website contact extraction
     - Custom scraping workflows
+
+    Run completion: with a `webhook_url` (or APIFY_WEBHOOK_URL) runs register an
+    ad-hoc webhook and waiters are woken by the callback endpoint; status polling
+    with exponential backoff remains as the fallback. Set APIFY_BASE_URL to point
+    at a local fake server (see connectors.apify.fake_server).
     """
 
     config = APIFY_CONFIG
 
-    def __init__(self, api_token: str):
+    def __init__(
+        self,
+        api_token: str,
+        base_url: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+    ):
         """
         Initialize Apify connector.
 
         Args:
             api_token: Apify API token
+            base_url: API base URL override (default: APIFY_BASE_URL or Apify cloud)
+            webhook_url: Public URL of the run-completion callback endpoint
+                (default: APIFY_WEBHOOK_URL; unset = polling only)
+
+        Raises:
+            RuntimeError: webhooks enabled without APIFY_WEBHOOK_SECRET
         """
+        env_url, self.webhook_secret = webhook_config()
         self.api_token = api_token
-        self.client = httpx.AsyncClient(
-            base_url=self.config.base_url,
-            headers={"Authorization": f"Bearer {api_token}"},
-            timeout=120.0,  # Long timeout for scraping jobs
-        )
+        self.webhook_url = webhook_url or env_url
+        if self.webhook_url and not self.webhook_secret:
+            raise RuntimeError("Apify webhooks require APIFY_WEBHOOK_SECRET")
         self.rate_limiter = RateLimiter(
             connector_id="apify",
             limit=self.config.rate_limit,
             window=self.config.rate_limit_window,
         )
+        self.client = make_client(
+            self.rate_limiter,
+            base_url=base_url or os.getenv("APIFY_BASE_URL") or self.config.base_url,
+            headers={"Authorization": f"Bearer {api_token}"},
+            timeout=120.0,  # Long timeout for scraping jobs
+        )
 
     @property
     def source_prefix(self) -> str:
@@ -113,6 +161,7 @@ class ApifyConnector(BaseConnector):
                     "limit": self.config.rate_limit,
                     "remaining": data.get("limits", {}).get("computeUnits", {}).get("available", 0),
                     "reset_in": 3600,
+                    "effective": self.rate_limiter.get_status(),
                 }
         except Exception:
             pass
@@ -121,6 +170,7 @@ class ApifyConnector(BaseConnector):
     async def close(self):
         """Close HTTP client"""
         await self.client.aclose()
+        await self.rate_limiter.close()
 
     # ─────────────────────────────────────────────────────────────
     # Actor Execution
@@ -139,7 +189,7 @@ class ApifyConnector(BaseConnector):
         Args:
             actor_id: Actor ID or alias from APIFY_ACTORS
             input_data: Actor-specific input
-            wait_for_finish: Block until completion
+            wait_for_finish: Block until completion (webhook, else polling)
             max_wait_secs: Max wait time
 
         Returns:
@@ -147,19 +197,23 @@ class ApifyConnector(BaseConnector):
         """
         await self.rate_limiter.wait_and_acquire()
 
-        # Resolve actor alias
-        resolved_actor = APIFY_ACTORS.get(actor_id, actor_id)
+        # Resolve actor alias; the API spells "user/actor" as "user~actor"
+        resolved_actor = APIFY_ACTORS.get(actor_id, actor_id).replace("/", "~")
+
+        params: Dict[str, Any] = {"waitForFinish": 0}
+        if self.webhook_url:
+            params["webhooks"] = webhooks_param(self._callback_url())
 
         # Start the run
         response = await self.client.post(
             f"/acts/{resolved_actor}/runs",
             json=input_data,
-            params={"waitForFinish": max_wait_secs if wait_for_finish else 0},
+            params=params,
         )
         response.raise_for_status()
         run_data = response.json().get("data", {})
 
-        return {
+        result = {
             "run_id": run_data.get("id"),
             "status": run_data.get("status"),
             "dataset_id": run_data.get("defaultDatasetId"),
@@ -168,12 +222,25 @@ class ApifyConnector(BaseConnector):
             "finished_at": run_data.get("finishedAt"),
         }
 
+        if wait_for_finish and result["status"] not in TERMINAL_STATUSES:
+            final = await self.wait_for_run(result["run_id"], max_wait_secs)
+            result["status"] = final["status"]
+            result["finished_at"] = final["finished_at"]
+
+        return result
+
+    def _callback_url(self) -> str:
+        sep = "&" if "?" in self.webhook_url else "?"
+        return f"{self.webhook_url}{sep}token={self.webhook_secret}"
+
     async def get_run_status(self, run_id: str) -> Dict[str, Any]:
         """Get status of a running actor"""
         response = await self.client.get(f"/actor-runs/{run_id}")
         response.raise_for_status()
-        data = response.json().get("data", {})
+        return self._run_status(response.json().get("data", {}))
 
+    @staticmethod
+    def _run_status(data: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "run_id": data.get("id"),
             "status": data.get("status"),
@@ -184,22 +251,44 @@ class ApifyConnector(BaseConnector):
         self,
         run_id: str,
         max_wait_secs: int = 300,
-        poll_interval: float = 5.0,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
     ) -> Dict[str, Any]:
-        """Wait for an actor run to complete"""
-        start_time = datetime.utcnow()
+        """
+        Wait for an actor run to complete.
+
+        With webhooks enabled the wait is event-driven: the callback resumes this
+        coroutine as soon as Apify reports the run finished. Status is still
+        polled, at exponentially growing intervals (with jitter), in case a
+        webhook is lost or the callback URL is unreachable.
+
+        A callback is only a wake-up: the status returned always comes from the
+        Apify API, so an unauthenticated or stale callback can't end the wait.
+        """
+        deadline = time.monotonic() + max_wait_secs
+        interval = poll_interval
+        listen = bool(self.webhook_url)
 
         while True:
             status = await self.get_run_status(run_id)
 
-            if status["status"] in ["SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"]:
+            if status["status"] in TERMINAL_STATUSES:
                 return status
 
-            elapsed = (datetime.utcnow() - start_time).total_seconds()
-            if elapsed >= max_wait_secs:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 return {"run_id": run_id, "status": "TIMEOUT", "finished_at": None}
 
-            await asyncio.sleep(poll_interval)
+            wait = min(interval * random.uniform(0.8, 1.2), remaining)
+            if listen:
+                if await run_hub.wait(run_id, wait) is not None:
+                    # Re-check with the API right away; if it still disagrees
+                    # the callback was bogus, so only polling counts from here
+                    listen = False
+                    continue
+            else:
+                await asyncio.sleep(wait)
+            interval = min(interval * 2, max_poll_interval)
 
     async def get_dataset_items(
         self,
@@ -207,7 +296,7 @@ class ApifyConnector(BaseConnector):
         limit: int = 1000,
         offset: int = 0,
     ) -> List[Dict[str, Any]]:
-        """Get items from a dataset"""
+        """Get one page of items from a dataset"""
         response = await self.client.get(
             f"/datasets/{dataset_id}/items",
             params={"limit": limit, "offset": offset},
@@ -215,6 +304,51 @@ class ApifyConnector(BaseConnector):
         response.raise_for_status()
         return response.json()
 
+    async def iter_dataset_items(
+        self,
+        dataset_id: str,
+        page_size: int = 1000,
+        stream: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every item of a dataset without loading it whole.
+
+        Pages through offset/limit (`page_size` items in memory at a time), or
+        with `stream=True` reads the dataset as NDJSON (`format=jsonl`) and yields
+        each item as its line arrives.
+        """
+        if stream:
+            async with self.client.stream(
+                "GET", f"/datasets/{dataset_id}/items", params={"format": "jsonl"}
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line.strip():
+                        yield json.loads(line)
+            return
+
+        offset = 0
+        while True:
+            page = await self.get_dataset_items(dataset_id, limit=page_size, offset=offset)
+            for item in page:
+                yield item
+            if len(page) < page_size:
+                return
+            offset += len(page)
+
+    async def iter_run_items(
+        self,
+        result: Dict[str, Any],
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        stream: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Items of a finished run, optionally transformed, one at a time"""
+        if result["status"] != "SUCCEEDED":
+            raise Exception(f"Actor failed: {result['status']}")
+
+        async for item in self.iter_dataset_items(result["dataset_id"], stream=stream):
+            yield transform(item) if transform else item
+
     # ─────────────────────────────────────────────────────────────
     # LinkedIn Scraping
     # ─────────────────────────────────────────────────────────────
@@ -247,42 +381,159 @@ class ApifyConnector(BaseConnector):
     async def scrape_linkedin_companies(
         self,
         linkedin_urls: List[str],
+        batch_size: int = LINKEDIN_BATCH_SIZE,
+        concurrency: int = LINKEDIN_BATCH_CONCURRENCY,
     ) -> List[Dict[str, Any]]:
-        """Scrape multiple LinkedIn company pages"""
-        result = await self.run_actor(
-            "linkedin_company",
-            {"startUrls": [{"url": url} for url in linkedin_urls]},
-        )
-
-        if result["status"] != "SUCCEEDED":
-            raise Exception(f"Actor failed: {result['status']}")
+        """
+        Scrape multiple LinkedIn company pages.
 
-        items = await self.get_dataset_items(result["dataset_id"])
-        return [self._transform_linkedin_company(item) for item in items]
+        Found companies are returned in input order; pages that could not be
+        scraped are left out (see iter_linkedin_companies for per-URL status).
+        """
+        return await self._collect_found(
+            self.iter_linkedin_companies(linkedin_urls, batch_size, concurrency),
+            linkedin_urls,
+        )
 
     async def scrape_linkedin_people(
         self,
         linkedin_urls: List[str],
+        batch_size: int = LINKEDIN_BATCH_SIZE,
+        concurrency: int = LINKEDIN_BATCH_CONCURRENCY,
     ) -> List[Dict[str, Any]]:
         """
         Scrape LinkedIn profile pages.
 
         Args:
             linkedin_urls: List of LinkedIn profile URLs
+            batch_size: Profile URLs per actor run
+            concurrency: Actor runs in flight at once
 
         Returns:
-            List of people data in standard format
+            List of people data in standard format, in input order
         """
-        result = await self.run_actor(
+        return await self._collect_found(
+            self.iter_linkedin_people(linkedin_urls, batch_size, concurrency),
+            linkedin_urls,
+        )
+
+    def iter_linkedin_companies(
+        self,
+        linkedin_urls: List[str],
+        batch_size: int = LINKEDIN_BATCH_SIZE,
+        concurrency: int = LINKEDIN_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape company pages in batched actor runs.
+
+        Yields:
+            {"input": url, "found": bool, "result": company|None, "error": str|None}
+        """
+        return self._iter_linkedin_batches(
+            "linkedin_company",
+            linkedin_urls,
+            self._transform_linkedin_company,
+            batch_size,
+            concurrency,
+        )
+
+    def iter_linkedin_people(
+        self,
+        linkedin_urls: List[str],
+        batch_size: int = LINKEDIN_BATCH_SIZE,
+        concurrency: int = LINKEDIN_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape profile pages in batched actor runs.
+
+        Yields:
+            {"input": url, "found": bool, "result": person|None, "error": str|None}
+        """
+        return self._iter_linkedin_batches(
             "linkedin_people",
-            {"startUrls": [{"url": url} for url in linkedin_urls]},
+            linkedin_urls,
+            lambda data, url: self._transform_linkedin_person(data),
+            batch_size,
+            concurrency,
         )
 
-        if result["status"] != "SUCCEEDED":
-            raise Exception(f"Actor failed: {result['status']}")
+    async def _iter_linkedin_batches(
+        self,
+        actor: str,
+        linkedin_urls: List[str],
+        transform: Callable[[Dict[str, Any], str], Dict[str, Any]],
+        batch_size: int,
+        concurrency: int,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        One actor run per `batch_size` distinct URLs, `concurrency` runs at once.
 
-        items = await self.get_dataset_items(result["dataset_id"])
-        return [self._transform_linkedin_person(item) for item in items]
+        Each run's items are mapped back to the URLs that produced them, so
+        every distinct input URL yields exactly one result line as soon as its
+        run finishes. A failed run reports its error on each of its URLs.
+        """
+        urls: Dict[str, str] = {}
+        for url in linkedin_urls:
+            key = linkedin_url_key(url)
+            if key:
+                urls.setdefault(key, url)
+
+        async def run_batch(batch: List[tuple]) -> Dict[str, Dict[str, Any]]:
+            result = await self.run_actor(
+                actor, {"startUrls": [{"url": url} for _, url in batch]}
+            )
+            return await self._match_items_to_urls(result, [key for key, _ in batch])
+
+        batches = chunked(list(urls.items()), max(1, batch_size))
+        async for batch, found, error in as_completed_bounded(batches, run_batch, concurrency):
+            for key, url in batch:
+                if error:
+                    yield batch_result(url, None, error)
+                    continue
+                item = found.get(key)
+                yield batch_result(url, transform(item, url) if item else None)
+
+    async def _match_items_to_urls(
+        self,
+        result: Dict[str, Any],
+        keys: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Map a run's dataset items back to the start URL keys they came from"""
+        wanted = set(keys)
+        found: Dict[str, Dict[str, Any]] = {}
+        unmatched = []
+
+        async for item in self.iter_run_items(result):
+            key = next(
+                (
+                    k
+                    for k in (linkedin_url_key(item.get(f)) for f in LINKEDIN_URL_FIELDS)
+                    if k in wanted and k not in found
+                ),
+                None,
+            )
+            if key:
+                found[key] = item
+            else:
+                unmatched.append(item)
+
+        # Items come back in crawl order, not start-URL order, so an unmatched
+        # item is only attributable when exactly one URL and one item are left;
+        # otherwise those URLs are reported as not found
+        missing = [key for key in keys if key not in found]
+        if len(unmatched) == 1 and len(missing) == 1:
+            found[missing[0]] = unmatched[0]
+
+        return found
+
+    @staticmethod
+    async def _collect_found(
+        results: AsyncIterator[Dict[str, Any]],
+        inputs: List[str],
+    ) -> List[Dict[str, Any]]:
+        """Found results of a batch iterator, back in input order"""
+        found = {line["input"]: line["result"] async for line in results if line["found"]}
+        return [found[url] for url in dict.fromkeys(inputs) if url in found]
 
     async def scrape_company_employees(
         self,
@@ -312,11 +563,9 @@ class ApifyConnector(BaseConnector):
             },
         )
 
-        if result["status"] != "SUCCEEDED":
-            raise Exception(f"Actor failed: {result['status']}")
-
-        items = await self.get_dataset_items(result["dataset_id"])
-        return [self._transform_linkedin_person(item) for item in items]
+        return [
+            item async for item in self.iter_run_items(result, self._transform_linkedin_person)
+        ]
 
     # ─────────────────────────────────────────────────────────────
     # Website Scraping
@@ -337,17 +586,12 @@ class ApifyConnector(BaseConnector):
             {"startUrls": [{"url": url}], "maxDepth": 2},
         )
 
-        if result["status"] != "SUCCEEDED":
-            raise Exception(f"Actor failed: {result['status']}")
-
-        items = await self.get_dataset_items(result["dataset_id"])
-
-        # Aggregate contacts from all pages
+        # Aggregate contacts from all pages as they are read
         emails = set()
         phones = set()
         social: Dict[str, str] = {}
 
-        for item in items:
+        async for item in self.iter_run_items(result):
             emails.update(item.get("emails", []))
             phones.update(item.get("phones", []))
             for platform, link in item.get("socialLinks", {}).items():
@@ -378,6 +622,21 @@ class ApifyConnector(BaseConnector):
         Returns:
             List of business data
         """
+        return [item async for item in self.iter_google_maps(query, location, limit)]
+
+    async def iter_google_maps(
+        self,
+        query: str,
+        location: str = "Netherlands",
+        limit: int = 20,
+        stream: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Like scrape_google_maps, but yields each business as it is read.
+
+        Large crawls (thousands of places) can be written downstream without
+        holding the dataset in memory.
+        """
         result = await self.run_actor(
             "google_maps",
             {
@@ -387,11 +646,10 @@ class ApifyConnector(BaseConnector):
             },
         )
 
-        if result["status"] != "SUCCEEDED":
-            raise Exception(f"Actor failed: {result['status']}")
-
-        items = await self.get_dataset_items(result["dataset_id"])
-        return [self._transform_google_maps_result(item) for item in items]
+        async for item in self.iter_run_items(
+            result, self._transform_google_maps_result, stream=stream
+        ):
+            yield item
 
     # ─────────────────────────────────────────────────────────────
     # Transform Methods
@@ -0,0 +1,169 @@
+# src/atlas/connectors/apify/fake_server.py
+"""
+Local fake of the Apify API surface used by ApifyConnector.
+
+Runs finish after FAKE_APIFY_RUN_SECS (default 1s), fire any ad-hoc webhooks
+they were started with, and fill their dataset with synthetic items derived
+from the input (one item per start URL, or `maxCrawledPlaces` places). Dataset items are
+served as a JSON array or, with `format=jsonl`, streamed one item per line.
+
+Usage:
+  python -m atlas.connectors.apify.fake_server --port 8765
+  APIFY_BASE_URL=http://localhost:8765/v2 \
+  APIFY_WEBHOOK_URL=http://localhost:8000/api/connectors/apify/webhook  # optional
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+app = FastAPI(title="Fake Apify API")
+
+RUN_SECS = float(os.getenv("FAKE_APIFY_RUN_SECS", "1.0"))
+
+_runs: Dict[str, Dict[str, Any]] = {}
+_datasets: Dict[str, List[Dict[str, Any]]] = {}
+_done: Dict[str, asyncio.Event] = {}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _fake_items(actor: str, input_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    urls = [u.get("url") for u in input_data.get("startUrls", []) if u.get("url")]
+    if "profile" in actor or "employees" in actor:
+        return [
+            {
+                "profileId": f"p{i}",
+                "fullName": f"Fake Person {i}",
+                "headline": "Engineer",
+                "profileUrl": url,
+            }
+            for i, url in enumerate(urls or input_data.get("companyUrls", []))
+        ]
+    if urls:
+        return [
+            {
+                "companyId": f"c{i}",
+                "name": f"Fake Company {i}",
+                "url": url,
+                "website": f"https://company{i}.example",
+            }
+            for i, url in enumerate(urls)
+        ]
+    count = int(input_data.get("maxCrawledPlaces") or input_data.get("maxItems") or 10)
+    return [
+        {"placeId": f"place{i}", "title": f"Fake Place {i}", "website": f"https://place{i}.example"}
+        for i in range(count)
+    ]
+
+
+async def _fire_webhooks(run: Dict[str, Any], webhooks: List[Dict[str, Any]]) -> None:
+    event = "ACTOR.RUN." + run["status"].replace("-", "_")
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        for hook in webhooks:
+            if event not in hook.get("eventTypes", []):
+                continue
+            payload = {
+                "eventType": event,
+                "eventData": {"actorId": run["actId"], "actorRunId": run["id"]},
+                "resource": run,
+            }
+            try:
+                await client.post(hook["requestUrl"], json=payload)
+            except httpx.HTTPError:
+                pass
+
+
+async def _finish(run_id: str, webhooks: List[Dict[str, Any]]) -> None:
+    await asyncio.sleep(RUN_SECS)
+    run = _runs[run_id]
+    run["status"] = "SUCCEEDED"
+    run["finishedAt"] = _now()
+    _done[run_id].set()
+    await _fire_webhooks(run, webhooks)
+
+
+@app.post("/v2/acts/{actor}/runs")
+async def start_run(
+    actor: str,
+    request: Request,
+    waitForFinish: int = 0,
+    webhooks: Optional[str] = None,
+):
+    input_data = await request.json()
+    run_id = uuid.uuid4().hex[:17]
+    dataset_id = uuid.uuid4().hex[:17]
+    _datasets[dataset_id] = _fake_items(actor, input_data)
+    _runs[run_id] = {
+        "id": run_id,
+        "actId": actor,
+        "status": "RUNNING",
+        "defaultDatasetId": dataset_id,
+        "defaultKeyValueStoreId": uuid.uuid4().hex[:17],
+        "startedAt": _now(),
+        "finishedAt": None,
+    }
+    _done[run_id] = asyncio.Event()
+    hooks = json.loads(base64.b64decode(webhooks)) if webhooks else []
+    asyncio.create_task(_finish(run_id, hooks))
+
+    if waitForFinish:
+        try:
+            await asyncio.wait_for(_done[run_id].wait(), min(waitForFinish, 60))
+        except asyncio.TimeoutError:
+            pass
+    return {"data": _runs[run_id]}
+
+
+@app.get("/v2/actor-runs/{run_id}")
+async def get_run(run_id: str):
+    if run_id not in _runs:
+        raise HTTPException(404, "run not found")
+    return {"data": _runs[run_id]}
+
+
+@app.get("/v2/datasets/{dataset_id}/items")
+async def get_items(
+    dataset_id: str,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    format: str = "json",
+):
+    if dataset_id not in _datasets:
+        raise HTTPException(404, "dataset not found")
+    items = _datasets[dataset_id]
+    items = items[offset : offset + limit] if limit is not None else items[offset:]
+    if format == "jsonl":
+        lines = (json.dumps(item) + "\n" for item in items)
+        return StreamingResponse(lines, media_type="application/jsonl")
+    return items
+
+
+@app.get("/v2/users/me")
+async def me():
+    return {"data": {"username": "fake", "limits": {"computeUnits": {"available": 100}}}}
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Fake Apify API for local testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
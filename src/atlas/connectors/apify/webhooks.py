@@ -0,0 +1,121 @@
+# src/atlas/connectors/apify/webhooks.py
+"""
+Actor run completion via Apify webhooks.
+
+When ApifyConnector has a `webhook_url`, each run is started with an ad-hoc
+webhook pointing at POST /api/connectors/apify/webhook. That endpoint calls
+`run_hub.notify`, which resumes every coroutine waiting on the run, whichever
+event loop it lives on. Runs that finish before anyone waits are remembered for
+a while, so a fast run never has to wait for the polling fallback.
+
+A notification only wakes the waiters; ApifyConnector.wait_for_run confirms
+the run's status with the API before returning it. Webhooks need both
+APIFY_WEBHOOK_URL and APIFY_WEBHOOK_SECRET: the callback URL carries the secret
+as `token`, and the endpoint refuses calls without it.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+TERMINAL_STATUSES = {"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"}
+
+RUN_EVENT_TYPES = [
+    "ACTOR.RUN.SUCCEEDED",
+    "ACTOR.RUN.FAILED",
+    "ACTOR.RUN.ABORTED",
+    "ACTOR.RUN.TIMED_OUT",
+]
+
+
+def webhook_config() -> Tuple[Optional[str], Optional[str]]:
+    """
+    (APIFY_WEBHOOK_URL, APIFY_WEBHOOK_SECRET) from the environment.
+
+    Raises:
+        RuntimeError: if a webhook URL is set without a secret (the callback
+            endpoint would accept unauthenticated calls)
+    """
+    url = os.getenv("APIFY_WEBHOOK_URL") or None
+    secret = os.getenv("APIFY_WEBHOOK_SECRET") or None
+    if url and not secret:
+        raise RuntimeError("APIFY_WEBHOOK_URL is set but APIFY_WEBHOOK_SECRET is not")
+    return url, secret
+
+
+def webhooks_param(request_url: str) -> str:
+    """Value for the `webhooks` query parameter of a run (base64 JSON)"""
+    spec = [{"eventTypes": RUN_EVENT_TYPES, "requestUrl": request_url}]
+    return base64.b64encode(json.dumps(spec).encode("utf-8")).decode("ascii")
+
+
+def run_from_payload(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The run object from Apify's default webhook payload"""
+    run = payload.get("resource") or {}
+    if not run.get("id"):
+        run_id = (payload.get("eventData") or {}).get("actorRunId")
+        if not run_id:
+            return None
+        run = {**run, "id": run_id}
+    return run
+
+
+class RunCompletionHub:
+    """Hands finished runs (from webhooks) to the coroutines awaiting them."""
+
+    def __init__(self, keep_secs: float = 600.0, max_finished: int = 10_000):
+        self.keep_secs = keep_secs
+        self.max_finished = max_finished
+        self._waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        self._finished: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def notify(self, run: Dict[str, Any]) -> int:
+        """Record a finished run and wake its waiters; returns how many were woken"""
+        run_id = run["id"]
+        now = time.monotonic()
+        with self._lock:
+            self._finished[run_id] = (now, run)
+            for stale in [k for k, (t, _) in self._finished.items() if now - t > self.keep_secs]:
+                del self._finished[stale]
+            while len(self._finished) > self.max_finished:
+                del self._finished[next(iter(self._finished))]
+            waiters = self._waiters.pop(run_id, [])
+
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future, run)
+        return len(waiters)
+
+    async def wait(self, run_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """The finished run, or None if no webhook arrived within `timeout`"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        entry = (loop, future)
+        with self._lock:
+            if run_id in self._finished:
+                return self._finished[run_id][1]
+            self._waiters.setdefault(run_id, []).append(entry)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(run_id)
+                if waiters and entry in waiters:
+                    waiters.remove(entry)
+                    if not waiters:
+                        del self._waiters[run_id]
+
+
+def _resolve(future: asyncio.Future, run: Dict[str, Any]) -> None:
+    if not future.done():
+        future.set_result(run)
+
+
+run_hub = RunCompletionHub()
@@ -11,8 +11,9 @@ Apollo provides:
 API Docs: https://apolloio.github.io/apollo-api-docs/
 """
 
-import httpx
-from typing import Optional, List, Dict, Any
+import asyncio
+from collections import deque
+from typing import Optional, List, Dict, Any, AsyncIterator, Deque, Iterator
 
 from atlas.connectors.registry import (
     BaseConnector,
@@ -22,6 +23,13 @@ from atlas.connectors.registry import (
     ConnectorRegistry,
 )
 from atlas.ingestors.common.base import CompanyIngestor, CompanyPeopleFinder
+from atlas.connectors.utils.concurrency import (
+    as_completed_bounded,
+    batch_result,
+    chunked,
+    distinct_keys,
+)
+from atlas.connectors.utils.http import make_client
 from atlas.connectors.utils.rate_limiter import RateLimiter
 
 
@@ -43,6 +51,12 @@ APOLLO_CONFIG = ConnectorConfig(
     description="B2B company and contact database with 270M+ contacts",
 )
 
+# Apollo serves at most 500 pages per search
+APOLLO_MAX_PAGES = 500
+
+# Max records per bulk_enrich / bulk_match request
+APOLLO_BULK_SIZE = 10
+
 
 @ConnectorRegistry.register("apollo")
 class ApolloConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
@@ -62,7 +76,13 @@ class ApolloConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
             api_key: Apollo.io API key
         """
         self.api_key = api_key
-        self.client = httpx.AsyncClient(
+        self.rate_limiter = RateLimiter(
+            connector_id="apollo",
+            limit=self.config.rate_limit,
+            window=self.config.rate_limit_window,
+        )
+        self.client = make_client(
+            self.rate_limiter,
             base_url=self.config.base_url,
             headers={
                 "X-Api-Key": api_key,
@@ -70,11 +90,6 @@ class ApolloConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
             },
             timeout=30.0,
         )
-        self.rate_limiter = RateLimiter(
-            connector_id="apollo",
-            limit=self.config.rate_limit,
-            window=self.config.rate_limit_window,
-        )
 
     @property
     def source_prefix(self) -> str:
@@ -100,6 +115,7 @@ class ApolloConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
     async def close(self):
         """Close HTTP client"""
         await self.client.aclose()
+        await self.rate_limiter.close()
 
     # ─────────────────────────────────────────────────────────────
     # CompanyIngestor Implementation
@@ -116,7 +132,7 @@ class ApolloConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
 
         Args:
             query: Company name or keyword
-            limit: Maximum results (max 100 per page)
+            limit: Maximum results (fetched across pages of up to 100)
             filters: Optional filters
                 - employee_ranges: ["1,10", "11,50", "51,200", "201,500", "501,1000", "1001,5000", "5001,10000", "10001+"]
                 - locations: ["Netherlands", "Germany", "Belgium"]
@@ -125,12 +141,79 @@ class ApolloConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
         Returns:
             List of company records in standard format
         """
-        await self.rate_limiter.wait_and_acquire()
+        return [company async for company in self.iter_search(query, limit, filters)]
+
+    async def iter_search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: int = 100,
+        prefetch: int = 3,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream search results page by page.
+
+        The first page tells us `pagination.total_pages`; after that up to
+        `prefetch` further pages are requested concurrently (each still takes a
+        rate limiter token) while the current page is being consumed. Companies
+        are yielded in result order as soon as their page arrives.
+
+        Args:
+            query: Company name or keyword
+            limit: Stop after this many companies (None = every page)
+            filters: Same filters as `search`
+            per_page: Page size (max 100)
+            prefetch: Max pages in flight ahead of the consumer
+
+        Yields:
+            Company records in standard format
+        """
+        per_page = max(1, min(per_page, 100, limit or 100))
+        payload = self._search_payload(query, per_page, filters)
+
+        first = await self._search_page(payload, 1)
+        total_pages = min(
+            (first.get("pagination") or {}).get("total_pages") or 1,
+            APOLLO_MAX_PAGES,
+        )
+        if limit:
+            total_pages = min(total_pages, -(-limit // per_page))
 
+        remaining = limit
+        pending: Deque["asyncio.Task[Dict[str, Any]]"] = deque()
+        next_page = 2
+        data = first
+        try:
+            while True:
+                # Keep the prefetch window full before handing out the current page
+                while next_page <= total_pages and len(pending) < max(1, prefetch):
+                    pending.append(asyncio.ensure_future(self._search_page(payload, next_page)))
+                    next_page += 1
+
+                for org in data.get("organizations", []):
+                    if remaining is not None:
+                        if remaining <= 0:
+                            return
+                        remaining -= 1
+                    yield self._transform_company(org)
+
+                if not pending:
+                    return
+                data = await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _search_payload(
+        self,
+        query: str,
+        per_page: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "q_organization_name": query,
-            "per_page": min(limit, 100),
-            "page": 1,
+            "per_page": per_page,
         }
 
         if filters:
@@ -141,15 +224,15 @@ class ApolloConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
             if "industries" in filters:
                 payload["organization_industry_tag_ids"] = filters["industries"]
 
-        response = await self.client.post("/mixed_companies/search", json=payload)
-        response.raise_for_status()
-        data = response.json()
+        return payload
 
-        companies = []
-        for org in data.get("organizations", []):
-            companies.append(self._transform_company(org))
-
-        return companies
+    async def _search_page(self, payload: Dict[str, Any], page: int) -> Dict[str, Any]:
+        await self.rate_limiter.wait_and_acquire()
+        response = await self.client.post(
+            "/mixed_companies/search", json={**payload, "page": page}
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def enrich_company(self, domain: str) -> Optional[Dict[str, Any]]:
         """
@@ -161,17 +244,91 @@ class ApolloConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
         Returns:
             Enriched company data or None if not found
         """
-        await self.rate_limiter.wait_and_acquire()
-
         payload = {"domain": domain}
-        response = await self.client.post("/organizations/enrich", json=payload)
 
-        if response.status_code == 404:
-            return None
+        async def fetch() -> Optional[Dict[str, Any]]:
+            await self.rate_limiter.wait_and_acquire()
+            response = await self.client.post("/organizations/enrich", json=payload)
+
+            if response.status_code == 404:
+                return None
+
+            response.raise_for_status()
+            org = response.json().get("organization")
+            return self._transform_company(org) if org else None
 
+        return await self.cached_call("organizations/enrich", payload, fetch)
+
+    async def enrich_companies(
+        self,
+        domains: List[str],
+        concurrency: int = 3,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Enrich many companies by domain.
+
+        Cached domains are answered first; the rest go to
+        /organizations/bulk_enrich in batches of 10, up to `concurrency` batches
+        in flight. Each distinct domain yields one result as soon as its batch
+        completes.
+
+        Yields:
+            {"input": domain, "found": bool, "result": company|None, "error": str|None}
+        """
+        misses = []
+        for domain in distinct_keys(domains):
+            hit = await self.cache.aget(
+                self.source_prefix, "organizations/enrich", {"domain": domain}
+            )
+            if self.cache.is_hit(hit):
+                yield batch_result(domain, hit)
+            else:
+                misses.append(domain)
+
+        batches = chunked(misses, APOLLO_BULK_SIZE)
+        async for batch, companies, error in as_completed_bounded(
+            batches, self._bulk_enrich_companies, concurrency
+        ):
+            for domain, company in zip(batch, companies or [None] * len(batch)):
+                if error:
+                    yield batch_result(domain, None, error)
+                    continue
+                yield batch_result(domain, company)
+
+    async def _bulk_enrich_companies(self, domains: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Company (or None) per domain, in input order; answers are cached"""
+        await self.rate_limiter.wait_and_acquire()
+        response = await self.client.post(
+            "/organizations/bulk_enrich", json={"domains": domains}
+        )
         response.raise_for_status()
-        org = response.json().get("organization")
-        return self._transform_company(org) if org else None
+        orgs = response.json().get("organizations") or []
+
+        if len(orgs) == len(domains):
+            # organizations are positional; unmatched entries come back as null,
+            # which is as definite as a 404 from the single endpoint
+            companies = [self._transform_company(org) if org else None for org in orgs]
+            confirmed = [True] * len(domains)
+        else:
+            # Unexpected shape: positions can't be trusted. Match on primary
+            # domain and don't record the rest as "not found"
+            by_domain = {
+                org["primary_domain"].lower(): org
+                for org in orgs
+                if org and org.get("primary_domain")
+            }
+            companies = [
+                self._transform_company(by_domain[d]) if d in by_domain else None
+                for d in domains
+            ]
+            confirmed = [d in by_domain for d in domains]
+
+        for domain, company, ok in zip(domains, companies, confirmed):
+            if ok:
+                await self.cache.aset(
+                    self.source_prefix, "organizations/enrich", {"domain": domain}, company
+                )
+        return companies
 
     def _transform_company(self, org: Dict[str, Any]) -> Dict[str, Any]:
         """Transform Apollo organization to standard format"""
@@ -274,17 +431,65 @@ class ApolloConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
         Returns:
             Enriched person data or None if not found
         """
-        await self.rate_limiter.wait_and_acquire()
-
         payload = {"email": email}
-        response = await self.client.post("/people/enrich", json=payload)
 
-        if response.status_code == 404:
-            return None
+        async def fetch() -> Optional[Dict[str, Any]]:
+            await self.rate_limiter.wait_and_acquire()
+            response = await self.client.post("/people/enrich", json=payload)
+
+            if response.status_code == 404:
+                return None
+
+            response.raise_for_status()
+            person = response.json().get("person")
+            return self._transform_person(person) if person else None
+
+        return await self.cached_call("people/enrich", payload, fetch)
+
+    async def enrich_people(
+        self,
+        emails: List[str],
+        concurrency: int = 3,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Enrich many people by email via /people/bulk_match.
 
+        Works like `enrich_companies`: cached emails first, then batches of 10
+        with up to `concurrency` in flight.
+
+        Yields:
+            {"input": email, "found": bool, "result": person|None, "error": str|None}
+        """
+        misses = []
+        for email in distinct_keys(emails):
+            hit = await self.cache.aget(self.source_prefix, "people/enrich", {"email": email})
+            if self.cache.is_hit(hit):
+                yield batch_result(email, hit)
+            else:
+                misses.append(email)
+
+        batches = chunked(misses, APOLLO_BULK_SIZE)
+        async for batch, matches, error in as_completed_bounded(
+            batches, self._bulk_match_people, concurrency
+        ):
+            for email, person in zip(batch, matches or [None] * len(batch)):
+                if error:
+                    yield batch_result(email, None, error)
+                    continue
+                await self.cache.aset(self.source_prefix, "people/enrich", {"email": email}, person)
+                yield batch_result(email, person)
+
+    async def _bulk_match_people(self, emails: List[str]) -> List[Optional[Dict[str, Any]]]:
+        await self.rate_limiter.wait_and_acquire()
+        response = await self.client.post(
+            "/people/bulk_match", json={"details": [{"email": e} for e in emails]}
+        )
         response.raise_for_status()
-        person = response.json().get("person")
-        return self._transform_person(person) if person else None
+
+        # matches are positional; unmatched entries come back as null
+        matches = response.json().get("matches") or []
+        matches = matches + [None] * (len(emails) - len(matches))
+        return [self._transform_person(p) if p else None for p in matches[: len(emails)]]
 
     async def search_people(
         self,
@@ -374,12 +579,13 @@ class ApolloConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
 
     def search_sync(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Synchronous search wrapper for CompanyIngestor interface"""
-        import asyncio
-        return asyncio.get_event_loop().run_until_complete(self.search(query, limit))
+        return self.run_sync(self.search(query, limit))
+
+    def iter_search_sync(self, query: str, limit: int = 20) -> Iterator[Dict[str, Any]]:
+        """Synchronous streaming search; companies arrive while later pages load"""
+        return self.iter_sync(self.iter_search(query, limit))
 
     def find_by_company_domain_sync(self, domain: str) -> List[Dict[str, Any]]:
         """Synchronous people finder wrapper"""
-        import asyncio
-        return asyncio.get_event_loop().run_until_complete(
-            self.find_by_company_domain(domain)
-        )
+        return self.run_sync(self.find_by_company_domain(domain))
+
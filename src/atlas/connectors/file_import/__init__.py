@@ -1,4 +1,17 @@
 # File Import Connector (CSV, Excel)
 from atlas.connectors.file_import.connector import FileImportConnector, FILE_IMPORT_CONFIG
+from atlas.connectors.file_import.jobs import (
+    IMPORT_JOBS,
+    ImportJob,
+    run_import_job,
+    spool_upload,
+)
 
-__all__ = ["FileImportConnector", "FILE_IMPORT_CONFIG"]
+__all__ = [
+    "FileImportConnector",
+    "FILE_IMPORT_CONFIG",
+    "IMPORT_JOBS",
+    "ImportJob",
+    "run_import_job",
+    "spool_upload",
+]
@@ -13,7 +13,10 @@ No external API - processes local files.
 """
 
 import io
-from typing import Optional, List, Dict, Any
+import os
+from contextlib import contextmanager
+from itertools import islice
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
 from datetime import datetime
 
 from atlas.connectors.registry import (
@@ -24,6 +27,7 @@ from atlas.connectors.registry import (
     ConnectorRegistry,
 )
 from atlas.connectors.utils.transforms import FieldTransformer
+from atlas.etl.common.entity_resolution import EntityResolver, deduplicate
 
 # Try to import pandas, provide fallback message if not available
 try:
@@ -32,6 +36,12 @@ try:
 except ImportError:
     PANDAS_AVAILABLE = False
 
+try:
+    import openpyxl
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
 
 FILE_IMPORT_CONFIG = ConnectorConfig(
     id="file_import",
@@ -51,6 +61,15 @@ FILE_IMPORT_CONFIG = ConnectorConfig(
     description="Import companies and contacts from CSV or Excel files",
 )
 
+# Rows per chunk when importing; bounds memory regardless of file size
+IMPORT_CHUNK_SIZE = 50_000
+
+# Raw upload bytes, or a path to the (spooled) file
+FileSource = Union[bytes, str, "os.PathLike[str]"]
+
+# Sheet row counts by (file identity, sheet), so preview and import don't re-scan
+_XLSX_ROW_COUNTS: Dict[tuple, int] = {}
+
 
 @ConnectorRegistry.register("file_import")
 class FileImportConnector(BaseConnector):
@@ -92,7 +111,7 @@ class FileImportConnector(BaseConnector):
 
     async def preview_file(
         self,
-        file_content: bytes,
+        file_content: FileSource,
         file_type: str,
         rows: int = 5,
         sheet_name: Optional[str] = None,
@@ -101,7 +120,7 @@ class FileImportConnector(BaseConnector):
         Preview file contents for mapping UI.
 
         Args:
-            file_content: Raw file bytes
+            file_content: Raw file bytes or path to the file
             file_type: "csv", "xlsx", or "xls"
             rows: Number of sample rows to return
             sheet_name: Sheet name for Excel files
@@ -113,33 +132,53 @@ class FileImportConnector(BaseConnector):
 
         # Get sheets list for Excel files
         sheets = []
-        if file_type in ["xlsx", "xls"]:
-            excel = pd.ExcelFile(io.BytesIO(file_content))
+        if file_type == "xlsx":
+            with self._xlsx_sheet(file_content, sheet_name) as (workbook, _):
+                sheets = workbook.sheetnames
+        elif file_type == "xls":
+            excel = pd.ExcelFile(self._open(file_content))
             sheets = excel.sheet_names
 
         return {
             "columns": list(df.columns),
             "sample_data": df.to_dict(orient="records"),
             "row_count": len(df),
-            "total_rows": self._count_rows(file_content, file_type),
+            "total_rows": self.count_rows(file_content, file_type, sheet_name),
             "sheets": sheets,
             "detected_mappings": self._auto_detect_mappings(list(df.columns)),
         }
 
+    @staticmethod
+    def _open(file_content: FileSource) -> Any:
+        """Something pandas can read: a path as-is, bytes wrapped in a buffer"""
+        if isinstance(file_content, (bytes, bytearray)):
+            return io.BytesIO(file_content)
+        return file_content
+
     def _read_file(
         self,
-        file_content: bytes,
+        file_content: FileSource,
         file_type: str,
         nrows: Optional[int] = None,
         skip_rows: int = 0,
         sheet_name: Optional[str] = None,
     ) -> "pd.DataFrame":
         """Read file into DataFrame"""
-        buffer = io.BytesIO(file_content)
+        buffer = self._open(file_content)
 
         if file_type == "csv":
             return pd.read_csv(buffer, skiprows=skip_rows, nrows=nrows)
-        elif file_type in ["xlsx", "xls"]:
+        elif file_type == "xlsx":
+            rows = self._iter_xlsx_rows(file_content, sheet_name, skip_rows)
+            try:
+                header = next(rows, None)
+                if header is None:
+                    return pd.DataFrame()
+                data = list(rows) if nrows is None else list(islice(rows, nrows))
+            finally:
+                rows.close()
+            return pd.DataFrame(data, columns=header)
+        elif file_type == "xls":
             return pd.read_excel(
                 buffer,
                 skiprows=skip_rows,
@@ -149,14 +188,173 @@ class FileImportConnector(BaseConnector):
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
 
-    def _count_rows(self, file_content: bytes, file_type: str) -> int:
-        """Count total rows in file"""
+    def iter_chunks(
+        self,
+        file_content: FileSource,
+        file_type: str,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        skip_rows: int = 0,
+        sheet_name: Optional[str] = None,
+    ) -> Iterator["pd.DataFrame"]:
+        """
+        Read a file as DataFrames of at most `chunk_size` rows, all cells as str.
+
+        CSV and xlsx are read incrementally (xlsx through openpyxl's read-only
+        mode), so only one chunk is in memory at a time; legacy xls is parsed
+        whole. The index counts data rows across chunks (0, 1, ... like a full read).
+        """
+        if file_type == "csv":
+            yield from pd.read_csv(
+                self._open(file_content),
+                skiprows=skip_rows,
+                dtype=str,
+                chunksize=chunk_size,
+            )
+        elif file_type == "xlsx":
+            rows = self._iter_xlsx_rows(file_content, sheet_name, skip_rows)
+            header = next(rows, None)
+            if header is None:
+                return
+            start = 0
+            while True:
+                batch = [
+                    [None if value is None else str(value) for value in row]
+                    for row in islice(rows, chunk_size)
+                ]
+                if not batch:
+                    break
+                index = pd.RangeIndex(start, start + len(batch))
+                yield pd.DataFrame(batch, columns=header, index=index, dtype=object)
+                start += len(batch)
+        elif file_type == "xls":
+            df = pd.read_excel(
+                self._open(file_content),
+                skiprows=skip_rows,
+                sheet_name=sheet_name or 0,
+                dtype=str,
+            )
+            for start in range(0, len(df), chunk_size):
+                yield df.iloc[start : start + chunk_size]
+        else:
+            raise ValueError(f"Unsupported file type: {file_type}")
+
+    def count_rows(
+        self,
+        file_content: FileSource,
+        file_type: str,
+        sheet_name: Optional[str] = None,
+    ) -> int:
+        """
+        Count data rows in file.
+
+        For CSV this counts line breaks without parsing (fast, constant memory),
+        so quoted values spanning lines make it an upper bound. For xlsx it is
+        the sheet's stored dimension (cached per file and sheet), which also
+        counts blank rows some spreadsheet tools leave at the end.
+        """
         try:
-            df = self._read_file(file_content, file_type)
-            return len(df)
+            if file_type == "xlsx":
+                return self._xlsx_row_count(file_content, sheet_name)
+            if file_type != "csv":
+                return len(self._read_file(file_content, file_type, sheet_name=sheet_name))
+
+            if isinstance(file_content, (bytes, bytearray)):
+                lines = file_content.count(b"\n")
+                ends_with_newline = file_content.endswith(b"\n")
+            else:
+                lines, last = 0, b""
+                with open(file_content, "rb") as f:
+                    for block in iter(lambda: f.read(1 << 20), b""):
+                        lines += block.count(b"\n")
+                        last = block
+                ends_with_newline = last.endswith(b"\n")
+            if not ends_with_newline:
+                lines += 1  # last line has no terminator
+            return max(0, lines - 1)  # header
         except Exception:
             return 0
 
+    # ─────────────────────────────────────────────────────────────
+    # Excel (xlsx) streaming
+    # ─────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def _xlsx_sheet(self, file_content: FileSource, sheet_name: Optional[str] = None):
+        """(workbook, worksheet) opened read-only; rows are parsed lazily on iteration"""
+        if not OPENPYXL_AVAILABLE:
+            raise ImportError("openpyxl is required for Excel import. Install with: pip install openpyxl")
+
+        workbook = openpyxl.load_workbook(self._open(file_content), read_only=True, data_only=True)
+        try:
+            worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            yield workbook, worksheet
+        finally:
+            workbook.close()
+
+    def _iter_xlsx_rows(
+        self,
+        file_content: FileSource,
+        sheet_name: Optional[str] = None,
+        skip_rows: int = 0,
+    ) -> Iterator[List[Any]]:
+        """
+        Header row, then data rows padded or cut to the header's width.
+
+        Fully blank rows are skipped, as pandas does for CSV.
+        """
+        with self._xlsx_sheet(file_content, sheet_name) as (_, worksheet):
+            header = None
+            for row in worksheet.iter_rows(min_row=skip_rows + 1, values_only=True):
+                if all(value is None or value == "" for value in row):
+                    continue
+                if header is None:
+                    header = self._column_names(row)
+                    yield header
+                    continue
+                row = list(row[: len(header)])
+                row.extend([None] * (len(header) - len(row)))
+                yield row
+
+    @staticmethod
+    def _column_names(row: tuple) -> List[str]:
+        """Header cells as column names, pandas-style ("Unnamed: 3", "email.1")"""
+        cells = list(row)
+        # Trailing empty header cells are formatting, not columns
+        while cells and cells[-1] in (None, ""):
+            cells.pop()
+
+        names = []
+        seen: Dict[str, int] = {}
+        for i, value in enumerate(cells):
+            name = f"Unnamed: {i}" if value is None or value == "" else str(value)
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            names.append(name)
+        return names
+
+    def _xlsx_row_count(self, file_content: FileSource, sheet_name: Optional[str] = None) -> int:
+        """Data rows from the sheet dimension, cached per file and sheet"""
+        if isinstance(file_content, (bytes, bytearray)):
+            key = ("bytes", len(file_content), hash(bytes(file_content)), sheet_name)
+        else:
+            stat = os.stat(file_content)
+            key = (os.fspath(file_content), stat.st_size, stat.st_mtime_ns, sheet_name)
+
+        if key not in _XLSX_ROW_COUNTS:
+            with self._xlsx_sheet(file_content, sheet_name) as (_, worksheet):
+                max_row = worksheet.max_row
+                if max_row is None:
+                    # No stored dimension: count by streaming the rows once
+                    max_row = sum(1 for _ in worksheet.iter_rows(values_only=True))
+            if len(_XLSX_ROW_COUNTS) >= 256:
+                _XLSX_ROW_COUNTS.pop(next(iter(_XLSX_ROW_COUNTS)))
+            _XLSX_ROW_COUNTS[key] = max(0, max_row - 1)  # header
+
+        return _XLSX_ROW_COUNTS[key]
+
     def _auto_detect_mappings(self, columns: List[str]) -> Dict[str, str]:
         """Auto-detect column mappings based on common names"""
         mappings = {}
@@ -196,23 +394,26 @@ class FileImportConnector(BaseConnector):
 
     async def import_companies(
         self,
-        file_content: bytes,
+        file_content: FileSource,
         file_type: str,
         column_mapping: Dict[str, str],  # {"source_col": "target_field"}
         skip_rows: int = 0,
         sheet_name: Optional[str] = None,
         batch_id: Optional[str] = None,
+        dedupe: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Import companies from file.
 
         Args:
-            file_content: Raw file bytes
+            file_content: Raw file bytes or path to the file
             file_type: "csv", "xlsx", or "xls"
             column_mapping: Mapping from source columns to target fields
             skip_rows: Number of header rows to skip
             sheet_name: Sheet name for Excel files
             batch_id: Optional batch ID for tracking
+            dedupe: Merge rows describing the same company (same domain or
+                fuzzy-matching name); merged rows list their ids in "_merged_ids"
 
         Required mapping targets:
             - name (required)
@@ -221,64 +422,59 @@ class FileImportConnector(BaseConnector):
         Returns:
             List of company records in standard format
         """
-        # Validate required mappings
-        if "name" not in column_mapping.values():
-            raise ValueError("Column mapping must include 'name' field")
+        companies: List[Dict[str, Any]] = []
+        for chunk in self.iter_companies(
+            file_content, file_type, column_mapping, skip_rows, sheet_name, batch_id
+        ):
+            companies.extend(chunk)
 
-        df = self._read_file(file_content, file_type, skip_rows=skip_rows, sheet_name=sheet_name)
+        if dedupe:
+            companies = deduplicate(companies, EntityResolver(name_key="name"))
 
-        # Generate batch ID if not provided
-        if not batch_id:
-            self._batch_counter += 1
-            batch_id = f"import_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{self._batch_counter}"
+        return companies
 
-        # Reverse mapping for lookup
-        reverse_map = {v: k for k, v in column_mapping.items()}
+    def iter_companies(
+        self,
+        file_content: FileSource,
+        file_type: str,
+        column_mapping: Dict[str, str],
+        skip_rows: int = 0,
+        sheet_name: Optional[str] = None,
+        batch_id: Optional[str] = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Like import_companies, but yields company records one chunk at a time.
 
-        companies = []
-        for idx, row in df.iterrows():
-            company = {
-                "id": self.make_id(f"{batch_id}:{idx}"),
-                "_batch_id": batch_id,
-                "_source": "import",
-                "_imported_at": datetime.utcnow().isoformat(),
-            }
+        Each chunk is cleaned with vectorized pandas string operations, so memory
+        stays bounded by `chunk_size` rows however large the file is.
+        """
+        self.check_mapping(column_mapping, "company")
+        batch_id = batch_id or self._new_batch_id()
 
-            for target_field, source_col in reverse_map.items():
-                if source_col in row.index:
-                    value = row[source_col]
-                    # Handle NaN
-                    if pd.isna(value):
-                        company[target_field] = None
-                    else:
-                        company[target_field] = str(value).strip()
-
-            # Clean and normalize domain
-            if company.get("domain"):
-                company["domain"] = FieldTransformer.transform(
-                    company["domain"], "clean_domain", {}
-                )
-            elif company.get("website"):
-                # Extract domain from website if not provided
-                company["domain"] = FieldTransformer.transform(
-                    company["website"], "clean_domain", {}
-                )
+        for chunk in self.iter_chunks(file_content, file_type, chunk_size, skip_rows, sheet_name):
+            df = self._mapped_frame(chunk, column_mapping)
+
+            # Clean and normalize domain (extract it from website if not provided)
+            if "domain" in df or "website" in df:
+                domain = df["domain"] if "domain" in df else None
+                if "website" in df:
+                    domain = df["website"] if domain is None else domain.fillna(df["website"])
+                df["domain"] = FieldTransformer.transform_series(domain, "clean_domain")
 
             # Clean phone
-            if company.get("phone"):
-                company["phone"] = FieldTransformer.transform(
-                    company["phone"], "clean_phone", {"keep_format": True}
+            if "phone" in df:
+                df["phone"] = FieldTransformer.transform_series(
+                    df["phone"], "clean_phone", {"keep_format": True}
                 )
 
             # Parse employee count
-            if company.get("employee_count"):
-                company["employee_count"] = FieldTransformer.transform(
-                    company["employee_count"], "to_int", {}
+            if "employee_count" in df:
+                df["employee_count"] = FieldTransformer.transform_series(
+                    df["employee_count"], "to_int"
                 )
 
-            companies.append(company)
-
-        return companies
+            yield self._to_records(df, chunk.index, batch_id)
 
     # ─────────────────────────────────────────────────────────────
     # Contact Import
@@ -286,7 +482,7 @@ class FileImportConnector(BaseConnector):
 
     async def import_contacts(
         self,
-        file_content: bytes,
+        file_content: FileSource,
         file_type: str,
         column_mapping: Dict[str, str],
         skip_rows: int = 0,
@@ -297,7 +493,7 @@ class FileImportConnector(BaseConnector):
         Import contacts from file.
 
         Args:
-            file_content: Raw file bytes
+            file_content: Raw file bytes or path to the file
             file_type: "csv", "xlsx", or "xls"
             column_mapping: Mapping from source columns to target fields
             skip_rows: Number of header rows to skip
@@ -313,76 +509,125 @@ class FileImportConnector(BaseConnector):
         Returns:
             List of contact records in standard format
         """
-        has_full_name = "full_name" in column_mapping.values()
-        has_first_last = "first_name" in column_mapping.values() and "last_name" in column_mapping.values()
-
-        if not has_full_name and not has_first_last:
-            raise ValueError(
-                "Column mapping must include 'full_name' or both 'first_name' and 'last_name'"
-            )
-
-        df = self._read_file(file_content, file_type, skip_rows=skip_rows, sheet_name=sheet_name)
-
-        # Generate batch ID if not provided
-        if not batch_id:
-            self._batch_counter += 1
-            batch_id = f"import_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{self._batch_counter}"
-
-        reverse_map = {v: k for k, v in column_mapping.items()}
-
-        contacts = []
-        for idx, row in df.iterrows():
-            contact = {
-                "id": self.make_id(f"{batch_id}:{idx}"),
-                "_batch_id": batch_id,
-                "_source": "import",
-                "_imported_at": datetime.utcnow().isoformat(),
-            }
+        contacts: List[Dict[str, Any]] = []
+        for chunk in self.iter_contacts(
+            file_content, file_type, column_mapping, skip_rows, sheet_name, batch_id
+        ):
+            contacts.extend(chunk)
+        return contacts
 
-            for target_field, source_col in reverse_map.items():
-                if source_col in row.index:
-                    value = row[source_col]
-                    if pd.isna(value):
-                        contact[target_field] = None
-                    else:
-                        contact[target_field] = str(value).strip()
+    def iter_contacts(
+        self,
+        file_content: FileSource,
+        file_type: str,
+        column_mapping: Dict[str, str],
+        skip_rows: int = 0,
+        sheet_name: Optional[str] = None,
+        batch_id: Optional[str] = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Like import_contacts, but yields contact records one chunk at a time."""
+        self.check_mapping(column_mapping, "contact")
+        batch_id = batch_id or self._new_batch_id()
+
+        for chunk in self.iter_chunks(file_content, file_type, chunk_size, skip_rows, sheet_name):
+            df = self._mapped_frame(chunk, column_mapping)
+            empty = pd.Series(pd.NA, index=df.index, dtype="string")
+            first = df["first_name"] if "first_name" in df else empty
+            last = df["last_name"] if "last_name" in df else empty
 
             # Generate full_name if not provided
-            if not contact.get("full_name"):
-                parts = []
-                if contact.get("first_name"):
-                    parts.append(contact["first_name"])
-                if contact.get("last_name"):
-                    parts.append(contact["last_name"])
-                contact["full_name"] = " ".join(parts)
+            joined = (first.fillna("") + " " + last.fillna("")).str.strip()
+            full = df["full_name"].fillna(joined) if "full_name" in df else joined
+            df["full_name"] = full
 
             # Parse first/last from full_name if not provided
-            if contact.get("full_name") and not contact.get("first_name"):
-                name_parts = contact["full_name"].split()
-                if name_parts:
-                    contact["first_name"] = name_parts[0]
-                    if len(name_parts) > 1:
-                        contact["last_name"] = " ".join(name_parts[1:])
+            parts = full.str.split(n=1)
+            need_split = first.isna() & full.notna() & (full != "")
+            if need_split.any():
+                df["first_name"] = first.mask(need_split, parts.str[0])
+                df["last_name"] = last.mask(need_split & last.isna(), parts.str[1])
 
             # Clean email (lowercase, trim)
-            if contact.get("email"):
-                contact["email"] = contact["email"].lower().strip()
+            if "email" in df:
+                df["email"] = FieldTransformer.transform_series(df["email"], "lowercase")
 
             # Clean phone
-            if contact.get("phone"):
-                contact["phone"] = FieldTransformer.transform(
-                    contact["phone"], "clean_phone", {"keep_format": True}
+            if "phone" in df:
+                df["phone"] = FieldTransformer.transform_series(
+                    df["phone"], "clean_phone", {"keep_format": True}
                 )
 
             # Clean company domain
-            if contact.get("company_domain"):
-                contact["company_domain"] = FieldTransformer.transform(
-                    contact["company_domain"], "clean_domain", {}
+            if "company_domain" in df:
+                df["company_domain"] = FieldTransformer.transform_series(
+                    df["company_domain"], "clean_domain"
                 )
 
-            contacts.append(contact)
+            yield self._to_records(df, chunk.index, batch_id)
 
-        return contacts
+    # ─────────────────────────────────────────────────────────────
+    # Chunk helpers
+    # ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def check_mapping(column_mapping: Dict[str, str], record_type: str) -> None:
+        """Raise ValueError if the mapping lacks the fields required for record_type"""
+        targets = set(column_mapping.values())
+        if record_type == "company":
+            if "name" not in targets:
+                raise ValueError("Column mapping must include 'name' field")
+        elif record_type == "contact":
+            if "full_name" not in targets and not {"first_name", "last_name"} <= targets:
+                raise ValueError(
+                    "Column mapping must include 'full_name' or both 'first_name' and 'last_name'"
+                )
+        else:
+            raise ValueError("record_type must be 'company' or 'contact'")
+
+    def _new_batch_id(self) -> str:
+        self._batch_counter += 1
+        return f"import_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{self._batch_counter}"
+
+    @staticmethod
+    def _mapped_frame(chunk: "pd.DataFrame", column_mapping: Dict[str, str]) -> "pd.DataFrame":
+        """Mapped columns renamed to their target fields, trimmed, "" as missing"""
+        reverse_map = {v: k for k, v in column_mapping.items()}
+        columns = {}
+        for target_field, source_col in reverse_map.items():
+            if source_col in chunk.columns:
+                values = chunk[source_col].astype("string").str.strip()
+                columns[target_field] = values.mask(values == "")
+        return pd.DataFrame(columns, index=chunk.index)
+
+    def _to_records(
+        self,
+        df: "pd.DataFrame",
+        index: "pd.Index",
+        batch_id: str,
+    ) -> List[Dict[str, Any]]:
+        """Standard records for a cleaned chunk, missing values as None"""
+        imported_at = datetime.utcnow().isoformat()
+        prefix = self.make_id(f"{batch_id}:")
+        ids = [f"{prefix}{i}" for i in index]
+
+        columns = {
+            name: df[name].astype(object).where(df[name].notna(), None).tolist()
+            for name in df.columns
+        }
+        names = list(columns)
+        records = []
+        for row, record_id in enumerate(ids):
+            record = {
+                "id": record_id,
+                "_batch_id": batch_id,
+                "_source": "import",
+                "_imported_at": imported_at,
+            }
+            for name in names:
+                record[name] = columns[name][row]
+            records.append(record)
+        return records
 
     # ─────────────────────────────────────────────────────────────
     # Validation
@@ -408,32 +653,7 @@ class FileImportConnector(BaseConnector):
         valid_count = 0
 
         for idx, record in enumerate(records):
-            record_errors = []
-            record_warnings = []
-
-            if record_type == "company":
-                # Required: name
-                if not record.get("name"):
-                    record_errors.append("Missing company name")
-
-                # Recommended: domain
-                if not record.get("domain"):
-                    record_warnings.append("Missing domain")
-
-            elif record_type == "contact":
-                # Required: name
-                if not record.get("full_name"):
-                    record_errors.append("Missing name")
-
-                # Recommended: email
-                if not record.get("email"):
-                    record_warnings.append("Missing email")
-
-                # Validate email format
-                if record.get("email"):
-                    email = record["email"]
-                    if "@" not in email or "." not in email:
-                        record_errors.append(f"Invalid email format: {email}")
+            record_errors, record_warnings = self.check_record(record, record_type)
 
             if record_errors:
                 errors.append({"row": idx + 1, "errors": record_errors, "record": record})
@@ -451,3 +671,35 @@ class FileImportConnector(BaseConnector):
             "errors": errors[:50],  # Limit to first 50 errors
             "warnings": warnings[:50],
         }
+
+    @staticmethod
+    def check_record(record: Dict[str, Any], record_type: str) -> Tuple[List[str], List[str]]:
+        """(errors, warnings) for one imported record; records with errors are invalid"""
+        record_errors = []
+        record_warnings = []
+
+        if record_type == "company":
+            # Required: name
+            if not record.get("name"):
+                record_errors.append("Missing company name")
+
+            # Recommended: domain
+            if not record.get("domain"):
+                record_warnings.append("Missing domain")
+
+        elif record_type == "contact":
+            # Required: name
+            if not record.get("full_name"):
+                record_errors.append("Missing name")
+
+            # Recommended: email
+            if not record.get("email"):
+                record_warnings.append("Missing email")
+
+            # Validate email format
+            if record.get("email"):
+                email = record["email"]
+                if "@" not in email or "." not in email:
+                    record_errors.append(f"Invalid email format: {email}")
+
+        return record_errors, record_warnings
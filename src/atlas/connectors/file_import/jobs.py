@@ -0,0 +1,345 @@
+# src/atlas/connectors/file_import/jobs.py
+"""
+Background file imports: spooled uploads, chunked parsing, batched Neo4j writes.
+
+An upload is copied to a temp file in fixed-size blocks (never held in memory
+as a whole), then an ImportJob walks it chunk by chunk with
+FileImportConnector.iter_companies / iter_contacts and writes every batch of
+valid records with one UNWIND ... MERGE query. Parsing and writes run in worker
+threads, so the event loop stays responsive; progress is kept on the job for
+the status endpoint.
+
+Jobs live in process memory (IMPORT_JOBS): their status is lost on restart,
+the data already written is not.
+
+Usage:
+    path = await spool_upload(upload, ".csv")
+    job = IMPORT_JOBS.create(filename, "company")
+    background_tasks.add_task(run_import_job, job, path, "csv", mapping)
+    ...
+    IMPORT_JOBS.get(job.id).to_dict()
+"""
+
+import asyncio
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from atlas.connectors.file_import.connector import IMPORT_CHUNK_SIZE, FileImportConnector
+
+# Upload bytes read per await while spooling
+SPOOL_BLOCK_SIZE = 1024 * 1024
+
+# Records per UNWIND MERGE transaction
+WRITE_BATCH_SIZE = 1000
+
+# Finished jobs kept for status queries; oldest are dropped first
+MAX_FINISHED_JOBS = 200
+
+
+# ─────────────────────────────────────────────────────────────
+# Cypher
+# ─────────────────────────────────────────────────────────────
+
+# Companies with a domain merge into the existing node for that domain;
+# without one, the import row id is the only key.
+COMPANY_BY_DOMAIN = """
+UNWIND $rows AS row
+MERGE (co:Company {domain: row.domain})
+  ON CREATE SET co.id = row.id, co.created_at = timestamp()
+SET co += row.props, co.updated_at = timestamp()
+"""
+
+COMPANY_BY_ID = """
+UNWIND $rows AS row
+MERGE (co:Company {id: row.id})
+  ON CREATE SET co.created_at = timestamp()
+SET co += row.props, co.domain = row.domain, co.updated_at = timestamp()
+"""
+
+# Contacts with an email are keyed by it (re-imports update, not duplicate)
+CONTACT_BY_EMAIL = """
+UNWIND $rows AS row
+MERGE (e:Email {address: row.email})
+MERGE (pe:Person)-[:HAS_EMAIL]->(e)
+  ON CREATE SET pe.id = row.id, pe.created_at = timestamp()
+SET pe += row.props, pe.email = row.email, pe.updated_at = timestamp()
+WITH row, pe
+WHERE row.company_domain IS NOT NULL
+MERGE (co:Company {domain: row.company_domain})
+  ON CREATE SET co.id = 'import:domain:' + row.company_domain,
+                co.name = row.company_name, co.created_at = timestamp()
+MERGE (pe)-[:WORKS_AT]->(co)
+"""
+
+CONTACT_BY_ID = """
+UNWIND $rows AS row
+MERGE (pe:Person {id: row.id})
+  ON CREATE SET pe.created_at = timestamp()
+SET pe += row.props, pe.email = row.email, pe.updated_at = timestamp()
+WITH row, pe
+WHERE row.company_domain IS NOT NULL
+MERGE (co:Company {domain: row.company_domain})
+  ON CREATE SET co.id = 'import:domain:' + row.company_domain,
+                co.name = row.company_name, co.created_at = timestamp()
+MERGE (pe)-[:WORKS_AT]->(co)
+"""
+
+
+# Never overwritten by `SET += props`: merge keys, and the node id, which other
+# lookups (data API, signals, vector sync) rely on; it is set only on create
+_ROW_KEYS = frozenset({"id", "domain", "email"})
+
+
+def _row(record: Dict[str, Any], batch_id: str) -> Dict[str, Any]:
+    """UNWIND row: merge keys plus the flat properties to set"""
+    props = {
+        key: value
+        for key, value in record.items()
+        if not key.startswith("_") and key not in _ROW_KEYS and value is not None and value != ""
+    }
+    props["source"] = "import"
+    props["import_batch"] = batch_id
+    return {
+        "id": record["id"],
+        "domain": record.get("domain"),
+        "email": record.get("email"),
+        "company_domain": record.get("company_domain"),
+        "company_name": record.get("company_name"),
+        "props": props,
+    }
+
+
+def write_records(
+    driver: Any, records: List[Dict[str, Any]], record_type: str, batch_id: str
+) -> int:
+    """Upsert one batch of imported records into Neo4j (one transaction)"""
+    rows = [_row(r, batch_id) for r in records]
+    key = "domain" if record_type == "company" else "email"
+    keyed = [r for r in rows if r[key]]
+    unkeyed = [r for r in rows if not r[key]]
+    by_key, by_id = (
+        (COMPANY_BY_DOMAIN, COMPANY_BY_ID)
+        if record_type == "company"
+        else (CONTACT_BY_EMAIL, CONTACT_BY_ID)
+    )
+
+    def work(tx):
+        if keyed:
+            tx.run(by_key, rows=keyed)
+        if unkeyed:
+            tx.run(by_id, rows=unkeyed)
+
+    with driver.session() as session:
+        session.execute_write(work)
+    return len(rows)
+
+
+def get_neo4j_driver() -> Any:
+    from neo4j import GraphDatabase
+
+    uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+    user = os.getenv("NEO4J_USER", "neo4j")
+    pwd = os.getenv("NEO4J_PASSWORD", "neo4jpass")
+    return GraphDatabase.driver(uri, auth=(user, pwd))
+
+
+# ─────────────────────────────────────────────────────────────
+# Spooling
+# ─────────────────────────────────────────────────────────────
+
+
+async def spool_upload(upload: Any, suffix: str = "", block_size: int = SPOOL_BLOCK_SIZE) -> str:
+    """
+    Copy an upload (anything with `async read(n)`, e.g. FastAPI's UploadFile)
+    to a temp file, one block at a time.
+
+    The directory is ATLAS_IMPORT_SPOOL_DIR if set, else the system temp dir.
+
+    Returns:
+        Path of the spooled file; the caller removes it when done
+    """
+    spool_dir = os.getenv("ATLAS_IMPORT_SPOOL_DIR") or None
+    if spool_dir:
+        os.makedirs(spool_dir, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix="atlas_import_", suffix=suffix, dir=spool_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while True:
+                block = await upload.read(block_size)
+                if not block:
+                    break
+                await asyncio.to_thread(f.write, block)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+# ─────────────────────────────────────────────────────────────
+# Jobs
+# ─────────────────────────────────────────────────────────────
+
+
+@dataclass
+class ImportJob:
+    """Progress of one background file import"""
+
+    id: str
+    filename: str
+    record_type: str
+    status: str = "queued"  # queued, running, completed, failed
+    batch_id: Optional[str] = None
+    total_rows: Optional[int] = None
+    processed: int = 0  # rows parsed and validated
+    written: int = 0  # records upserted into Neo4j
+    valid_count: int = 0
+    error_count: int = 0
+    warning_count: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None  # why the job failed
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def to_dict(self) -> Dict[str, Any]:
+        progress = None
+        if self.total_rows:
+            progress = round(min(self.processed / self.total_rows, 1.0), 3)
+        if self.status == "completed":
+            progress = 1.0
+        return {
+            "job_id": self.id,
+            "filename": self.filename,
+            "record_type": self.record_type,
+            "status": self.status,
+            "batch_id": self.batch_id,
+            "total_rows": self.total_rows,
+            "processed": self.processed,
+            "written": self.written,
+            "progress": progress,
+            "validation": {
+                "valid_count": self.valid_count,
+                "error_count": self.error_count,
+                "warning_count": self.warning_count,
+                "errors": self.errors,
+            },
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class ImportJobStore:
+    """In-memory registry of import jobs"""
+
+    def __init__(self, max_finished: int = MAX_FINISHED_JOBS):
+        self.max_finished = max_finished
+        self._jobs: Dict[str, ImportJob] = {}
+
+    def create(self, filename: str, record_type: str) -> ImportJob:
+        self._evict()
+        job = ImportJob(id=uuid.uuid4().hex, filename=filename, record_type=record_type)
+        self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[ImportJob]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[ImportJob]:
+        return sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    def _evict(self) -> None:
+        finished = [j for j in self._jobs.values() if j.finished]
+        for job in sorted(finished, key=lambda j: j.created_at)[
+            : max(0, len(finished) - self.max_finished + 1)
+        ]:
+            del self._jobs[job.id]
+
+
+IMPORT_JOBS = ImportJobStore()
+
+
+async def run_import_job(
+    job: ImportJob,
+    path: str,
+    file_type: str,
+    column_mapping: Dict[str, str],
+    skip_rows: int = 0,
+    sheet_name: Optional[str] = None,
+    driver_factory: Callable[[], Any] = get_neo4j_driver,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    write_batch_size: int = WRITE_BATCH_SIZE,
+    remove_file: bool = True,
+) -> ImportJob:
+    """
+    Import a spooled file into Neo4j, updating `job` as chunks complete.
+
+    Rows failing validation (e.g. a company without a name) are counted and
+    listed in the job (first 50) but not written. Never raises; failures end
+    the job with status "failed" and the error message.
+    """
+    connector = FileImportConnector()
+    job.status = "running"
+    job.started_at = datetime.utcnow().isoformat()
+    job.batch_id = f"import_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{job.id[:8]}"
+    driver = None
+
+    try:
+        job.total_rows = await asyncio.to_thread(connector.count_rows, path, file_type, sheet_name)
+
+        iterate = (
+            connector.iter_companies if job.record_type == "company" else connector.iter_contacts
+        )
+        chunks = iterate(
+            path, file_type, column_mapping, skip_rows, sheet_name, job.batch_id, chunk_size
+        )
+        driver = driver_factory()
+
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                break
+
+            valid = []
+            for record in chunk:
+                job.processed += 1
+                errors, warnings = connector.check_record(record, job.record_type)
+                if errors:
+                    job.error_count += 1
+                    if len(job.errors) < 50:
+                        job.errors.append({"row": job.processed, "errors": errors})
+                    continue
+                job.valid_count += 1
+                job.warning_count += bool(warnings)
+                valid.append(record)
+
+            for lo in range(0, len(valid), write_batch_size):
+                job.written += await asyncio.to_thread(
+                    write_records,
+                    driver,
+                    valid[lo : lo + write_batch_size],
+                    job.record_type,
+                    job.batch_id,
+                )
+
+        job.status = "completed"
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e)
+    finally:
+        job.finished_at = datetime.utcnow().isoformat()
+        if driver is not None:
+            driver.close()
+        if remove_file and os.path.exists(path):
+            os.remove(path)
+
+    return job
@@ -10,8 +10,7 @@ Hunter provides:
 API Docs: https://hunter.io/api-documentation/v2
 """
 
-import httpx
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 
 from atlas.connectors.registry import (
     BaseConnector,
@@ -21,6 +20,12 @@ from atlas.connectors.registry import (
     ConnectorRegistry,
 )
 from atlas.ingestors.common.base import CompanyPeopleFinder
+from atlas.connectors.utils.concurrency import (
+    as_completed_bounded,
+    batch_result,
+    distinct_keys,
+)
+from atlas.connectors.utils.http import make_client
 from atlas.connectors.utils.rate_limiter import RateLimiter
 
 
@@ -64,15 +69,16 @@ class HunterConnector(BaseConnector, CompanyPeopleFinder):
             api_key: Hunter.io API key
         """
         self.api_key = api_key
-        self.client = httpx.AsyncClient(
-            base_url=self.config.base_url,
-            timeout=30.0,
-        )
         self.rate_limiter = RateLimiter(
             connector_id="hunter",
             limit=self.config.rate_limit,
             window=self.config.rate_limit_window,
         )
+        self.client = make_client(
+            self.rate_limiter,
+            base_url=self.config.base_url,
+            timeout=30.0,
+        )
 
     @property
     def source_prefix(self) -> str:
@@ -103,6 +109,7 @@ class HunterConnector(BaseConnector, CompanyPeopleFinder):
                     "remaining": data.get("requests", {}).get("searches", {}).get("available", 0)
                                 - data.get("requests", {}).get("searches", {}).get("used", 0),
                     "reset_in": 3600,  # Hunter resets hourly
+                    "effective": self.rate_limiter.get_status(),
                 }
         except Exception:
             pass
@@ -111,6 +118,7 @@ class HunterConnector(BaseConnector, CompanyPeopleFinder):
     async def close(self):
         """Close HTTP client"""
         await self.client.aclose()
+        await self.rate_limiter.close()
 
     # ─────────────────────────────────────────────────────────────
     # CompanyPeopleFinder Implementation
@@ -208,6 +216,32 @@ class HunterConnector(BaseConnector, CompanyPeopleFinder):
         Returns:
             Verification result with status and details
         """
+        return await self.cached_call(
+            "email-verifier", {"email": email}, lambda: self._verify_email(email)
+        )
+
+    async def verify_emails(
+        self,
+        emails: List[str],
+        concurrency: int = 5,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Verify many emails.
+
+        Hunter has no bulk verification endpoint, so this fans out single
+        (cached) verifications with up to `concurrency` in flight; the rate
+        limiter still paces the actual requests. Each distinct email yields one
+        result as soon as it completes.
+
+        Yields:
+            {"input": email, "found": bool, "result": verification|None, "error": str|None}
+        """
+        async for email, result, error in as_completed_bounded(
+            distinct_keys(emails), self.verify_email, concurrency
+        ):
+            yield batch_result(email, result, error)
+
+    async def _verify_email(self, email: str) -> Dict[str, Any]:
         await self.rate_limiter.wait_and_acquire()
 
         params = {"email": email, "api_key": self.api_key}
@@ -248,6 +282,13 @@ class HunterConnector(BaseConnector, CompanyPeopleFinder):
         Returns:
             Email finding result with confidence score
         """
+        return await self.cached_call(
+            "email-finder",
+            {"domain": domain, "first_name": first_name, "last_name": last_name},
+            lambda: self._find_email(domain, first_name, last_name),
+        )
+
+    async def _find_email(self, domain: str, first_name: str, last_name: str) -> Dict[str, Any]:
         await self.rate_limiter.wait_and_acquire()
 
         params = {
@@ -309,7 +350,4 @@ class HunterConnector(BaseConnector, CompanyPeopleFinder):
 
     def find_by_company_domain_sync(self, domain: str) -> List[Dict[str, Any]]:
         """Synchronous wrapper for CompanyPeopleFinder interface"""
-        import asyncio
-        return asyncio.get_event_loop().run_until_complete(
-            self.find_by_company_domain(domain)
-        )
+        return self.run_sync(self.find_by_company_domain(domain))
@@ -11,8 +11,8 @@ KvK provides:
 API Docs: https://developers.kvk.nl/documentation
 """
 
-import httpx
-from typing import Optional, List, Dict, Any
+import asyncio
+from typing import Optional, List, Dict, Any, AsyncIterator
 
 from atlas.connectors.registry import (
     BaseConnector,
@@ -22,6 +22,8 @@ from atlas.connectors.registry import (
     ConnectorRegistry,
 )
 from atlas.ingestors.common.base import CompanyIngestor
+from atlas.connectors.utils.concurrency import as_completed_bounded, batch_result
+from atlas.connectors.utils.http import make_client
 from atlas.connectors.utils.rate_limiter import RateLimiter
 from atlas.connectors.kvk.sbi_mapping import (
     sbi_to_industry,
@@ -49,6 +51,14 @@ KVK_CONFIG = ConnectorConfig(
 )
 
 
+def normalize_kvk_number(value: Any) -> Optional[str]:
+    """8-digit KvK number from user input ("1234567", " 12.34.56.78 "), or None"""
+    digits = "".join(ch for ch in str(value or "") if ch.isdigit())
+    if not digits or len(digits) > 8:
+        return None
+    return digits.zfill(8)
+
+
 @ConnectorRegistry.register("kvk")
 class KvKConnector(BaseConnector, CompanyIngestor):
     """
@@ -71,7 +81,13 @@ class KvKConnector(BaseConnector, CompanyIngestor):
             api_key: KvK API key from https://developers.kvk.nl
         """
         self.api_key = api_key
-        self.client = httpx.AsyncClient(
+        self.rate_limiter = RateLimiter(
+            connector_id="kvk",
+            limit=self.config.rate_limit,
+            window=self.config.rate_limit_window,
+        )
+        self.client = make_client(
+            self.rate_limiter,
             base_url=self.config.base_url,
             headers={
                 "apikey": api_key,
@@ -79,11 +95,6 @@ class KvKConnector(BaseConnector, CompanyIngestor):
             },
             timeout=30.0,
         )
-        self.rate_limiter = RateLimiter(
-            connector_id="kvk",
-            limit=self.config.rate_limit,
-            window=self.config.rate_limit_window,
-        )
 
     @property
     def source_prefix(self) -> str:
@@ -108,6 +119,7 @@ class KvKConnector(BaseConnector, CompanyIngestor):
     async def close(self):
         """Close HTTP client"""
         await self.client.aclose()
+        await self.rate_limiter.close()
 
     # ─────────────────────────────────────────────────────────────
     # CompanyIngestor Implementation
@@ -172,15 +184,18 @@ class KvKConnector(BaseConnector, CompanyIngestor):
         Returns:
             Company details in standard format, or None if not found
         """
-        await self.rate_limiter.wait_and_acquire()
 
-        response = await self.client.get(f"/basisprofielen/{kvk_number}")
+        async def fetch() -> Optional[Dict[str, Any]]:
+            await self.rate_limiter.wait_and_acquire()
+            response = await self.client.get(f"/basisprofielen/{kvk_number}")
 
-        if response.status_code == 404:
-            return None
+            if response.status_code == 404:
+                return None
 
-        response.raise_for_status()
-        return self._transform_basisprofiel(response.json())
+            response.raise_for_status()
+            return self._transform_basisprofiel(response.json())
+
+        return await self.cached_call("basisprofielen", {"kvk_number": kvk_number}, fetch)
 
     async def get_vestigingen(self, kvk_number: str) -> List[Dict[str, Any]]:
         """
@@ -192,21 +207,19 @@ class KvKConnector(BaseConnector, CompanyIngestor):
         Returns:
             List of location records
         """
-        await self.rate_limiter.wait_and_acquire()
 
-        response = await self.client.get(f"/vestigingsprofielen/{kvk_number}")
+        async def fetch() -> List[Dict[str, Any]]:
+            await self.rate_limiter.wait_and_acquire()
+            response = await self.client.get(f"/vestigingsprofielen/{kvk_number}")
 
-        if response.status_code == 404:
-            return []
+            if response.status_code == 404:
+                return []
 
-        response.raise_for_status()
-        data = response.json()
+            response.raise_for_status()
+            data = response.json()
+            return [self._transform_vestiging(v) for v in data.get("vestigingen", [])]
 
-        locations = []
-        for vestiging in data.get("vestigingen", []):
-            locations.append(self._transform_vestiging(vestiging))
-
-        return locations
+        return await self.cached_call("vestigingsprofielen", {"kvk_number": kvk_number}, fetch)
 
     async def enrich_company(self, kvk_number: str) -> Optional[Dict[str, Any]]:
         """
@@ -220,12 +233,15 @@ class KvKConnector(BaseConnector, CompanyIngestor):
         Returns:
             Full company details, or None if not found
         """
-        company = await self.get_by_kvk_number(kvk_number)
+        # Both lookups at once: one round trip of latency instead of two
+        company, locations = await asyncio.gather(
+            self.get_by_kvk_number(kvk_number),
+            self.get_vestigingen(kvk_number),
+        )
         if not company:
             return None
 
-        # Get locations
-        locations = await self.get_vestigingen(kvk_number)
+        company = dict(company)  # may be a shared cache entry
         company["locations"] = locations
 
         # Find headquarters
@@ -242,6 +258,57 @@ class KvKConnector(BaseConnector, CompanyIngestor):
 
         return company
 
+    async def enrich_companies(
+        self,
+        kvk_numbers: Optional[List[str]] = None,
+        names: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Enrich many companies by KvK number and/or name.
+
+        Numbers are normalized and de-duplicated; names are resolved to the top
+        search hit first. Enrichments run concurrently (default: as many as the
+        rate limit allows per second) and share one lookup per KvK number, so a
+        name that resolves to a number already being enriched costs only the
+        search. The rate limiter keeps the whole batch within the API budget.
+
+        Yields:
+            {"input": number|name, "found": bool, "result": company|None, "error": str|None}
+        """
+        if concurrency is None:
+            concurrency = max(1, int(self.config.rate_limit / self.config.rate_limit_window))
+
+        inputs: Dict[str, Optional[str]] = {}
+        for value in kvk_numbers or []:
+            number = normalize_kvk_number(value)
+            if number:
+                inputs.setdefault(number, number)
+        for name in names or []:
+            key = (name or "").strip()
+            if key:
+                inputs.setdefault(key, None)
+
+        enrichments: Dict[str, asyncio.Future] = {}
+
+        async def enrich(key: str) -> Optional[Dict[str, Any]]:
+            number = inputs[key]
+            if number is None:
+                hits = await self.search(key, limit=1)
+                number = hits[0]["kvk_number"] if hits else None
+                if not number:
+                    return None
+            if number not in enrichments:
+                enrichments[number] = asyncio.ensure_future(self.enrich_company(number))
+            return await asyncio.shield(enrichments[number])
+
+        try:
+            async for key, result, error in as_completed_bounded(inputs, enrich, concurrency):
+                yield batch_result(key, result, error)
+        finally:
+            for task in enrichments.values():
+                task.cancel()
+
     # ─────────────────────────────────────────────────────────────
     # Transform Methods
     # ─────────────────────────────────────────────────────────────
@@ -376,5 +443,4 @@ class KvKConnector(BaseConnector, CompanyIngestor):
 
     def search_sync(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Synchronous search wrapper"""
-        import asyncio
-        return asyncio.get_event_loop().run_until_complete(self.search(query, limit))
+        return self.run_sync(self.search(query, limit))
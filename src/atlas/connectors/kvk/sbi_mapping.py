@@ -8,6 +8,7 @@ This module maps SBI codes to standardized industry categories.
 Reference: https://sbi.cbs.nl/
 """
 
+from functools import lru_cache
 from typing import Optional, Dict, List
 
 # Top-level SBI code mapping to industry categories
@@ -175,10 +176,13 @@ SBI_DETAILED: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=4096)
 def sbi_to_industry(sbi_code: str) -> str:
     """
     Map SBI code to industry category.
 
+    Memoized: bulk enrichment maps the same few hundred codes over and over.
+
     Args:
         sbi_code: SBI code (can be 2-5 digits)
 
@@ -275,6 +279,7 @@ RECHTSVORM_MAPPING: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=256)
 def translate_rechtsvorm(rechtsvorm: str) -> str:
     """Translate Dutch legal form to English"""
     if not rechtsvorm:
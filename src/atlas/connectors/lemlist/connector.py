@@ -14,7 +14,7 @@ Features:
 """
 
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable
 import httpx
 
 from ..registry import (
@@ -24,6 +24,10 @@ from ..registry import (
     AuthType,
     ConnectorRegistry,
 )
+from ..utils.checkpoint import BatchCheckpoint
+from ..utils.concurrency import as_completed_bounded, batch_result
+from ..utils.http import make_client
+from ..utils.rate_limiter import RateLimiter
 
 
 LEMLIST_CONFIG = ConnectorConfig(
@@ -44,6 +48,16 @@ LEMLIST_CONFIG = ConnectorConfig(
     description="French cold email & sales engagement platform (Paris, FR)",
 )
 
+# Keyword arguments of add_lead_to_campaign a lead dict may carry
+LEAD_FIELDS = (
+    "first_name",
+    "last_name",
+    "company_name",
+    "phone",
+    "linkedin_url",
+    "custom_fields",
+)
+
 
 @ConnectorRegistry.register("lemlist")
 class LemlistConnector(BaseConnector):
@@ -95,6 +109,11 @@ class LemlistConnector(BaseConnector):
 
         self.base_url = LEMLIST_CONFIG.base_url
         self._client: Optional[httpx.AsyncClient] = None
+        self.rate_limiter = RateLimiter(
+            connector_id="lemlist",
+            limit=self.config.rate_limit,
+            window=self.config.rate_limit_window,
+        )
 
     @property
     def source_prefix(self) -> str:
@@ -103,7 +122,10 @@ class LemlistConnector(BaseConnector):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client with authentication."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            # Every request takes a rate limiter token inside the transport
+            self._client = make_client(
+                self.rate_limiter,
+                acquire=True,
                 base_url=self.base_url,
                 headers={
                     "Content-Type": "application/json",
@@ -118,6 +140,7 @@ class LemlistConnector(BaseConnector):
         if self._client:
             await self._client.aclose()
             self._client = None
+        await self.rate_limiter.close()
 
     async def test_connection(self) -> bool:
         """Test if API key is valid by fetching team info."""
@@ -132,14 +155,10 @@ class LemlistConnector(BaseConnector):
         """
         Get current rate limit status.
 
-        Note: lemlist doesn't expose rate limit headers, so we return config values.
+        lemlist only signals limits through 429 / Retry-After, which the adaptive
+        transport feeds back into the limiter; this reports its effective state.
         """
-        return {
-            "limit": self.config.rate_limit,
-            "remaining": self.config.rate_limit,  # Not tracked by API
-            "reset": 60,
-            "window": self.config.rate_limit_window,
-        }
+        return self.rate_limiter.get_status()
 
     # =====================
     # Campaign Management
@@ -299,6 +318,137 @@ class LemlistConnector(BaseConnector):
         )
         return response.status_code == 200
 
+    # =====================
+    # Bulk Lead Operations
+    # =====================
+    # lemlist has no bulk lead endpoint, so these fan out single-lead calls with
+    # up to `concurrency` in flight; the rate limiter inside the HTTP client
+    # paces them at the account limit and backs off on 429s. Each distinct email
+    # yields one {"input", "found", "result", "error"} line as it completes.
+    #
+    # With `checkpoint` (a file path) every successful lead is recorded as it
+    # completes; re-running the same call with the same path skips those leads
+    # (reported with {"resumed": True}) and only retries the rest.
+
+    async def add_leads_to_campaign(
+        self,
+        campaign_id: str,
+        leads: List[Dict[str, Any]],
+        concurrency: int = 5,
+        checkpoint: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Add many leads to a campaign.
+
+        Args:
+            campaign_id: Target campaign ID
+            leads: Dicts with "email" plus any add_lead_to_campaign fields
+                (first_name, last_name, company_name, phone, linkedin_url,
+                custom_fields)
+            concurrency: Requests in flight at once
+            checkpoint: Progress file for resuming an interrupted push
+        """
+        payloads = {}
+        for lead in leads:
+            email = (lead.get("email") or "").strip().lower()
+            if email and email not in payloads:
+                payloads[email] = {k: lead[k] for k in LEAD_FIELDS if lead.get(k)}
+
+        async def add(email: str) -> Dict[str, Any]:
+            return await self.add_lead_to_campaign(campaign_id, email, **payloads[email])
+
+        async for line in self._bulk_leads(
+            f"add:{campaign_id}", list(payloads), add, concurrency, checkpoint
+        ):
+            yield line
+
+    async def update_leads(
+        self,
+        campaign_id: str,
+        updates: List[Dict[str, Any]],
+        concurrency: int = 5,
+        checkpoint: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Update many leads in a campaign.
+
+        Args:
+            campaign_id: Campaign ID
+            updates: Dicts with "email" plus the lemlist fields to set
+            concurrency: Requests in flight at once
+            checkpoint: Progress file for resuming an interrupted update
+        """
+        fields = {}
+        for update in updates:
+            email = (update.get("email") or "").strip().lower()
+            if email:
+                # Later updates for the same lead win, as they would sequentially
+                fields.setdefault(email, {}).update(
+                    {k: v for k, v in update.items() if k != "email"}
+                )
+
+        async def patch(email: str) -> Dict[str, Any]:
+            return await self.update_lead(campaign_id, email, **fields[email])
+
+        async for line in self._bulk_leads(
+            f"update:{campaign_id}", list(fields), patch, concurrency, checkpoint
+        ):
+            yield line
+
+    async def remove_leads(
+        self,
+        campaign_id: str,
+        emails: List[str],
+        concurrency: int = 5,
+        checkpoint: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Remove many leads from a campaign.
+
+        Args:
+            campaign_id: Campaign ID
+            emails: Lead email addresses
+            concurrency: Requests in flight at once
+            checkpoint: Progress file for resuming an interrupted removal
+        """
+        keys = list(dict.fromkeys(e.strip().lower() for e in emails if e and e.strip()))
+
+        async def remove(email: str) -> Dict[str, Any]:
+            if not await self.remove_lead(campaign_id, email):
+                raise RuntimeError(f"lemlist did not remove {email}")
+            return {"removed": True}
+
+        async for line in self._bulk_leads(
+            f"remove:{campaign_id}", keys, remove, concurrency, checkpoint
+        ):
+            yield line
+
+    async def _bulk_leads(
+        self,
+        operation: str,
+        emails: List[str],
+        worker: Callable[[str], Awaitable[Dict[str, Any]]],
+        concurrency: int,
+        checkpoint: Optional[str],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run `worker` per email, skipping and recording checkpointed leads"""
+        progress = BatchCheckpoint(checkpoint) if checkpoint else None
+        try:
+            todo = []
+            for email in emails:
+                if progress and f"{operation}:{email}" in progress:
+                    yield batch_result(email, {"resumed": True})
+                else:
+                    todo.append(email)
+
+            async for email, result, error in as_completed_bounded(todo, worker, concurrency):
+                if progress and not error:
+                    progress.record(f"{operation}:{email}")
+                yield batch_result(email, result if not error else None, error)
+        finally:
+            if progress:
+                progress.close()
+
     # =====================
     # Activity & Analytics
     # =====================
@@ -13,7 +13,7 @@ for deeper access.
 API Docs: https://apify.com/curious_coder/linkedin-company-scraper
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 
 from atlas.connectors.registry import (
     BaseConnector,
@@ -121,32 +121,27 @@ class LinkedInConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
             },
         )
 
-        items = await self.apify.get_dataset_items(result["dataset_id"])
-
-        # Extract LinkedIn company URLs
+        # Extract LinkedIn company URLs (stop reading once we have enough)
         linkedin_urls = []
-        for item in items:
+        async for item in self.apify.iter_dataset_items(result["dataset_id"]):
             url = item.get("url", "")
-            if "linkedin.com/company/" in url and len(linkedin_urls) < limit:
+            if "linkedin.com/company/" in url:
                 linkedin_urls.append(url)
+                if len(linkedin_urls) >= limit:
+                    break
 
         if not linkedin_urls:
             return []
 
-        # Scrape each company page
-        companies = []
-        for url in linkedin_urls[:limit]:
-            try:
-                company = await self.apify.scrape_linkedin_company(url)
-                if company:
-                    # Update source prefix
-                    company["id"] = self.make_id(company["id"].split(":", 1)[-1])
-                    company["_source"] = "linkedin"
-                    companies.append(company)
-            except Exception as e:
-                print(f"Failed to scrape {url}: {e}")
-
-        return companies
+        # Scrape the company pages in batched actor runs
+        found = {}
+        async for line in self.enrich_companies_by_url(linkedin_urls):
+            if line["error"]:
+                print(f"Failed to scrape {line['input']}: {line['error']}")
+            elif line["found"]:
+                found[line["input"]] = line["result"]
+
+        return [found[url] for url in linkedin_urls if url in found]
 
     async def enrich_company(self, linkedin_url: str) -> Optional[Dict[str, Any]]:
         """
@@ -160,13 +155,55 @@ class LinkedInConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
         """
         try:
             company = await self.apify.scrape_linkedin_company(linkedin_url)
-            if company:
-                company["id"] = self.make_id(company["id"].split(":", 1)[-1])
-                company["_source"] = "linkedin"
-            return company
+            return self._relabel(company) if company else company
         except Exception:
             return None
 
+    async def enrich_companies_by_url(
+        self,
+        linkedin_urls: List[str],
+        concurrency: int = 3,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Enrich many companies from their LinkedIn URLs.
+
+        URLs are scraped in batches, one actor run per batch, with up to
+        `concurrency` runs in flight.
+
+        Yields:
+            {"input": url, "found": bool, "result": company|None, "error": str|None}
+        """
+        async for line in self.apify.iter_linkedin_companies(
+            linkedin_urls, concurrency=concurrency
+        ):
+            if line["found"]:
+                self._relabel(line["result"])
+            yield line
+
+    async def enrich_people_by_url(
+        self,
+        linkedin_urls: List[str],
+        concurrency: int = 3,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Enrich many people from their LinkedIn profile URLs, in batched runs.
+
+        Yields:
+            {"input": url, "found": bool, "result": person|None, "error": str|None}
+        """
+        async for line in self.apify.iter_linkedin_people(
+            linkedin_urls, concurrency=concurrency
+        ):
+            if line["found"]:
+                self._relabel(line["result"])
+            yield line
+
+    def _relabel(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Re-prefix an Apify LinkedIn record as a linkedin one"""
+        record["id"] = self.make_id(record["id"].split(":", 1)[-1])
+        record["_source"] = "linkedin"
+        return record
+
     async def enrich_by_domain(self, domain: str) -> Optional[Dict[str, Any]]:
         """
         Find and enrich company by domain.
@@ -189,11 +226,9 @@ class LinkedInConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
             },
         )
 
-        items = await self.apify.get_dataset_items(result["dataset_id"])
-
         # Find first LinkedIn company URL
         linkedin_url = None
-        for item in items:
+        async for item in self.apify.iter_dataset_items(result["dataset_id"]):
             url = item.get("url", "")
             if "linkedin.com/company/" in url:
                 linkedin_url = url
@@ -241,10 +276,8 @@ class LinkedInConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
             },
         )
 
-        items = await self.apify.get_dataset_items(result["dataset_id"])
-
         company_url = None
-        for item in items:
+        async for item in self.apify.iter_dataset_items(result["dataset_id"]):
             url = item.get("url", "")
             if "linkedin.com/company/" in url:
                 company_url = url
@@ -326,10 +359,7 @@ class LinkedInConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
         try:
             people = await self.apify.scrape_linkedin_people([linkedin_url])
             if people:
-                person = people[0]
-                person["id"] = self.make_id(person["id"].split(":", 1)[-1])
-                person["_source"] = "linkedin"
-                return person
+                return self._relabel(people[0])
             return None
         except Exception:
             return None
@@ -340,12 +370,8 @@ class LinkedInConnector(BaseConnector, CompanyIngestor, CompanyPeopleFinder):
 
     def search_sync(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Synchronous search wrapper"""
-        import asyncio
-        return asyncio.get_event_loop().run_until_complete(self.search(query, limit))
+        return self.run_sync(self.search(query, limit))
 
     def find_by_company_domain_sync(self, domain: str) -> List[Dict[str, Any]]:
         """Synchronous people finder wrapper"""
-        import asyncio
-        return asyncio.get_event_loop().run_until_complete(
-            self.find_by_company_domain(domain)
-        )
+        return self.run_sync(self.find_by_company_domain(domain))
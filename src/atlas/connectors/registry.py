@@ -6,11 +6,20 @@ This module provides the base classes and registry for managing
 connections to external data sources (Apollo, Hunter, KvK, etc.)
 """
 
+import hashlib
+import json
+import time
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Dict, Any, Type, List
+from typing import (
+    Optional, Dict, Any, Type, List, Tuple, Set, Callable, Awaitable, AsyncIterator, Iterator,
+)
 from abc import ABC, abstractmethod
 
+from atlas.connectors.utils.sync_bridge import iter_sync, run_sync
+from atlas.ingestors.common.response_cache import ResponseCache, get_response_cache
+
 
 class ConnectorType(Enum):
     """Categories of data connectors"""
@@ -79,9 +88,17 @@ class BaseConnector(ABC):
     - test_connection(): Verify credentials are valid
     - get_rate_limit_status(): Return current rate limit usage
     - source_prefix: Property returning the source ID prefix
+
+    Paid lookups should go through `cached_call` so repeat enrichments are
+    served from the response cache instead of the provider.
+
+    Sync callers use `run_sync` / `iter_sync`, which run on a shared background
+    event loop (see connectors.utils.sync_bridge) and are safe inside FastAPI
+    or Jupyter.
     """
 
     config: ConnectorConfig
+    response_cache: Optional[ResponseCache] = None
 
     @abstractmethod
     async def test_connection(self) -> bool:
@@ -120,6 +137,37 @@ class BaseConnector(ABC):
         """Create a namespaced ID for this source"""
         return f"{self.source_prefix}:{external_id}"
 
+    @property
+    def cache(self) -> ResponseCache:
+        """Response cache used by this connector (process-wide default)"""
+        return self.response_cache or get_response_cache()
+
+    def run_sync(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Block on a coroutine of this connector from sync code"""
+        return run_sync(coro, timeout)
+
+    def iter_sync(self, agen: AsyncIterator[Any]) -> Iterator[Any]:
+        """Iterate an async generator of this connector from sync code"""
+        return iter_sync(agen)
+
+    async def cached_call(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached response for (source, endpoint, params), or await
+        `fetch()` and cache its result. Exceptions are never cached.
+        """
+        return await self.cache.acached(self.source_prefix, endpoint, params, fetch)
+
+
+def _is_auth_error(error: BaseException) -> bool:
+    """HTTP 401/403 from the provider (httpx.HTTPStatusError or alike)"""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) in (401, 403)
+
 
 class ConnectorRegistry:
     """
@@ -136,10 +184,23 @@ class ConnectorRegistry:
 
         # List all registered connectors
         configs = ConnectorRegistry.list_all()
+
+        # Long-lived instance for a set of credentials (API handlers)
+        async with ConnectorRegistry.lease("apollo", api_key=key) as connector:
+            ...
     """
 
     _connectors: Dict[str, Type[BaseConnector]] = {}
 
+    # (connector_id, credentials hash) -> live instance, its last use, open leases;
+    # verified: instances that completed a leased call (credentials work)
+    _pool: Dict[Tuple[str, str], BaseConnector] = {}
+    _pool_last_used: Dict[Tuple[str, str], float] = {}
+    _pool_leases: Dict[Tuple[str, str], int] = {}
+    _pool_verified: Set[Tuple[str, str]] = set()
+    pool_idle_ttl: float = 900.0
+    pool_max_size: int = 256
+
     @classmethod
     def register(cls, connector_id: str):
         """
@@ -191,6 +252,147 @@ class ConnectorRegistry:
             return connector_class(**auth_kwargs)
         return None
 
+    @staticmethod
+    def credentials_hash(auth_kwargs: Dict[str, Any]) -> str:
+        """Stable digest of credentials; raw secrets are never used as keys"""
+        raw = json.dumps(auth_kwargs, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    async def get_pooled(cls, connector_id: str, **auth_kwargs) -> Optional[BaseConnector]:
+        """
+        Get a long-lived connector instance for these credentials.
+
+        Instances are shared across requests, so HTTP keep-alive, TLS sessions and
+        in-memory rate limit state survive between calls. Each set of credentials
+        gets its own instance and its own rate limit bucket, since providers limit
+        per API key. Callers must not close pooled instances; use `close_pooled`
+        (app shutdown) instead. Instances idle for `pool_idle_ttl` are closed, and
+        beyond `pool_max_size` instances the least recently used unleased ones
+        are; hold the instance through `lease` when using it beyond a quick call.
+
+        Returns:
+            The pooled connector instance, or None if not found
+        """
+        connector_class = cls.get(connector_id)
+        if not connector_class:
+            return None
+
+        await cls.evict_idle()
+
+        digest = cls.credentials_hash(auth_kwargs)
+        key = (connector_id, digest)
+        connector = cls._pool.get(key)
+        if connector is None:
+            connector = connector_class(**auth_kwargs)
+            limiter = getattr(connector, "rate_limiter", None)
+            if limiter is not None:
+                limiter.scope = digest
+            cls._pool[key] = connector
+        cls._pool_last_used[key] = time.monotonic()
+        if len(cls._pool) > cls.pool_max_size:
+            await cls._evict_lru(keep=key)
+        return connector
+
+    @classmethod
+    @asynccontextmanager
+    async def lease(cls, connector_id: str, **auth_kwargs) -> AsyncIterator[Optional[BaseConnector]]:
+        """
+        Pooled instance (see `get_pooled`) held for the duration of the block.
+
+        A leased instance is never evicted, however long the block runs (e.g. a
+        streamed batch), and its idle time counts from the end of the block.
+        If the first leased call for new credentials fails authentication
+        (HTTP 401/403), the instance is dropped from the pool rather than kept
+        for bogus or revoked keys.
+
+        Yields:
+            The pooled connector instance, or None if not found
+        """
+        connector = await cls.get_pooled(connector_id, **auth_kwargs)
+        if connector is None:
+            yield None
+            return
+
+        key = (connector_id, cls.credentials_hash(auth_kwargs))
+        cls._pool_leases[key] = cls._pool_leases.get(key, 0) + 1
+        rejected = False
+        try:
+            yield connector
+        except Exception as e:
+            rejected = key not in cls._pool_verified and _is_auth_error(e)
+            raise
+        else:
+            cls._pool_verified.add(key)
+        finally:
+            remaining = cls._pool_leases.pop(key, 1) - 1
+            if remaining:
+                cls._pool_leases[key] = remaining
+            if cls._pool.get(key) is connector:
+                cls._pool_last_used[key] = time.monotonic()
+                if rejected and not remaining:
+                    await cls._discard(key)
+
+    @classmethod
+    async def evict_idle(cls, max_idle: Optional[float] = None) -> int:
+        """Close pooled instances unused for `max_idle` seconds (never leased ones)"""
+        max_idle = cls.pool_idle_ttl if max_idle is None else max_idle
+        cutoff = time.monotonic() - max_idle
+        stale = [
+            key
+            for key, used in cls._pool_last_used.items()
+            if used < cutoff and not cls._pool_leases.get(key)
+        ]
+        for key in stale:
+            await cls._discard(key)
+        return len(stale)
+
+    @classmethod
+    async def _evict_lru(cls, keep: Tuple[str, str]) -> None:
+        """Close least recently used unleased instances until the pool fits its cap"""
+        candidates = sorted(
+            (k for k in cls._pool if k != keep and not cls._pool_leases.get(k)),
+            key=lambda k: cls._pool_last_used.get(k, 0.0),
+        )
+        for key in candidates[: len(cls._pool) - cls.pool_max_size]:
+            await cls._discard(key)
+
+    @classmethod
+    async def _discard(cls, key: Tuple[str, str]) -> None:
+        connector = cls._pool.pop(key, None)
+        cls._pool_last_used.pop(key, None)
+        cls._pool_verified.discard(key)
+        if connector is not None:
+            with suppress(Exception):
+                await connector.close()
+
+    @classmethod
+    async def close_pooled(cls) -> None:
+        """Close every pooled instance (call from the app lifespan on shutdown)"""
+        pooled = list(cls._pool.values())
+        cls._pool.clear()
+        cls._pool_last_used.clear()
+        cls._pool_verified.clear()
+        for connector in pooled:
+            try:
+                await connector.close()
+            except Exception:
+                pass
+
+    @classmethod
+    def pool_status(cls) -> List[dict]:
+        """Pooled instances (without credentials), their idle time and open leases"""
+        now = time.monotonic()
+        return [
+            {
+                "connector": connector_id,
+                "credentials": digest,
+                "idle_s": round(now - used, 1),
+                "leases": cls._pool_leases.get((connector_id, digest), 0),
+            }
+            for (connector_id, digest), used in cls._pool_last_used.items()
+        ]
+
     @classmethod
     def list_all(cls) -> List[dict]:
         """
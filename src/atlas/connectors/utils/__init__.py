@@ -1,5 +1,16 @@
 # Connector utilities
+from atlas.connectors.utils.concurrency import as_completed_bounded, chunked
 from atlas.connectors.utils.rate_limiter import RateLimiter
-from atlas.connectors.utils.transforms import FieldTransformer
+from atlas.connectors.utils.sync_bridge import iter_sync, run_sync
+from atlas.connectors.utils.transforms import FieldMapper, FieldTransformer, MappingPlan
 
-__all__ = ["RateLimiter", "FieldTransformer"]
+__all__ = [
+    "RateLimiter",
+    "FieldTransformer",
+    "FieldMapper",
+    "MappingPlan",
+    "as_completed_bounded",
+    "chunked",
+    "run_sync",
+    "iter_sync",
+]
@@ -0,0 +1,58 @@
+# src/atlas/connectors/utils/checkpoint.py
+"""
+Append-only progress file for resumable batch operations.
+
+Each completed key is written as one JSON line as soon as it succeeds, so a
+batch that dies halfway (crash, deploy, provider outage) can be re-run with the
+same checkpoint and only repeats the keys that never completed.
+"""
+
+import json
+import os
+from typing import Set
+
+
+class BatchCheckpoint:
+    """
+    Set of completed keys backed by a JSONL file.
+
+    Usage:
+        checkpoint = BatchCheckpoint("/tmp/campaign_123.jsonl")
+        for key in keys:
+            if key in checkpoint:
+                continue
+            ...
+            checkpoint.record(key)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[str] = set()
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self.done.add(json.loads(line)["key"])
+                    except (ValueError, KeyError):
+                        continue  # torn last line from an interrupted write
+
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.done
+
+    def record(self, key: str) -> None:
+        """Mark `key` completed (flushed immediately)"""
+        if key in self.done:
+            return
+        self.done.add(key)
+        self._file.write(json.dumps({"key": key}) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
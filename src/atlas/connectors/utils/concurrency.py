@@ -0,0 +1,98 @@
+# src/atlas/connectors/utils/concurrency.py
+"""
+Bounded fan-out helpers for batch connector operations.
+"""
+
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+# (input item, result or None, exception or None)
+Outcome = Tuple[T, Any, Optional[BaseException]]
+
+
+async def as_completed_bounded(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[Any]],
+    concurrency: int = 5,
+) -> AsyncIterator[Outcome]:
+    """
+    Run `worker(item)` for every item with at most `concurrency` calls in flight.
+
+    Yields (item, result, error) as each call finishes, so callers can stream
+    partial results. A failing item is reported with its exception instead of
+    aborting the batch. Tasks are created lazily, so large inputs don't spawn
+    one task per item up front.
+    """
+    it = iter(items)
+    pending: dict = {}
+
+    async def run(item: T) -> Outcome:
+        try:
+            return item, await worker(item), None
+        except Exception as e:
+            return item, None, e
+
+    def fill() -> None:
+        while len(pending) < max(1, concurrency):
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+            pending[asyncio.ensure_future(run(item))] = item
+
+    fill()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                del pending[task]
+                yield task.result()
+            fill()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def chunked(items: list, size: int) -> Iterable[list]:
+    """Split a list into consecutive slices of at most `size` items."""
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def distinct_keys(values: List[str]) -> List[str]:
+    """Normalized, de-duplicated lookup keys in input order"""
+    seen = set()
+    out = []
+    for value in values:
+        key = (value or "").strip().lower()
+        if key and key not in seen:
+            seen.add(key)
+            out.append(key)
+    return out
+
+
+def batch_result(
+    key: str,
+    result: Optional[Dict[str, Any]],
+    error: Optional[BaseException] = None,
+) -> Dict[str, Any]:
+    """One line of a batch operation's output"""
+    return {
+        "input": key,
+        "found": result is not None,
+        "result": result,
+        "error": str(error) if error else None,
+    }
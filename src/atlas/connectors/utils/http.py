@@ -0,0 +1,156 @@
+# src/atlas/connectors/utils/http.py
+"""
+Shared HTTP plumbing for connectors.
+
+`AdaptiveTransport` wraps httpx's transport and feeds the provider's own signals
+back into the connector's RateLimiter:
+- 429 → halve the effective limit and pause for Retry-After
+- X-RateLimit-Remaining: 0 → pause until the advertised reset
+- success → creep the limit back up (AIMD)
+It also retries 429 and transient 5xx responses with jittered exponential
+backoff, taking a fresh rate limiter token before every retry.
+"""
+
+import asyncio
+import math
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+import httpx
+
+from atlas.connectors.utils.rate_limiter import RateLimiter, RateLimitExceeded
+
+# Header spellings used by the providers we talk to
+REMAINING_HEADERS = (
+    "x-ratelimit-remaining",
+    "x-rate-limit-remaining",
+    "ratelimit-remaining",
+    "x-minute-requests-left",
+)
+RESET_HEADERS = ("x-ratelimit-reset", "x-rate-limit-reset", "ratelimit-reset")
+
+# 503 means the request was not processed, so it is safe to retry any method
+RETRY_ANY_METHOD = {429, 503}
+RETRY_IDEMPOTENT = {500, 502, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+def _first_number(headers: httpx.Headers, names: tuple) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value.split(",")[0].strip())
+        except ValueError:
+            continue
+    return None
+
+
+def parse_retry_after(headers: httpx.Headers) -> Optional[float]:
+    """Retry-After as seconds (accepts delta-seconds or an HTTP date)."""
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_reset(headers: httpx.Headers) -> Optional[float]:
+    """Seconds until the quota resets (header may be a delta or an epoch time)."""
+    reset = _first_number(headers, RESET_HEADERS)
+    if reset is None:
+        return None
+    if reset > 1_000_000_000:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+class AdaptiveTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that adapts a RateLimiter to provider feedback.
+
+    Connectors that already call `rate_limiter.wait_and_acquire()` before each
+    request leave `acquire=False`; connectors without explicit limiting (e.g.
+    lemlist) set `acquire=True` so every request takes a token here.
+    Either way no request is sent while the limiter is paused; a pause or
+    Retry-After longer than the limiter's max wait / `backoff_cap` raises
+    RateLimitExceeded instead of blocking.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        acquire: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.acquire = acquire
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        # Full jitter; never earlier than the server asked for
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))
+        return max(delay, retry_after or 0.0)
+
+    def _retryable(self, request: httpx.Request, status: int) -> bool:
+        if status in RETRY_ANY_METHOD:
+            return True
+        return status in RETRY_IDEMPOTENT and request.method in IDEMPOTENT_METHODS
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            # Both raise RateLimitExceeded rather than send into a long pause
+            if self.acquire or attempt:
+                await self.rate_limiter.wait_and_acquire()
+            else:
+                await self.rate_limiter.wait_until_resumed()
+
+            response = await self.transport.handle_async_request(request)
+            status = response.status_code
+            self.rate_limiter.observe(
+                _first_number(response.headers, REMAINING_HEADERS), parse_reset(response.headers)
+            )
+
+            if status == 429:
+                retry_after = parse_retry_after(response.headers)
+                self.rate_limiter.on_throttled(retry_after)
+            elif status < 400:
+                self.rate_limiter.on_success()
+                return response
+
+            if not self._retryable(request, status) or attempt >= self.max_retries:
+                return response
+
+            await response.aclose()
+            delay = self._backoff(attempt, parse_retry_after(response.headers))
+            if delay > self.backoff_cap:
+                # Server wants a longer break than a request should block for
+                raise RateLimitExceeded(self.rate_limiter.connector_id, math.ceil(delay))
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def make_client(
+    rate_limiter: RateLimiter, acquire: bool = False, **kwargs: Any
+) -> httpx.AsyncClient:
+    """httpx.AsyncClient for a connector, with the adaptive transport installed."""
+    return httpx.AsyncClient(transport=AdaptiveTransport(rate_limiter, acquire=acquire), **kwargs)
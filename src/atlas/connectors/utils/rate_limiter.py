@@ -2,20 +2,71 @@
 """
 Rate limiting utilities for API connectors.
 
-Implements token bucket algorithm with Redis backend for distributed rate limiting.
+Implements a token bucket with an optional Redis backend for distributed rate
+limiting. Against Redis the refill-check-take step is a single Lua script, so any
+number of workers sharing a connector id together stay at the provider limit.
+
+The effective limit adapts AIMD-style to what the provider reports (see
+connectors.utils.http.AdaptiveTransport): it creeps up towards `max_limit` while
+responses succeed and halves on every 429, pausing for the Retry-After period.
 """
 
 import asyncio
+import logging
+import math
 import time
 from typing import Optional
 import os
 
 try:
-    import redis
+    import redis.asyncio as aioredis
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Seconds a limiter uses its local bucket after a Redis failure before retrying
+REDIS_RETRY_AFTER = 30.0
+
+
+# KEYS[1] bucket hash; ARGV: rate (tokens/s), capacity, cost, reserve (0/1)
+# Returns {granted (0/1), wait_ms until `cost` tokens are available, tokens left}
+# With reserve=1 the tokens are always taken, the bucket may go negative, and
+# wait_ms is how long the caller must wait before using them (FIFO queueing).
+TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local granted = 0
+local wait_ms = 0
+if ARGV[4] == '1' then
+  tokens = tokens - cost
+  granted = 1
+  wait_ms = math.ceil(math.max(0, -tokens) / rate * 1000)
+elseif tokens >= cost then
+  tokens = tokens - cost
+  granted = 1
+else
+  wait_ms = math.ceil((cost - tokens) / rate * 1000)
+end
+
+-- Expire once refilled to capacity (a missing key reads as a full bucket)
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+return {granted, wait_ms, tostring(tokens)}
+"""
+
 
 class RateLimiter:
     """
@@ -23,9 +74,12 @@ class RateLimiter:
 
     Supports:
     - Per-connector rate limiting
-    - Distributed rate limiting via Redis
+    - Distributed rate limiting via Redis (atomic Lua check-and-take)
     - Fallback to in-memory limiting
-    - Automatic retry with backoff
+    - Weighted costs and a configurable burst capacity
+    - Waiters reserve their tokens up front and sleep exactly until they are
+      due, so queued callers are served in order and pacing never fails
+    - Adaptive limit (on_success / on_throttled / observe)
     """
 
     def __init__(
@@ -33,7 +87,9 @@ class RateLimiter:
         connector_id: str,
         limit: int,
         window: int = 60,
-        redis_url: Optional[str] = None
+        redis_url: Optional[str] = None,
+        burst: Optional[int] = None,
+        max_limit: Optional[int] = None,
     ):
         """
         Initialize rate limiter.
@@ -43,38 +99,132 @@ class RateLimiter:
             limit: Maximum requests per window
             window: Window size in seconds (default 60)
             redis_url: Redis URL for distributed limiting (optional)
+            burst: Bucket capacity, i.e. max requests at once (default: limit)
+            max_limit: Ceiling the adaptive limit may probe up to (default: 2x limit)
         """
         self.connector_id = connector_id
         self.limit = limit
         self.window = window
+        self.capacity = burst or limit
+
+        # Adaptive control: limit moves between min_limit and max_limit
+        self.base_limit = limit
+        self.max_limit = max_limit or limit * 2
+        self.min_limit = max(1, limit / 10)
+        self.increase_step = max(limit * 0.05, 0.1)
+        self.decrease_factor = 0.5
+        self._paused_until = 0.0
+        self.throttled_count = 0
+
         self.redis_url = redis_url or os.getenv("REDIS_URL")
 
-        # In-memory fallback
-        self._tokens = limit
-        self._last_update = time.time()
+        # Optional key suffix, e.g. a credentials hash for per-tenant buckets
+        self.scope: Optional[str] = None
+
+        # In-memory bucket (also the fallback when Redis is unreachable)
+        self._tokens = float(self.capacity)
+        self._last_update = time.monotonic()
 
-        # Redis client
-        self._redis: Optional["redis.Redis"] = None
-        if REDIS_AVAILABLE and self.redis_url:
-            try:
-                self._redis = redis.from_url(self.redis_url)
-                self._redis.ping()
-            except Exception:
-                self._redis = None
+        # Redis client, created on first use (it binds to the running loop)
+        self._redis = None
+        self._script = None
+        self._redis_retry_at = 0.0  # monotonic; > 0 while Redis is considered down
+        self._last_remaining: Optional[float] = None
 
     @property
     def _key(self) -> str:
         """Redis key for this rate limiter"""
+        if self.scope:
+            return f"rate_limit:{self.connector_id}:{self.scope}"
         return f"rate_limit:{self.connector_id}"
 
+    @property
+    def rate(self) -> float:
+        """Refill rate in tokens per second"""
+        return self.limit / self.window if self.window else 0.0
+
+    @property
+    def unlimited(self) -> bool:
+        return self.limit <= 0 or self.window <= 0
+
+    def _check_cost(self, tokens: int) -> None:
+        if tokens > self.capacity:
+            raise ValueError(
+                f"cost {tokens} exceeds burst capacity {self.capacity} for {self.connector_id}"
+            )
+
     def _refill_tokens(self):
         """Refill tokens based on elapsed time (in-memory)"""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self._last_update
-        refill = int(elapsed * self.limit / self.window)
-        self._tokens = min(self.limit, self._tokens + refill)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
         self._last_update = now
 
+    def _take_memory(self, tokens: int) -> float:
+        """Take tokens if available; otherwise return seconds until they will be."""
+        self._refill_tokens()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+    def _reserve_memory(self, tokens: int) -> float:
+        """Take tokens now, into debt if needed; return seconds until they are due."""
+        self._refill_tokens()
+        self._tokens -= tokens
+        return max(0.0, -self._tokens / self.rate)
+
+    async def _take_redis(self, tokens: int, reserve: bool = False) -> Optional[float]:
+        """Atomic take (or reserve) against Redis; None if Redis is unavailable."""
+        if not (REDIS_AVAILABLE and self.redis_url) or time.monotonic() < self._redis_retry_at:
+            return None
+        try:
+            if self._redis is None:
+                self._redis = aioredis.from_url(self.redis_url)
+                self._script = self._redis.register_script(TOKEN_BUCKET_LUA)
+            _, wait_ms, remaining = await self._script(
+                keys=[self._key], args=[self.rate, self.capacity, tokens, int(reserve)]
+            )
+            self._last_remaining = float(remaining)
+            if self._redis_retry_at:
+                logger.info("Rate limiter %s: Redis reachable again", self.connector_id)
+                self._redis_retry_at = 0.0
+            # 0 when taken; otherwise (or for a reservation) time until due
+            return int(wait_ms) / 1000
+        except Exception as e:
+            # Local bucket meanwhile (per worker, so the shared limit is not
+            # enforced); probe Redis again after a backoff
+            logger.warning(
+                "Rate limiter %s: Redis unavailable (%s); local limiting for %.0fs",
+                self.connector_id, e, REDIS_RETRY_AFTER,
+            )
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_AFTER
+            client, self._redis = self._redis, None
+            if client is not None:
+                try:
+                    await client.aclose()
+                except Exception:
+                    pass
+            return None
+
+    async def try_acquire(self, tokens: int = 1) -> float:
+        """
+        Take `tokens` if available.
+
+        Returns:
+            0.0 if taken, otherwise seconds until enough tokens will be available
+        """
+        if self.unlimited:
+            return 0.0
+        self._check_cost(tokens)
+        paused = self.paused_for
+        if paused > 0:
+            return paused
+        wait = await self._take_redis(tokens)
+        if wait is None:
+            wait = self._take_memory(tokens)
+        return wait
+
     async def acquire(self, tokens: int = 1) -> bool:
         """
         Acquire tokens for a request.
@@ -85,72 +235,86 @@ class RateLimiter:
         Returns:
             True if tokens acquired, False if rate limited
         """
-        if self._redis:
-            return await self._acquire_redis(tokens)
-        return await self._acquire_memory(tokens)
-
-    async def _acquire_memory(self, tokens: int = 1) -> bool:
-        """In-memory token acquisition"""
-        self._refill_tokens()
-        if self._tokens >= tokens:
-            self._tokens -= tokens
-            return True
-        return False
-
-    async def _acquire_redis(self, tokens: int = 1) -> bool:
-        """Redis-based token acquisition using sliding window"""
-        if not self._redis:
-            return await self._acquire_memory(tokens)
-
-        try:
-            now = time.time()
-            pipe = self._redis.pipeline()
-
-            # Remove old entries outside the window
-            pipe.zremrangebyscore(self._key, 0, now - self.window)
+        return await self.try_acquire(tokens) == 0.0
 
-            # Count current requests in window
-            pipe.zcard(self._key)
+    async def wait_and_acquire(self, tokens: int = 1, max_wait: float = 30.0) -> bool:
+        """
+        Wait for tokens to become available.
 
-            # Add current request
-            pipe.zadd(self._key, {str(now): now})
+        The tokens are reserved right away (the bucket may go into debt) and the
+        caller sleeps until they are due, so waiters are served first come,
+        first served and pacing by our own limit never fails. Only a
+        provider-requested pause (429 Retry-After, quota reset) is bounded by
+        `max_wait`.
 
-            # Set expiry on the key
-            pipe.expire(self._key, self.window + 1)
+        Args:
+            tokens: Number of tokens to acquire
+            max_wait: Maximum seconds to wait out a provider-requested pause
 
-            results = pipe.execute()
-            current_count = results[1]
+        Returns:
+            True once the tokens are acquired
 
-            if current_count < self.limit:
-                return True
+        Raises:
+            RateLimitExceeded: if a provider pause outlasts `max_wait`
+        """
+        await self.wait_until_resumed(max_wait)
+        if self.unlimited:
+            return True
+        self._check_cost(tokens)
 
-            # Over limit, remove the request we just added
-            self._redis.zrem(self._key, str(now))
-            return False
+        wait = await self._take_redis(tokens, reserve=True)
+        if wait is None:
+            wait = self._reserve_memory(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+            # A pause that began while we queued still applies
+            await self.wait_until_resumed(max_wait)
+        return True
 
-        except Exception:
-            # Fallback to memory on Redis error
-            return await self._acquire_memory(tokens)
+    @property
+    def paused_for(self) -> float:
+        """Seconds left of a provider-requested pause (0 if none)"""
+        return max(0.0, self._paused_until - time.monotonic())
 
-    async def wait_and_acquire(self, tokens: int = 1, max_wait: float = 30.0) -> bool:
+    async def wait_until_resumed(self, max_wait: float = 30.0) -> None:
         """
-        Wait for tokens to become available.
-
-        Args:
-            tokens: Number of tokens to acquire
-            max_wait: Maximum seconds to wait
+        Sleep out a pause without taking a token.
 
-        Returns:
-            True if tokens acquired within timeout, False otherwise
+        Raises:
+            RateLimitExceeded: if the pause lasts longer than `max_wait`
         """
-        start = time.time()
-        while time.time() - start < max_wait:
-            if await self.acquire(tokens):
-                return True
-            # Wait before retry (exponential backoff)
-            wait_time = min(1.0, (time.time() - start) / 10 + 0.1)
-            await asyncio.sleep(wait_time)
-        return False
+        deadline = time.monotonic() + max_wait
+        while (paused := self.paused_for) > 0:
+            if time.monotonic() + paused > deadline:
+                raise RateLimitExceeded(self.connector_id, math.ceil(paused))
+            await asyncio.sleep(paused)
+
+    # ─────────────────────────────────────────────────────────────
+    # Adaptive control
+    # ─────────────────────────────────────────────────────────────
+
+    def on_success(self) -> None:
+        """Additive increase after a successful response (not while paused)"""
+        if not self.unlimited and not self.paused_for:
+            self.limit = min(self.max_limit, self.limit + self.increase_step)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicative decrease after a 429, plus a pause for Retry-After"""
+        if self.unlimited:
+            return
+        self.throttled_count += 1
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        self.pause(retry_after if retry_after is not None else 1 / self.rate)
+
+    def observe(self, remaining: Optional[float], reset_in: Optional[float]) -> None:
+        """Provider says the quota is used up: hold off until it resets"""
+        if remaining is not None and remaining <= 0 and reset_in:
+            self.pause(reset_in)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds` (local to this process)"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = min(self._tokens, 0.0)
 
     def get_status(self) -> dict:
         """
@@ -159,29 +323,32 @@ class RateLimiter:
         Returns:
             Dict with limit, remaining, reset_in
         """
-        if self._redis:
-            try:
-                now = time.time()
-                self._redis.zremrangebyscore(self._key, 0, now - self.window)
-                current = self._redis.zcard(self._key)
-                return {
-                    "limit": self.limit,
-                    "remaining": max(0, self.limit - current),
-                    "reset_in": self.window,
-                    "window": self.window,
-                }
-            except Exception:
-                pass
-
-        # In-memory status
-        self._refill_tokens()
+        if self._redis is not None and self._last_remaining is not None:
+            remaining = self._last_remaining
+        else:
+            self._refill_tokens()
+            remaining = self._tokens
+
+        reset_in = (self.capacity - remaining) / self.rate if self.rate else 0
         return {
-            "limit": self.limit,
-            "remaining": self._tokens,
-            "reset_in": self.window,
+            "limit": round(self.limit, 2),
+            "remaining": max(0, math.floor(remaining)),
+            "reset_in": math.ceil(reset_in),
             "window": self.window,
+            "burst": self.capacity,
+            "backend": "redis" if self._redis is not None else "memory",
+            "configured_limit": self.base_limit,
+            "effective_rate_per_sec": round(self.rate, 3),
+            "paused_for": round(self.paused_for, 1),
+            "throttled": self.throttled_count,
         }
 
+    async def close(self):
+        """Release the Redis connection pool, if any"""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
 
 class RateLimitExceeded(Exception):
     """Raised when rate limit is exceeded"""
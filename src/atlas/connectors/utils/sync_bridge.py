@@ -0,0 +1,87 @@
+# src/atlas/connectors/utils/sync_bridge.py
+"""
+Sync bridge for async connectors.
+
+Sync callers (CLI, IngestionPipeline, scripts) used to drive connectors with
+`asyncio.get_event_loop().run_until_complete`, which raises inside a running
+loop (FastAPI, Jupyter) and gives every call fresh loop state. Instead, all sync
+calls are submitted to one long-lived event loop running in a daemon thread:
+httpx clients stay bound to that loop and keep their connection pools, and
+several threads can have calls in flight at once.
+
+A connector instance driven through the bridge should stay on it; httpx pools
+are tied to the loop that first used them.
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """An event loop running forever in its own daemon thread."""
+
+    def __init__(self, name: str = "atlas-connectors"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the background loop and block for its result."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("run() called from the bridge loop itself; await instead")
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, agen: AsyncIterator[T]) -> Iterator[T]:
+        """Consume an async iterator from sync code, one item per round trip."""
+        try:
+            while True:
+                try:
+                    yield self.run(agen.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            aclose = getattr(agen, "aclose", None)
+            if aclose and self.loop.is_running():
+                self.run(aclose())
+
+    def stop(self) -> None:
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=5)
+
+
+_loop: Optional[BackgroundLoop] = None
+_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Process-wide bridge loop (started on first use)."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = BackgroundLoop()
+            atexit.register(_loop.stop)
+        return _loop
+
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine from sync code, whether or not a loop is running here."""
+    return get_background_loop().run(coro, timeout)
+
+
+def iter_sync(agen: AsyncIterator[Any]) -> Iterator[Any]:
+    """Iterate an async generator from sync code."""
+    return get_background_loop().iterate(agen)
@@ -8,10 +8,13 @@ Supports various transformations:
 - Regex extraction
 - Default values
 - Lookup tables
+
+Mapping configs can be compiled once into a MappingPlan (pre-split source
+paths, transform callables bound to their config) and applied to many records.
 """
 
 import re
-from typing import Any, Optional, Dict, List, Callable
+from typing import Any, Optional, Dict, List, Callable, Tuple, Union
 
 
 class FieldTransformer:
@@ -38,26 +41,69 @@ class FieldTransformer:
         Returns:
             Transformed value
         """
+        transformer = TRANSFORMERS.get(transform_type, _identity)
+        return transformer(value, config or {})
+
+    @staticmethod
+    def transform_series(
+        series: Any,
+        transform_type: str,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Apply a transformation to a whole pandas Series of strings at once.
+
+        The standard cleaning transforms run as vectorized pandas string
+        operations; other types fall back to `transform` per element. Missing
+        values stay missing (NA).
+
+        Args:
+            series: pandas Series with str values (or NA)
+            transform_type: Type of transformation
+            config: Optional configuration for the transform
+
+        Returns:
+            Transformed Series
+        """
+        import numpy as np
+        import pandas as pd
+
         config = config or {}
 
-        transformers = {
-            "none": lambda v, c: v,
-            "lowercase": lambda v, c: v.lower() if isinstance(v, str) else v,
-            "uppercase": lambda v, c: v.upper() if isinstance(v, str) else v,
-            "trim": lambda v, c: v.strip() if isinstance(v, str) else v,
-            "regex": FieldTransformer._regex_extract,
-            "default": FieldTransformer._default_value,
-            "lookup": FieldTransformer._lookup,
-            "split": FieldTransformer._split,
-            "join": FieldTransformer._join,
-            "to_int": FieldTransformer._to_int,
-            "to_float": FieldTransformer._to_float,
-            "clean_domain": FieldTransformer._clean_domain,
-            "clean_phone": FieldTransformer._clean_phone,
-        }
-
-        transformer = transformers.get(transform_type, lambda v, c: v)
-        return transformer(value, config)
+        if transform_type == "none":
+            return series
+        if transform_type == "lowercase":
+            return series.str.lower()
+        if transform_type == "uppercase":
+            return series.str.upper()
+        if transform_type == "trim":
+            return series.str.strip()
+        if transform_type == "clean_domain":
+            domain = (
+                series.str.lower()
+                .str.strip()
+                .str.replace(r"^(?:https://)?(?:http://)?(?:www\.)?", "", regex=True)
+                .str.split(r"[/?]", n=1, regex=True)
+                .str[0]
+            )
+            return domain.mask(domain == "")
+        if transform_type == "clean_phone":
+            if config.get("keep_format", False):
+                return series.str.replace(r"[^\d\s\-+()]", "", regex=True).str.strip()
+            digits = series.str.replace(r"[^\d+]", "", regex=True)
+            return digits.mask(digits == "")
+        if transform_type in ("to_int", "to_float"):
+            numbers = pd.to_numeric(series.str.replace(",", "", regex=False), errors="coerce")
+            numbers = numbers.where(np.isfinite(numbers))
+            if transform_type == "to_int":
+                numbers = np.trunc(numbers).astype("Int64")
+            if config.get("default") is not None:
+                numbers = numbers.fillna(config["default"])
+            return numbers
+
+        return series.map(
+            lambda v: FieldTransformer.transform(None if pd.isna(v) else v, transform_type, config)
+        )
 
     @staticmethod
     def _regex_extract(value: Any, config: Dict[str, Any]) -> Any:
@@ -170,9 +216,143 @@ class FieldTransformer:
             return digits if digits else None
 
 
+def _identity(value: Any, config: Dict[str, Any]) -> Any:
+    return value
+
+
+# Transform type -> callable(value, config); built once, shared by all calls
+TRANSFORMERS: Dict[str, Callable[[Any, Dict[str, Any]], Any]] = {
+    "none": _identity,
+    "lowercase": lambda v, c: v.lower() if isinstance(v, str) else v,
+    "uppercase": lambda v, c: v.upper() if isinstance(v, str) else v,
+    "trim": lambda v, c: v.strip() if isinstance(v, str) else v,
+    "regex": FieldTransformer._regex_extract,
+    "default": FieldTransformer._default_value,
+    "lookup": FieldTransformer._lookup,
+    "split": FieldTransformer._split,
+    "join": FieldTransformer._join,
+    "to_int": FieldTransformer._to_int,
+    "to_float": FieldTransformer._to_float,
+    "clean_domain": FieldTransformer._clean_domain,
+    "clean_phone": FieldTransformer._clean_phone,
+}
+
+
+PathPart = Union[str, Tuple[str, int]]
+
+
+def _bind_config(
+    transformer: Callable[[Any, Dict[str, Any]], Any], config: Dict[str, Any]
+) -> Callable[[Any], Any]:
+    """transformer(value, config) as a one-argument transform"""
+    def transform(value: Any) -> Any:
+        return transformer(value, config)
+    return transform
+
+
+def compile_path(path: Optional[str]) -> Callable[[Any], Any]:
+    """
+    Getter for a dot-notation path, split once.
+
+    compile_path("organization.name")(record) is record["organization"]["name"],
+    or None where the path doesn't exist; digit parts also index into lists.
+    """
+    if not path:
+        return lambda data: None
+
+    parts: List[PathPart] = [
+        (part, int(part)) if part.isdigit() else part for part in path.split(".")
+    ]
+
+    if len(parts) == 1 and isinstance(parts[0], str):
+        key = parts[0]
+        return lambda data: data.get(key) if isinstance(data, dict) else None
+
+    def get(data: Any) -> Any:
+        value = data
+        for part in parts:
+            if isinstance(part, tuple):
+                key, idx = part
+                if isinstance(value, dict):
+                    value = value.get(key)
+                elif isinstance(value, list):
+                    value = value[idx] if idx < len(value) else None
+                else:
+                    return None
+            elif isinstance(value, dict):
+                value = value.get(part)
+            else:
+                return None
+        return value
+
+    return get
+
+
+class MappingPlan:
+    """
+    A field mapping compiled for repeated use.
+
+    Source paths are split and transform callables bound to their config once,
+    so applying the plan is a tight loop of getter + transform per field.
+
+    Usage:
+        plan = MappingPlan.compile(mappings)
+        target = plan.apply(record)
+        targets = plan.apply_many(records)
+    """
+
+    def __init__(self, steps: List[Tuple[str, Callable[[Any], Any], Optional[Callable[[Any], Any]]]]):
+        """
+        Args:
+            steps: (target_field, getter, transform or None) per mapped field
+        """
+        self.steps = steps
+
+    @classmethod
+    def compile(cls, mappings: List[Dict[str, Any]]) -> "MappingPlan":
+        """Compile mapping definitions (see FieldMapper) into a plan"""
+        steps = []
+        for mapping in mappings:
+            transform_type = mapping.get("transform_type", "none")
+            transformer = TRANSFORMERS.get(transform_type, _identity)
+            transform = None
+            if transformer is not _identity:
+                config = mapping.get("transform_config") or {}
+                transform = _bind_config(transformer, config)
+            steps.append((
+                mapping.get("target_field"),
+                compile_path(mapping.get("source_field")),
+                transform,
+            ))
+        return cls(steps)
+
+    def apply(self, source: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a single record"""
+        target = {}
+        for target_field, get, transform in self.steps:
+            value = get(source)
+            target[target_field] = value if transform is None else transform(value)
+        return target
+
+    def apply_many(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Map a batch of records"""
+        steps = self.steps
+        targets = []
+        append = targets.append
+        for source in sources:
+            target = {}
+            for target_field, get, transform in steps:
+                value = get(source)
+                target[target_field] = value if transform is None else transform(value)
+            append(target)
+        return targets
+
+
 class FieldMapper:
     """
     Map fields from source to target schema with transformations.
+
+    The mappings are compiled into a MappingPlan on construction.
     """
 
     def __init__(self, mappings: List[Dict[str, Any]]):
@@ -192,6 +372,7 @@ class FieldMapper:
                 ]
         """
         self.mappings = mappings
+        self.plan = MappingPlan.compile(mappings)
 
     def map_record(self, source: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -203,50 +384,16 @@ class FieldMapper:
         Returns:
             Mapped target record
         """
-        target = {}
-
-        for mapping in self.mappings:
-            source_field = mapping.get("source_field")
-            target_field = mapping.get("target_field")
-            transform_type = mapping.get("transform_type", "none")
-            transform_config = mapping.get("transform_config", {})
-
-            # Get source value (supports nested paths like "organization.name")
-            value = self._get_nested(source, source_field)
-
-            # Apply transformation
-            transformed = FieldTransformer.transform(
-                value, transform_type, transform_config
-            )
-
-            # Set target value
-            target[target_field] = transformed
-
-        return target
+        return self.plan.apply(source)
 
     def map_records(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Map multiple records"""
-        return [self.map_record(source) for source in sources]
+        return self.plan.apply_many(sources)
 
     @staticmethod
     def _get_nested(data: Dict[str, Any], path: str) -> Any:
         """Get value from nested dict using dot notation path"""
-        if not path:
-            return None
-
-        parts = path.split(".")
-        value = data
-
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            elif isinstance(value, list) and part.isdigit():
-                idx = int(part)
-                value = value[idx] if idx < len(value) else None
-            else:
-                return None
-
-        return value
+        return compile_path(path)(data)
 
 
 # Standard field mappings for common data sources
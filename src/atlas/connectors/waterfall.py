@@ -0,0 +1,320 @@
+# src/atlas/connectors/waterfall.py
+"""
+Enrichment waterfall - fill a company's fields from the cheapest sources first.
+
+Instead of calling every connector for every company, the waterfall tries
+sources in stages ordered by cost (then expected latency) and stops as soon as
+the requested fields are complete:
+
+    stage 0  kvk                 free registry data, needs kvk_number
+    stage 1  apollo, hunter      paid API credits, need domain (run in parallel)
+    stage 2  linkedin            Apify actor run, slow and billed per run
+
+Sources of equal cost form one stage and run in parallel; nothing is saved by
+waiting on one before the other. A source is skipped when it can't supply any
+still-missing field, or when its input key (domain, kvk_number, linkedin_url)
+isn't known yet; an earlier stage may fill that key (e.g. Apollo returns the
+LinkedIn URL the LinkedIn stage needs).
+
+Per-source calls, hit and fill rates and timings are recorded on the waterfall
+(`stats()`); within a stage, the source observed to be faster wins conflicting
+values.
+
+Usage:
+    waterfall = EnrichmentWaterfall({"apollo": {"api_key": ...}, "kvk": {"api_key": ...}})
+    company = await waterfall.enrich({"domain": "acme.nl"}, fields=["industry", "employee_count"])
+    async for line in waterfall.enrich_many(companies, fields=[...]):
+        ...
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from atlas.connectors.registry import BaseConnector, ConnectorRegistry
+from atlas.connectors.utils.concurrency import as_completed_bounded, batch_result
+
+Lookup = Callable[[BaseConnector, Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+@dataclass
+class WaterfallSource:
+    """One enrichment source in the waterfall"""
+
+    connector_id: str
+    provides: Tuple[str, ...]  # fields this source can fill
+    requires: Tuple[str, ...]  # entity keys it needs (any one of them)
+    lookup: Lookup  # (connector, entity) -> record or None
+    cost: float = 1.0  # relative cost per lookup (credits, billing)
+    latency: float = 1.0  # expected seconds per lookup
+
+    def can_run(self, entity: Dict[str, Any]) -> bool:
+        return any(_filled(entity.get(key)) for key in self.requires)
+
+
+@dataclass
+class SourceStats:
+    """Running counters for one source"""
+
+    calls: int = 0
+    hits: int = 0
+    errors: int = 0
+    skipped: int = 0
+    fields_filled: int = 0
+    total_seconds: float = 0.0
+    observed_latency: Optional[float] = None  # EWMA of lookup time
+
+    def record(self, seconds: float, filled: int, hit: bool, error: bool) -> None:
+        self.calls += 1
+        self.hits += hit
+        self.errors += error
+        self.fields_filled += filled
+        self.total_seconds += seconds
+        if self.observed_latency is None:
+            self.observed_latency = seconds
+        else:
+            self.observed_latency = 0.8 * self.observed_latency + 0.2 * seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "errors": self.errors,
+            "skipped": self.skipped,
+            "hit_rate": round(self.hits / self.calls, 3) if self.calls else None,
+            "fields_per_call": round(self.fields_filled / self.calls, 2) if self.calls else None,
+            "avg_ms": round(self.total_seconds / self.calls * 1000) if self.calls else None,
+        }
+
+
+def _filled(value: Any) -> bool:
+    return value not in (None, "", [], {})
+
+
+async def _linkedin_lookup(connector: BaseConnector, entity: Dict[str, Any]):
+    if _filled(entity.get("linkedin_url")):
+        return await connector.enrich_company(entity["linkedin_url"])
+    return await connector.enrich_by_domain(entity["domain"])
+
+
+async def _hunter_lookup(connector: BaseConnector, entity: Dict[str, Any]):
+    pattern = await connector.get_email_pattern(entity["domain"])
+    if not pattern.get("pattern") and not pattern.get("organization"):
+        return None
+    return {"email_pattern": pattern.get("pattern"), "name": pattern.get("organization")}
+
+
+DEFAULT_SOURCES: List[WaterfallSource] = [
+    WaterfallSource(
+        connector_id="kvk",
+        provides=(
+            "name",
+            "legal_form",
+            "industry",
+            "industries",
+            "sbi_codes",
+            "employee_count",
+            "founding_date",
+            "address",
+            "website",
+            "phone",
+            "email",
+            "locations",
+        ),
+        requires=("kvk_number",),
+        lookup=lambda c, e: c.enrich_company(e["kvk_number"]),
+        cost=0.0,
+        latency=0.5,
+    ),
+    WaterfallSource(
+        connector_id="apollo",
+        provides=(
+            "name",
+            "domain",
+            "website",
+            "industry",
+            "employee_count",
+            "employee_range",
+            "annual_revenue",
+            "revenue_range",
+            "founded_year",
+            "linkedin_url",
+            "phone",
+            "address",
+            "city",
+            "country",
+            "description",
+            "keywords",
+            "technologies",
+        ),
+        requires=("domain",),
+        lookup=lambda c, e: c.enrich_company(e["domain"]),
+        cost=1.0,
+        latency=1.0,
+    ),
+    WaterfallSource(
+        connector_id="hunter",
+        provides=("email_pattern", "name"),
+        requires=("domain",),
+        lookup=_hunter_lookup,
+        cost=1.0,
+        latency=1.0,
+    ),
+    WaterfallSource(
+        connector_id="linkedin",
+        provides=(
+            "name",
+            "linkedin_url",
+            "description",
+            "website",
+            "industry",
+            "company_size",
+            "employee_range",
+            "headquarters",
+            "founded_year",
+            "specialties",
+            "followers",
+        ),
+        requires=("linkedin_url", "domain"),
+        lookup=_linkedin_lookup,
+        cost=5.0,
+        latency=30.0,
+    ),
+]
+
+
+class EnrichmentWaterfall:
+    """
+    Cost- and latency-ordered enrichment across registered connectors.
+
+    Args:
+        credentials: Auth kwargs per connector id; sources without credentials
+            are left out (connectors are leased from ConnectorRegistry.lease)
+        sources: Source definitions (default: DEFAULT_SOURCES)
+        timeout: Seconds before a single lookup is abandoned
+    """
+
+    def __init__(
+        self,
+        credentials: Dict[str, Dict[str, Any]],
+        sources: Optional[List[WaterfallSource]] = None,
+        timeout: float = 120.0,
+    ):
+        self.credentials = credentials
+        self.sources = [s for s in (sources or DEFAULT_SOURCES) if s.connector_id in credentials]
+        self.timeout = timeout
+        self._stats: Dict[str, SourceStats] = {s.connector_id: SourceStats() for s in self.sources}
+
+    def stages(self) -> List[List[WaterfallSource]]:
+        """Sources grouped by cost, cheapest first; observed latency breaks ties"""
+
+        def latency(source: WaterfallSource) -> float:
+            observed = self._stats[source.connector_id].observed_latency
+            return observed if observed is not None else source.latency
+
+        ordered = sorted(self.sources, key=lambda s: (s.cost, latency(s)))
+        stages: List[List[WaterfallSource]] = []
+        for source in ordered:
+            if stages and stages[-1][0].cost == source.cost:
+                stages[-1].append(source)
+            else:
+                stages.append([source])
+        return stages
+
+    async def enrich(
+        self,
+        entity: Dict[str, Any],
+        fields: Iterable[str],
+    ) -> Dict[str, Any]:
+        """
+        Fill `fields` on a copy of `entity`, stopping once all are present.
+
+        Returns:
+            The merged record, with "_sources" (field -> connector id that filled
+            it) and "_missing" (requested fields no source could fill)
+        """
+        record = dict(entity)
+        sources: Dict[str, str] = dict(record.get("_sources") or {})
+        wanted = list(fields)
+
+        for stage in self.stages():
+            missing = {f for f in wanted if not _filled(record.get(f))}
+            if not missing:
+                break
+
+            runnable = []
+            for source in stage:
+                if missing.isdisjoint(source.provides) or not source.can_run(record):
+                    self._stats[source.connector_id].skipped += 1
+                else:
+                    runnable.append(source)
+            if not runnable:
+                continue
+
+            results = await asyncio.gather(*(self._lookup(s, record) for s in runnable))
+
+            # Merge in stage order, so the cheaper / faster source wins ties
+            for source, (result, seconds, error) in zip(runnable, results, strict=True):
+                filled = 0
+                for key, value in (result or {}).items():
+                    if key.startswith("_") or not _filled(value) or _filled(record.get(key)):
+                        continue
+                    record[key] = value
+                    if key in missing:
+                        sources[key] = source.connector_id
+                        filled += 1
+                self._stats[source.connector_id].record(
+                    seconds, filled, hit=result is not None, error=error is not None
+                )
+
+        record["_sources"] = sources
+        record["_missing"] = [f for f in wanted if not _filled(record.get(f))]
+        return record
+
+    async def enrich_many(
+        self,
+        entities: List[Dict[str, Any]],
+        fields: Iterable[str],
+        concurrency: int = 5,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run the waterfall for many entities, `concurrency` at a time.
+
+        Yields:
+            {"input": index, "found": bool, "result": record|None, "error": str|None}
+            where found means every requested field was filled
+        """
+        wanted = list(fields)
+
+        async def run(index: int) -> Dict[str, Any]:
+            return await self.enrich(entities[index], wanted)
+
+        async for index, record, error in as_completed_bounded(
+            range(len(entities)), run, concurrency
+        ):
+            line = batch_result(index, record, error)
+            line["found"] = record is not None and not record["_missing"]
+            yield line
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source call counts, hit/fill rates and timings"""
+        return {source_id: s.to_dict() for source_id, s in self._stats.items()}
+
+    async def _lookup(
+        self,
+        source: WaterfallSource,
+        entity: Dict[str, Any],
+    ) -> Tuple[Optional[Dict[str, Any]], float, Optional[BaseException]]:
+        """(result, seconds, error) for one source; failures don't stop the waterfall"""
+        start = time.monotonic()
+        try:
+            async with ConnectorRegistry.lease(
+                source.connector_id, **self.credentials[source.connector_id]
+            ) as connector:
+                if connector is None:
+                    raise ValueError(f"Unknown connector: {source.connector_id}")
+                result = await asyncio.wait_for(source.lookup(connector, entity), self.timeout)
+            return result, time.monotonic() - start, None
+        except Exception as e:
+            return None, time.monotonic() - start, e
@@ -8,6 +8,7 @@ import argparse
 import json
 import os
 
+from atlas.etl.common.checkpoint import Checkpoint, DeadLetterStore, run_chunked
 from atlas.etl.common.idempotency import new_batch_id
 from atlas.etl.common.schema import Company
 from minio import Minio
@@ -38,7 +39,8 @@ MERGE (co:Company {id: c.id})
     co.industry=c.industry,
     co.employee_count=c.employee_count,
     co.location=c.location,
-    co.created_at=timestamp()
+    co.created_at=timestamp(),
+    co.updated_at=timestamp()
   ON MATCH  SET 
     co.name=c.name, 
     co.domain=c.domain, 
@@ -53,7 +55,8 @@ MERGE (pe:Person {id: p.id})
     pe.full_name=p.full_name, 
     pe.title=p.title, 
     pe.department=p.department,
-    pe.created_at=timestamp()
+    pe.created_at=timestamp(),
+    pe.updated_at=timestamp()
   ON MATCH  SET 
     pe.full_name=p.full_name, 
     pe.title=p.title, 
@@ -74,20 +77,35 @@ MERGE (pe)-[:HAS_EMAIL]->(e)
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--prefix", help="like apollo/raw/2025-10-26T14:22:11Z", required=True)
+    parser.add_argument("--chunk-size", type=int, default=500, help="Companies per transaction")
+    parser.add_argument("--restart", action="store_true", help="Ignore checkpoint, start over")
     args = parser.parse_args()
     bucket = os.getenv("MINIO_BUCKET", "datalake")
     mc = minio_client()
     # read one json file
-    data = read_json(mc, bucket, f"{args.prefix}/companies-00001.json")
-    companies = [Company(**c).model_dump() for c in data["companies"]]
-    batch_id = new_batch_id()
+    source = "companies-00001.json"
+    data = read_json(mc, bucket, f"{args.prefix}/{source}")
+    checkpoint = Checkpoint(mc, bucket, args.prefix, stage="graph", resume=not args.restart)
+    dead_letters = DeadLetterStore(mc, bucket, args.prefix, "graph", run_id=new_batch_id())
+    batch_id = checkpoint.batch_id
     uri = os.getenv("NEO4J_URI")
     user = os.getenv("NEO4J_USER")
     pwd = os.getenv("NEO4J_PASSWORD")
     driver = GraphDatabase.driver(uri, auth=(user, pwd))
-    with driver.session() as sess:
-        sess.execute_write(cypher_upsert, companies, batch_id)
-    print("ETL done, batch:", batch_id)
+
+    def write_chunk(chunk):
+        # validation errors fail the chunk, so bad records are isolated like write errors
+        companies = [Company(**c).model_dump() for c in chunk]
+        with driver.session() as sess:
+            sess.execute_write(cypher_upsert, companies, batch_id)
+
+    written, failed = run_chunked(
+        data["companies"], write_chunk, checkpoint, dead_letters, source, args.chunk_size
+    )
+    checkpoint.finish()
+    print(f"ETL done, batch: {batch_id} (written={written}, failed={failed})")
+    if failed:
+        print(f"Dead letters: s3://{bucket}/{dead_letters.key}")
 
 
 if __name__ == "__main__":
@@ -37,6 +37,14 @@ from minio import Minio
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, PointStruct, VectorParams
 
+from atlas.etl.common.checkpoint import (
+    Checkpoint,
+    DeadLetterStore,
+    is_internal_key,
+    run_chunked,
+)
+from atlas.etl.common.idempotency import new_batch_id
+
 # ----------------------------
 # Embedding backends
 # ----------------------------
@@ -79,8 +87,8 @@ class FastEmbedder(_BaseEmbedder):
         from fastembed import TextEmbedding
 
         self.model_name = model_name
-        self.embedding_dimension = self._emb.embedding_dimension
         self._emb = TextEmbedding(model_name=model_name)
+        self.embedding_dimension = self._emb.embedding_dimension
 
     def embed(self, texts: list[str]) -> list[list[float]]:
         # fastembed yields numpy arrays; convert to lists
@@ -138,7 +146,11 @@ def qdrant_client() -> QdrantClient:
 
 def list_json_keys(mc: Minio, bucket: str, prefix: str) -> list[str]:
     objs = mc.list_objects(bucket, prefix=prefix, recursive=True)
-    return [o.object_name for o in objs if o.object_name.endswith(".json")]
+    return [
+        o.object_name
+        for o in objs
+        if o.object_name.endswith(".json") and not is_internal_key(o.object_name)
+    ]
 
 
 def read_json(mc: Minio, bucket: str, key: str) -> dict:
@@ -206,37 +218,45 @@ def ensure_collection(client: QdrantClient, vector_size: int) -> None:
         )
 
 
+def company_entity(c: dict[str, Any]) -> Entity:
+    c_id = str(c["id"])
+    return Entity(
+        id=f"company:{c_id}",
+        text=build_company_text(c),
+        payload={
+            "type": "company",
+            "id": c_id,
+            "name": c.get("name"),
+            "domain": c.get("domain"),
+            "industry": c.get("industry"),
+            "employee_count": c.get("employee_count"),
+            "location": c.get("location"),
+        },
+    )
+
+
+def person_entity(p: dict[str, Any], company: dict[str, Any]) -> Entity:
+    p_id = str(p["id"])
+    return Entity(
+        id=f"person:{p_id}",
+        text=build_person_text(p, company),
+        payload={
+            "type": "person",
+            "id": p_id,
+            "full_name": p.get("full_name"),
+            "title": p.get("title"),
+            "department": p.get("department"),
+            "company_id": str(company["id"]) if company.get("id") else None,
+            "company_domain": company.get("domain"),
+        },
+    )
+
+
 def iter_entities(apollo_doc: dict[str, Any]) -> Iterable[Entity]:
     for c in apollo_doc.get("companies", []):
-        c_id = str(c["id"])
-        yield Entity(
-            id=f"company:{c_id}",
-            text=build_company_text(c),
-            payload={
-                "type": "company",
-                "id": c_id,
-                "name": c.get("name"),
-                "domain": c.get("domain"),
-                "industry": c.get("industry"),
-                "employee_count": c.get("employee_count"),
-                "location": c.get("location"),
-            },
-        )
+        yield company_entity(c)
         for p in c.get("people", []):
-            p_id = str(p["id"])
-            yield Entity(
-                id=f"person:{p_id}",
-                text=build_person_text(p, c),
-                payload={
-                    "type": "person",
-                    "id": p_id,
-                    "full_name": p.get("full_name"),
-                    "title": p.get("title"),
-                    "department": p.get("department"),
-                    "company_id": c_id,
-                    "company_domain": c.get("domain"),
-                },
-            )
+            yield person_entity(p, c)
 
 
 def _qdrant_point_id(raw: str) -> str:
@@ -247,6 +267,51 @@ def _qdrant_point_id(raw: str) -> str:
     return str(uuid5(_QDRANT_NS, raw))
 
 
+def _embed_with_fallback(
+    embedder: _BaseEmbedder, texts: list[str]
+) -> tuple[_BaseEmbedder, list[list[float]]]:
+    """Embed texts; if OpenAI fails, switch to FastEmbed and return the new embedder."""
+    try:
+        vectors = embedder.embed(texts)
+    except Exception as e:
+        # If OpenAI failed mid-run, fallback to FastEmbed for the rest
+        if isinstance(embedder, FastEmbedder):
+            raise
+        print(f"[embed] OpenAI failed ({e}); switching to FastEmbed for remaining batches.")
+        embedder = FastEmbedder(os.getenv("EMBED_MODEL", "BAAI/bge-small-en-v1.5"))
+        vectors = embedder.embed(texts)
+
+    if embedder.embedding_dimension is None and vectors:
+        embedder.embedding_dimension = len(vectors[0])
+    return embedder, vectors
+
+
+def upsert_chunk(
+    client: QdrantClient,
+    embedder: _BaseEmbedder,
+    chunk: list[Entity],
+    ensure: bool = False,
+) -> _BaseEmbedder:
+    """
+    Embed and upsert one chunk. Returns the embedder to use for the next chunk,
+    which differs from the input if we fell back to FastEmbed.
+    """
+    embedder, vectors = _embed_with_fallback(embedder, [e.text for e in chunk])
+    if ensure:
+        ensure_collection(client, embedder.embedding_dimension or len(vectors[0]))
+
+    points = [
+        PointStruct(
+            id=_qdrant_point_id(e.id),  # UUIDv5 ID
+            vector=v,
+            payload={**e.payload, "ext_id": e.id},  # keep original external id
+        )
+        for e, v in zip(chunk, vectors, strict=False)
+    ]
+    client.upsert(collection_name=COLLECTION, points=points, wait=True)
+    return embedder
+
+
 def upsert_entities(
     client: QdrantClient,
     embedder: _BaseEmbedder,
@@ -257,35 +322,36 @@ def upsert_entities(
     # Embed in batches to respect API limits (OpenAI) and keep RAM low (FastEmbed)
     for i in range(0, len(entities), batch_size):
         chunk = entities[i : i + batch_size]
-        texts = [e.text for e in chunk]
-        try:
-            vectors = embedder.embed(texts)  # type: ignore[assignment]
-        except Exception as e:
-            # If OpenAI failed mid-run, fallback to FastEmbed for the rest
-            if not isinstance(embedder, FastEmbedder):
-                print(f"[embed] OpenAI failed ({e}); switching to FastEmbed for remaining batches.")
-                embedder = FastEmbedder(os.getenv("EMBED_MODEL", "BAAI/bge-small-en-v1.5"))
-                vectors = embedder.embed(texts)
-            else:
-                raise
+        embedder = upsert_chunk(client, embedder, chunk, ensure=(i == 0))
+        total += len(chunk)
+    return total
 
-        if embedder.embedding_dimension is None and vectors:
-            embedder.embedding_dimension = len(vectors[0])
 
-        if i == 0:
-            ensure_collection(client, embedder.embedding_dimension or len(vectors[0]))
+def collect_entities(
+    doc: dict[str, Any],
+    source: str,
+    dead_letters: DeadLetterStore | None = None,
+    skip_invalid: bool = False,
+) -> list[Entity]:
+    """
+    Build entities company by company, so one malformed record (e.g. missing id)
+    is dead-lettered instead of aborting the file.
 
-        points = [
-            PointStruct(
-                id=_qdrant_point_id(e.id),  # UUIDv5 ID
-                vector=v,
-                payload={**e.payload, "ext_id": e.id},  # keep original external id
-            )
-            for e, v in zip(chunk, vectors, strict=False)
-        ]
-        client.upsert(collection_name=COLLECTION, points=points, wait=True)
-        total += len(points)
-    return total
+    With `skip_invalid`, malformed records are dropped without dead-lettering
+    (a resumed run: the interrupted run already recorded them). Without either,
+    the first one raises.
+    """
+    ents: list[Entity] = []
+    for i, c in enumerate(doc.get("companies", [])):
+        try:
+            ents.extend(iter_entities({"companies": [c]}))
+        except Exception as e:
+            if skip_invalid:
+                continue
+            if dead_letters is None:
+                raise
+            dead_letters.add(c, e, source, i)
+    return ents
 
 
 # ----------------------------
@@ -297,6 +363,8 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--prefix", required=True, help="like apollo/raw/2025-10-26T14:22:11Z")
     parser.add_argument("--bucket", default=os.getenv("MINIO_BUCKET", "datalake"))
+    parser.add_argument("--batch-size", type=int, default=128, help="Entities per checkpoint")
+    parser.add_argument("--restart", action="store_true", help="Ignore checkpoint, start over")
     args = parser.parse_args()
 
     mc = minio_client()
@@ -308,19 +376,39 @@ def main():
         print(f"No JSON files found under s3://{args.bucket}/{args.prefix}")
         return
 
+    checkpoint = Checkpoint(mc, args.bucket, args.prefix, stage="vector", resume=not args.restart)
+    dead_letters = DeadLetterStore(mc, args.bucket, args.prefix, "vector", run_id=new_batch_id())
+    state = {"embedder": embedder, "collection_ready": False}
+
+    def write_chunk(chunk: list[Entity]) -> None:
+        state["embedder"] = upsert_chunk(
+            qc, state["embedder"], chunk, ensure=not state["collection_ready"]
+        )
+        state["collection_ready"] = True
+
     total_files = 0
     total_points = 0
+    total_failed = 0
     for key in keys:
         doc = read_json(mc, args.bucket, key)
-        ents = list(iter_entities(doc))
+        resuming = checkpoint.offset(key) > 0
+        # invalid companies were already dead-lettered by the run we're resuming
+        ents = collect_entities(doc, key, dead_letters, skip_invalid=resuming)
+        dead_letters.flush()
         if not ents:
             continue
-        upserted = upsert_entities(qc, embedder, ents)
+        upserted, failed = run_chunked(
+            ents, write_chunk, checkpoint, dead_letters, key, args.batch_size
+        )
         total_files += 1
         total_points += upserted
+        total_failed += failed
         print(f"Upserted {upserted} points from {key}")
+    checkpoint.finish()
 
     print(f"Vector ETL done: files={total_files}, points={total_points}, collection={COLLECTION}")
+    if len(dead_letters):
+        print(f"Dead letters ({len(dead_letters)}): s3://{args.bucket}/{dead_letters.key}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,262 @@
+"""
+Converts raw lake batches into the CSV layout expected by `neo4j-admin database import`.
+Covers Company, Person and Email nodes plus WORKS_AT / HAS_EMAIL relationships.
+
+Intended for first-time loads and disaster recovery, where pushing every row through
+MERGE transactions (see ETLPipeline._cypher_upsert) is far too slow. Ids are deduped
+while converting, so overlapping batches can be exported together.
+
+Usage:
+  python -m atlas.etl.bulk_to_graph.neo4j_admin_csv --prefix apollo/raw/TIMESTAMP --out ./import
+  neo4j-admin database import full neo4j \\
+      --nodes=Company=import/companies_header.csv,import/companies.csv ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from minio import Minio
+
+from atlas.etl.common.checkpoint import is_internal_key
+from atlas.etl.common.idempotency import new_batch_id
+
+# Default array delimiter used by neo4j-admin for `:string[]` columns
+ARRAY_DELIMITER = ";"
+
+COMPANY_HEADER = [
+    "id:ID(Company)",
+    "name",
+    "domain",
+    "industry",
+    "employee_count",
+    "location",
+    "website",
+    "rating:float",
+    "types:string[]",
+    "created_at:long",
+    ":LABEL",
+]
+PERSON_HEADER = [
+    "id:ID(Person)",
+    "full_name",
+    "title",
+    "department",
+    "seniority",
+    "linkedin",
+    "confidence:int",
+    "created_at:long",
+    ":LABEL",
+]
+EMAIL_HEADER = ["address:ID(Email)", ":LABEL"]
+WORKS_AT_HEADER = [":START_ID(Person)", ":END_ID(Company)", "batch_id", ":TYPE"]
+HAS_EMAIL_HEADER = [":START_ID(Person)", ":END_ID(Email)", ":TYPE"]
+
+# file stem -> header; each stem produces <stem>_header.csv and <stem>.csv
+FILES = {
+    "companies": COMPANY_HEADER,
+    "people": PERSON_HEADER,
+    "emails": EMAIL_HEADER,
+    "works_at": WORKS_AT_HEADER,
+    "has_email": HAS_EMAIL_HEADER,
+}
+
+
+def minio_client() -> Minio:
+    endpoint = os.getenv("MINIO_ENDPOINT", "minio:9000")
+    user = os.getenv("MINIO_ROOT_USER", "minioadmin")
+    pwd = os.getenv("MINIO_ROOT_PASSWORD", "minioadmin")
+    endpoint = endpoint.replace("http://", "").replace("https://", "")
+    return Minio(endpoint, access_key=user, secret_key=pwd, secure=False)
+
+
+def list_company_keys(mc: Minio, bucket: str, prefix: str) -> list[str]:
+    """Company payloads under a batch prefix (skips sidecars, checkpoints, dead letters)."""
+    objs = mc.list_objects(bucket, prefix=prefix, recursive=True)
+    return sorted(
+        o.object_name
+        for o in objs
+        if o.object_name.endswith(".json") and not is_internal_key(o.object_name)
+    )
+
+
+def iter_companies(mc: Minio, bucket: str, keys: Iterable[str]) -> Iterable[dict[str, Any]]:
+    for key in keys:
+        data = mc.get_object(bucket, key).read()
+        yield from json.loads(data.decode("utf-8")).get("companies", [])
+
+
+def _cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, list | tuple):
+        return ARRAY_DELIMITER.join(str(v) for v in value if v is not None)
+    return value
+
+
+class AdminImportWriter:
+    """
+    Streams companies into neo4j-admin node/relationship CSVs.
+
+    Node and relationship ids are tracked in memory so each node and edge is written
+    once, however many batches repeat it. First occurrence wins, matching the
+    ON CREATE semantics of the transactional loader.
+    """
+
+    def __init__(self, out_dir: str | Path, batch_id: str | None = None):
+        self.out_dir = Path(out_dir)
+        self.batch_id = batch_id or new_batch_id()
+        self.created_at = int(time.time() * 1000)
+        self._files: dict[str, Any] = {}
+        self._writers: dict[str, Any] = {}
+        self._seen: dict[str, set] = {stem: set() for stem in FILES}
+        self.skipped = 0
+
+    def __enter__(self) -> AdminImportWriter:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        for stem, header in FILES.items():
+            with open(self.out_dir / f"{stem}_header.csv", "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow(header)
+            fh = open(self.out_dir / f"{stem}.csv", "w", newline="", encoding="utf-8")  # noqa: SIM115
+            self._files[stem] = fh
+            self._writers[stem] = csv.writer(fh)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for fh in self._files.values():
+            fh.close()
+        self._files.clear()
+        self._writers.clear()
+
+    def _write_once(self, stem: str, key: Any, row: list[Any]) -> bool:
+        seen = self._seen[stem]
+        if key in seen:
+            return False
+        seen.add(key)
+        self._writers[stem].writerow([_cell(v) for v in row])
+        return True
+
+    def add_company(self, c: dict[str, Any]) -> None:
+        company_id = c.get("id")
+        if not company_id:
+            self.skipped += 1
+            return
+        self._write_once(
+            "companies",
+            company_id,
+            [
+                company_id,
+                c.get("name"),
+                c.get("domain"),
+                c.get("industry"),
+                c.get("employee_count"),
+                c.get("location"),
+                c.get("website"),
+                c.get("rating"),
+                c.get("types"),
+                self.created_at,
+                "Company",
+            ],
+        )
+        for p in c.get("people") or []:
+            self._add_person(p, company_id)
+
+    def _add_person(self, p: dict[str, Any], company_id: str) -> None:
+        person_id = p.get("id")
+        if not person_id:
+            self.skipped += 1
+            return
+        self._write_once(
+            "people",
+            person_id,
+            [
+                person_id,
+                p.get("full_name"),
+                p.get("title"),
+                p.get("department"),
+                p.get("seniority"),
+                p.get("linkedin"),
+                p.get("confidence"),
+                self.created_at,
+                "Person",
+            ],
+        )
+        self._write_once(
+            "works_at",
+            (person_id, company_id),
+            [person_id, company_id, self.batch_id, "WORKS_AT"],
+        )
+        for address in p.get("emails") or []:
+            if not address:
+                continue
+            self._write_once("emails", address, [address, "Email"])
+            self._write_once("has_email", (person_id, address), [person_id, address, "HAS_EMAIL"])
+
+    def counts(self) -> dict[str, int]:
+        return {stem: len(ids) for stem, ids in self._seen.items()}
+
+    def import_command(self, database: str = "neo4j") -> str:
+        """The neo4j-admin invocation matching the files written."""
+
+        def pair(stem: str) -> str:
+            return f"{self.out_dir / (stem + '_header.csv')},{self.out_dir / (stem + '.csv')}"
+
+        return " ".join(
+            [
+                f"neo4j-admin database import full {database}",
+                f"--nodes=Company={pair('companies')}",
+                f"--nodes=Person={pair('people')}",
+                f"--nodes=Email={pair('emails')}",
+                f"--relationships=WORKS_AT={pair('works_at')}",
+                f"--relationships=HAS_EMAIL={pair('has_email')}",
+                f"--array-delimiter='{ARRAY_DELIMITER}'",
+            ]
+        )
+
+
+def export_prefixes(
+    mc: Minio, bucket: str, prefixes: list[str], out_dir: str | Path
+) -> AdminImportWriter:
+    """Convert every company payload under `prefixes` into one set of import CSVs."""
+    with AdminImportWriter(out_dir) as writer:
+        for prefix in prefixes:
+            keys = list_company_keys(mc, bucket, prefix)
+            print(f"Converting {len(keys)} file(s) from s3://{bucket}/{prefix}")
+            for company in iter_companies(mc, bucket, keys):
+                writer.add_company(company)
+    return writer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export lake batches as neo4j-admin CSVs")
+    parser.add_argument(
+        "--prefix",
+        action="append",
+        required=True,
+        help="like apollo/raw/2025-10-26T14:22:11Z (repeatable)",
+    )
+    parser.add_argument("--bucket", default=os.getenv("MINIO_BUCKET", "datalake"))
+    parser.add_argument("--out", default="import", help="Output directory for CSV files")
+    parser.add_argument("--database", default="neo4j", help="Target database name")
+    args = parser.parse_args()
+
+    writer = export_prefixes(minio_client(), args.bucket, args.prefix, args.out)
+    counts = writer.counts()
+    print(
+        "Export done: "
+        + ", ".join(f"{stem}={n}" for stem, n in counts.items())
+        + f", skipped={writer.skipped}, batch={writer.batch_id}"
+    )
+    print("\nStop the database, then run:")
+    print(f"  {writer.import_command(args.database)}")
+
+
+if __name__ == "__main__":
+    main()
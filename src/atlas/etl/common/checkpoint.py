@@ -0,0 +1,234 @@
+"""
+Per-chunk checkpoints and dead-letter objects for resumable ETL runs.
+
+Both live next to the batch they describe:
+  {prefix}/_checkpoints/{stage}.json          committed record offsets per source file
+  {prefix}/_deadletter/{stage}-{run_id}.json  records that failed validation or writing
+
+Keys under `_`-prefixed path segments are internal and must be skipped by anything
+that lists a batch for payload files (see `is_internal_key`).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import UTC, datetime
+from io import BytesIO
+from typing import Any
+
+from minio import Minio
+from minio.error import S3Error
+
+from atlas.etl.common.idempotency import new_batch_id
+
+try:
+    from neo4j.exceptions import AuthError, ServiceUnavailable, SessionExpired
+
+    # Store unreachable or credentials rejected: no record is at fault
+    SYSTEMIC_ERRORS: tuple[type[Exception], ...] = (
+        ServiceUnavailable,
+        SessionExpired,
+        AuthError,
+        ConnectionError,
+    )
+except ImportError:
+    SYSTEMIC_ERRORS = (ConnectionError,)
+
+
+def is_internal_key(key: str) -> bool:
+    """True for sidecars, checkpoints and dead letters (any `_`-prefixed segment)."""
+    return any(part.startswith("_") for part in key.split("/")[-2:])
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _read_json(mc: Minio, bucket: str, key: str) -> dict | None:
+    try:
+        resp = mc.get_object(bucket, key)
+    except S3Error as e:
+        if e.code in {"NoSuchKey", "NoSuchObject"}:
+            return None
+        raise
+    try:
+        return json.loads(resp.read().decode("utf-8"))
+    finally:
+        resp.close()
+        resp.release_conn()
+
+
+def _write_json(mc: Minio, bucket: str, key: str, obj: dict) -> None:
+    data = json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+    mc.put_object(bucket, key, BytesIO(data), length=len(data), content_type="application/json")
+
+
+class Checkpoint:
+    """
+    Committed offsets for one ETL stage over one batch prefix.
+
+    Offsets count records (not chunks), so resuming with a different chunk size is
+    safe. The run's batch_id is persisted too, so a resumed run keeps tagging
+    relationships with the id it started with.
+    """
+
+    def __init__(self, mc: Minio, bucket: str, prefix: str, stage: str, resume: bool = True):
+        self.mc = mc
+        self.bucket = bucket
+        self.key = f"{prefix.rstrip('/')}/_checkpoints/{stage}.json"
+        state = _read_json(mc, bucket, self.key) if resume else None
+        self.resumed = state is not None
+        self.state: dict[str, Any] = state or {
+            "stage": stage,
+            "batch_id": new_batch_id(),
+            "offsets": {},
+            "done": False,
+            "started_at": _now(),
+        }
+
+    @property
+    def batch_id(self) -> str:
+        return self.state["batch_id"]
+
+    @property
+    def done(self) -> bool:
+        return bool(self.state.get("done"))
+
+    def bind(self, **params: Any) -> None:
+        """
+        Record run settings that decide what the offsets point at (e.g. entity
+        resolution, which changes the record list).
+
+        Raises:
+            ValueError: resuming an unfinished checkpoint written with other
+                values, which would skip or repeat records
+        """
+        saved = self.state.setdefault("params", {})
+        if self.resumed and not self.done:
+            changed = {k: saved[k] for k, v in params.items() if k in saved and saved[k] != v}
+            if changed:
+                raise ValueError(
+                    f"{self.key} was written with {changed}; resume with the same "
+                    "settings or start over (resume=False)"
+                )
+        saved.update(params)
+
+    def offset(self, source: str) -> int:
+        return int(self.state["offsets"].get(source, 0))
+
+    def commit(self, source: str, offset: int) -> None:
+        self.state["offsets"][source] = offset
+        self.state["updated_at"] = _now()
+        _write_json(self.mc, self.bucket, self.key, self.state)
+
+    def finish(self) -> None:
+        self.state["done"] = True
+        self.state["finished_at"] = _now()
+        _write_json(self.mc, self.bucket, self.key, self.state)
+
+
+class DeadLetterStore:
+    """
+    Collects records that failed and persists them as one object per run.
+
+    The object is rewritten on every `flush`, which callers do before committing a
+    checkpoint so a crash never loses failures for chunks already marked done.
+    """
+
+    def __init__(self, mc: Minio, bucket: str, prefix: str, stage: str, run_id: str):
+        self.mc = mc
+        self.bucket = bucket
+        self.stage = stage
+        self.run_id = run_id
+        self.key = f"{prefix.rstrip('/')}/_deadletter/{stage}-{run_id}.json"
+        self.items: list[dict[str, Any]] = []
+        self._flushed = 0
+
+    def add(self, record: Any, error: Exception, source: str, index: int) -> None:
+        self.items.append(
+            {
+                "source": source,
+                "index": index,
+                "error_type": type(error).__name__,
+                "error": str(error),
+                "record": asdict(record) if is_dataclass(record) else record,
+                "failed_at": _now(),
+            }
+        )
+
+    def flush(self) -> None:
+        if len(self.items) == self._flushed:
+            return
+        _write_json(
+            self.mc,
+            self.bucket,
+            self.key,
+            {
+                "stage": self.stage,
+                "run_id": self.run_id,
+                "count": len(self.items),
+                "items": self.items,
+            },
+        )
+        self._flushed = len(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def dead_letter_records(mc: Minio, bucket: str, prefix: str, stage: str) -> list[Any]:
+    """All failed records for a stage, across runs, ready to be replayed."""
+    base = f"{prefix.rstrip('/')}/_deadletter/{stage}-"
+    records = []
+    for obj in mc.list_objects(bucket, prefix=base):
+        doc = _read_json(mc, bucket, obj.object_name) or {}
+        records.extend(item["record"] for item in doc.get("items", []))
+    return records
+
+
+def run_chunked(
+    records: list[Any],
+    write_chunk,
+    checkpoint: Checkpoint,
+    dead_letters: DeadLetterStore,
+    source: str,
+    chunk_size: int,
+) -> tuple[int, int]:
+    """
+    Write `records` in chunks, resuming after the last committed offset.
+
+    A failing chunk is retried one record at a time so a single bad record only
+    costs itself; those go to the dead-letter store. Systemic errors (SYSTEMIC_ERRORS:
+    database down, bad credentials), or every record of a multi-record chunk failing,
+    are re-raised instead, leaving the checkpoint at the last good chunk.
+
+    Returns (written, failed) for this call.
+    """
+    written = failed = 0
+    start = checkpoint.offset(source)
+    for lo in range(start, len(records), chunk_size):
+        chunk = records[lo : lo + chunk_size]
+        try:
+            write_chunk(chunk)
+            written += len(chunk)
+        except SYSTEMIC_ERRORS:
+            raise
+        except Exception as chunk_error:
+            errors = []
+            for i, record in enumerate(chunk, lo):
+                try:
+                    write_chunk([record])
+                    written += 1
+                except SYSTEMIC_ERRORS:
+                    raise
+                except Exception as e:
+                    errors.append((i, record, e))
+            if len(chunk) > 1 and len(errors) == len(chunk):
+                raise chunk_error
+            for i, record, e in errors:
+                dead_letters.add(record, e, source, i)
+            failed += len(errors)
+        dead_letters.flush()
+        checkpoint.commit(source, lo + len(chunk))
+    return written, failed
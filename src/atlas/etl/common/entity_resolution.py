@@ -0,0 +1,370 @@
+"""
+Entity resolution for company records: blocking + vectorized fuzzy matching +
+union-find clustering.
+
+Comparing every name with every other is O(n²) and takes hours on 100k+ rows.
+Instead, records are only compared within blocks of plausible duplicates:
+
+  - same domain            -> same company, merged without comparing names
+  - same normalized name   -> merged without comparing
+  - name prefix            -> first `prefix_len` chars of the name, and of its
+                              token-sorted form, under the same key
+                              ("techniek janssen" ~ "janssen techniek")
+  - postcode               -> catches names that differ at the start
+  - SBI code + initial     -> same activity code, same first letter
+
+Within a block, distinct names are scored against each other in one
+`rapidfuzz.process.cdist` call (C, multi-threaded), in row chunks so memory stays
+bounded. Pairs scoring >= `threshold` are unioned; clusters are the connected
+components. Blocks larger than `max_block_size` are split further by a longer
+prefix of the same string that formed their key (name, token-sorted name), so
+total work stays close to linear in the number of records. Postcode blocks have
+no longer key to split by and are compared whole.
+
+Usage:
+    resolver = EntityResolver(threshold=85, postcode_key="zip")
+    for cluster in resolver.clusters(rows):
+        group = [rows[i] for i in cluster]
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import numpy as np
+    from rapidfuzz import fuzz
+    from rapidfuzz.process import cdist
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+# Legal forms and filler words that don't distinguish companies (DACH + Benelux + EN)
+LEGAL_SUFFIXES = (
+    "gmbh & co. kgaa",
+    "gmbh & co. kg",
+    "gmbh & co.kg",
+    "gmbh & co",
+    "se & co. kgaa",
+    "se & co. kg",
+    "gmbh",
+    "mbh",
+    "ag",
+    "se",
+    "kg",
+    "ohg",
+    "e.v.",
+    "ev",
+    "b.v.",
+    "bv",
+    "n.v.",
+    "nv",
+    "v.o.f.",
+    "vof",
+    "s.a.",
+    "sa",
+    "sarl",
+    "s.a.r.l.",
+    "inc.",
+    "inc",
+    "ltd.",
+    "ltd",
+    "llc",
+    "plc",
+    "co.",
+    "co",
+    "corp.",
+    "corp",
+    "holding",
+    "holdings",
+    "group",
+    "groep",
+)
+
+# Free-mail and platform domains say nothing about which company a row is
+GENERIC_DOMAINS = frozenset(
+    {
+        "gmail.com",
+        "googlemail.com",
+        "outlook.com",
+        "hotmail.com",
+        "live.com",
+        "yahoo.com",
+        "icloud.com",
+        "gmx.de",
+        "gmx.net",
+        "web.de",
+        "t-online.de",
+        "ziggo.nl",
+        "kpnmail.nl",
+        "telenet.be",
+        "skynet.be",
+        "linkedin.com",
+        "facebook.com",
+        "xing.com",
+        "google.com",
+    }
+)
+
+_SUFFIX_RE = re.compile(
+    r"(?:[\s,]+(?:" + "|".join(re.escape(s) for s in LEGAL_SUFFIXES) + r"))+\s*$"
+)
+_NON_ALNUM_RE = re.compile(r"[^0-9a-zà-ÿß]+")
+
+
+def normalize_name(name: Any) -> str:
+    """Lowercase, legal forms stripped, punctuation collapsed: "ACME B.V." -> "acme" """
+    if name is None or (isinstance(name, float) and name != name):  # None / NaN
+        return ""
+    s = str(name).strip().lower()
+    s = _SUFFIX_RE.sub("", s)
+    return _NON_ALNUM_RE.sub(" ", s).strip()
+
+
+def normalize_domain(value: Any) -> str:
+    """Bare registrable host: "https://www.Acme.nl/about" -> "acme.nl"; "" if generic"""
+    if not value or not isinstance(value, str):
+        return ""
+    d = value.strip().lower()
+    if "@" in d:
+        d = d.rsplit("@", 1)[1]
+    d = re.sub(r"^[a-z]+://", "", d).split("/")[0].split("?")[0].split(":")[0]
+    if d.startswith("www."):
+        d = d[4:]
+    return "" if d in GENERIC_DOMAINS or "." not in d else d
+
+
+def normalize_postcode(value: Any) -> str:
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    return re.sub(r"\s+", "", str(value)).upper()
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 with path halving and union by size."""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+
+
+@dataclass
+class EntityResolver:
+    """
+    Clusters records that describe the same company.
+
+    Args:
+        threshold: Minimum name similarity (0-100) for a fuzzy match
+        scorer: rapidfuzz scorer (default: fuzz.token_sort_ratio)
+        prefix_len: Characters of the name used as blocking key
+        max_block_size: Larger blocks are split by a longer prefix
+        chunk_size: Rows per cdist call (bounds the score matrix size)
+        workers: Threads per cdist call (-1: all cores)
+        name_key / domain_key / postcode_key / sbi_key: Record fields to use;
+            None disables that key
+    """
+
+    threshold: float = 85
+    scorer: Callable | None = None
+    prefix_len: int = 4
+    max_block_size: int = 2000
+    chunk_size: int = 1000
+    workers: int = -1
+    name_key: str = "name"
+    domain_key: str | None = "domain"
+    postcode_key: str | None = None
+    sbi_key: str | None = None
+
+    def clusters(self, records: Sequence[dict[str, Any]]) -> list[list[int]]:
+        """Indices of `records` grouped by entity, in first-seen order."""
+        groups: dict[int, list[int]] = {}
+        for i, label in enumerate(self.labels(records)):
+            groups.setdefault(label, []).append(i)
+        return list(groups.values())
+
+    def labels(self, records: Sequence[dict[str, Any]]) -> list[int]:
+        """Cluster id per record (0, 1, ... in first-seen order)."""
+        uf = UnionFind(len(records))
+
+        # Exact keys: same domain or same normalized name means same company
+        first_by_domain: dict[str, int] = {}
+        first_by_name: dict[str, int] = {}
+        names: list[str] = []  # distinct normalized names
+        name_rep: list[int] = []  # a record index per distinct name
+        for i, record in enumerate(records):
+            if self.domain_key:
+                domain = normalize_domain(record.get(self.domain_key))
+                if domain:
+                    uf.union(first_by_domain.setdefault(domain, i), i)
+            name = normalize_name(record.get(self.name_key))
+            if not name:
+                continue
+            if name in first_by_name:
+                uf.union(first_by_name[name], i)
+            else:
+                first_by_name[name] = i
+                names.append(name)
+                name_rep.append(i)
+
+        # Fuzzy matching of distinct names, only within blocks
+        if self.threshold < 100 and len(names) > 1:
+            for block in self._blocks(records, names, name_rep):
+                self._match_block(block, names, name_rep, uf)
+
+        dense: dict[int, int] = {}
+        return [dense.setdefault(uf.find(i), len(dense)) for i in range(len(records))]
+
+    # ── blocking ───────────────────────────────────────────────────────────
+
+    def _blocks(
+        self,
+        records: Sequence[dict[str, Any]],
+        names: list[str],
+        name_rep: list[int],
+    ) -> Iterable[list[int]]:
+        """Lists of distinct-name indices that should be compared with each other."""
+        # Block key -> (name index, string whose prefix formed the key; None: postcode)
+        keyed: dict[tuple, list[tuple[int, str | None]]] = defaultdict(list)
+        for n, name in enumerate(names):
+            compact = name.replace(" ", "")
+            sorted_compact = "".join(sorted(name.split()))
+            # Both forms under one key namespace, so reversed word orders meet
+            forms = {sorted_compact[: self.prefix_len]: sorted_compact}
+            forms[compact[: self.prefix_len]] = compact
+            for prefix, form in forms.items():
+                keyed[("p", prefix)].append((n, form))
+
+            record = records[name_rep[n]]
+            if self.postcode_key:
+                postcode = normalize_postcode(record.get(self.postcode_key))
+                if postcode:
+                    keyed[("z", postcode)].append((n, None))
+            if self.sbi_key:
+                sbi = str(record.get(self.sbi_key) or "").strip()
+                if sbi:
+                    keyed[("b", sbi, compact[:1])].append((n, compact))
+
+        for key, entries in keyed.items():
+            if key[0] == "z":
+                if len(entries) > 1:
+                    yield [n for n, _ in entries]
+            else:
+                yield from self._split(entries, self.prefix_len if key[0] == "p" else 1)
+
+    def _split(self, entries: list[tuple[int, str]], prefix: int) -> Iterable[list[int]]:
+        """Split a block by longer prefixes of the strings that formed its key."""
+        if len(entries) < 2:
+            return
+        if len(entries) <= self.max_block_size or prefix >= 16:
+            yield [n for n, _ in entries]
+            return
+        longer = prefix + 2
+        sub: dict[str, list[tuple[int, str]]] = defaultdict(list)
+        for n, form in entries:
+            sub[form[:longer]].append((n, form))
+        for part in sub.values():
+            yield from self._split(part, longer)
+
+    # ── matching ───────────────────────────────────────────────────────────
+
+    def _match_block(
+        self,
+        block: list[int],
+        names: list[str],
+        name_rep: list[int],
+        uf: UnionFind,
+    ) -> None:
+        if not RAPIDFUZZ_AVAILABLE:
+            raise ImportError(
+                "rapidfuzz and numpy are required for fuzzy matching. "
+                "Install with: pip install rapidfuzz numpy"
+            )
+        block_names = [names[n] for n in block]
+        scorer = self.scorer or fuzz.token_sort_ratio
+        for lo in range(0, len(block), self.chunk_size):
+            scores = cdist(
+                block_names[lo : lo + self.chunk_size],
+                block_names,
+                scorer=scorer,
+                score_cutoff=self.threshold,
+                dtype=np.uint8,
+                workers=self.workers,
+            )
+            rows, cols = np.nonzero(scores)
+            for r, c in zip(rows.tolist(), cols.tolist(), strict=True):
+                if lo + r < c:  # upper triangle: each pair once, no self-pairs
+                    uf.union(name_rep[block[lo + r]], name_rep[block[c]])
+
+
+def merge_cluster(
+    records: Sequence[dict[str, Any]],
+    priority: Callable[[dict[str, Any]], Any] | None = None,
+) -> dict[str, Any]:
+    """
+    One record per cluster: for every field, the first non-empty value wins;
+    list fields (e.g. people) are concatenated without duplicates.
+
+    Records are taken in `priority` order (highest first) when given, otherwise
+    in input order. The ids of merged records, if they have any, are kept in
+    "_merged_ids".
+    """
+    ordered = sorted(records, key=priority, reverse=True) if priority else list(records)
+    merged: dict[str, Any] = {}
+    for record in ordered:
+        for key, value in record.items():
+            if _empty(value):
+                continue
+            current = merged.get(key)
+            if _empty(current):
+                merged[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(current, list) and isinstance(value, list):
+                current.extend(item for item in value if item not in current)
+    merged_ids = [r.get("id") for r in ordered if r.get("id") is not None]
+    if len(ordered) > 1 and merged_ids:
+        merged["_merged_ids"] = merged_ids
+    return merged
+
+
+def deduplicate(
+    records: Sequence[dict[str, Any]],
+    resolver: EntityResolver | None = None,
+    priority: Callable[[dict[str, Any]], Any] | None = None,
+) -> list[dict[str, Any]]:
+    """Resolve `records` and merge each cluster into a single record."""
+    resolver = resolver or EntityResolver()
+    return [
+        merge_cluster([records[i] for i in cluster], priority)
+        for cluster in resolver.clusters(records)
+    ]
+
+
+def _empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float) and value != value:  # NaN
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    return isinstance(value, (list, dict, set, tuple)) and not value
@@ -0,0 +1,269 @@
+"""
+Incremental Neo4j -> Qdrant sync driven by graph change tracking.
+
+Every Company/Person write stamps `updated_at` (epoch ms, `timestamp()`). The worker pulls
+nodes changed since its high-water mark in keyset order (updated_at, id), re-embeds and
+upserts only those, and deletes vectors for nodes recorded as `:Tombstone` (see
+`delete_entity`). The high-water marks live in a `:SyncState` node, so restarts resume
+where the last committed page ended and the cost of a pass is proportional to churn.
+
+`timestamp()` is taken when a transaction starts, so a long write can commit with an
+updated_at older than what the worker has already passed. Only changes older than
+`lag_ms` (by the database clock) are synced, which leaves in-flight writes for the
+next pass.
+
+Usage:
+  python -m atlas.etl.graph_to_vector.neo4j_qdrant_sync            # loop every 60s
+  python -m atlas.etl.graph_to_vector.neo4j_qdrant_sync --once     # single pass (cron)
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Any
+
+from dotenv import load_dotenv
+from neo4j import Driver, GraphDatabase
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointIdsList
+
+from atlas.etl.apollo_to_vector.etl_apollo_qdrant import (
+    COLLECTION,
+    _BaseEmbedder,
+    _qdrant_point_id,
+    build_embedder,
+    company_entity,
+    person_entity,
+    qdrant_client,
+    upsert_chunk,
+)
+
+SYNC_STATE_ID = f"qdrant:{COLLECTION}"
+
+# label -> Qdrant entity type (also the ext_id prefix: "company:<id>")
+SYNCED_LABELS = {"Company": "company", "Person": "person"}
+
+SCHEMA = [
+    "CREATE INDEX company_updated_at IF NOT EXISTS FOR (n:Company) ON (n.updated_at)",
+    "CREATE INDEX person_updated_at IF NOT EXISTS FOR (n:Person) ON (n.updated_at)",
+    "CREATE INDEX tombstone_deleted_at IF NOT EXISTS FOR (t:Tombstone) ON (t.deleted_at)",
+    "CREATE INDEX tombstone_ext_id IF NOT EXISTS FOR (t:Tombstone) ON (t.ext_id)",
+]
+
+# Nodes written before change tracking (or stamped with datetime()) get an epoch-ms
+# updated_at so the keyset comparison and the index apply to every node.
+BACKFILL = """
+MATCH (n:{label})
+WHERE n.updated_at IS NULL OR n.updated_at IS NOT :: INTEGER
+CALL {{
+  WITH n
+  SET n.updated_at = coalesce(n.created_at, timestamp())
+}} IN TRANSACTIONS OF 10000 ROWS
+"""
+
+CHANGED_COMPANIES = """
+MATCH (n:Company)
+WHERE n.id IS NOT NULL AND n.updated_at <= timestamp() - $lag_ms
+  AND (n.updated_at > $ts OR (n.updated_at = $ts AND n.id > $id))
+RETURN n {.*} AS node, null AS company
+ORDER BY n.updated_at, n.id
+LIMIT $limit
+"""
+
+CHANGED_PEOPLE = """
+MATCH (n:Person)
+WHERE n.id IS NOT NULL AND n.updated_at <= timestamp() - $lag_ms
+  AND (n.updated_at > $ts OR (n.updated_at = $ts AND n.id > $id))
+WITH n ORDER BY n.updated_at, n.id LIMIT $limit
+OPTIONAL MATCH (n)-[:WORKS_AT]->(c:Company)
+WITH n, head(collect(c {.id, .name, .domain})) AS company
+RETURN n {.*} AS node, company
+ORDER BY n.updated_at, n.id
+"""
+
+CHANGED = {"Company": CHANGED_COMPANIES, "Person": CHANGED_PEOPLE}
+
+DELETED = """
+MATCH (t:Tombstone)
+WHERE t.deleted_at <= timestamp() - $lag_ms
+  AND (t.deleted_at > $ts OR (t.deleted_at = $ts AND t.ext_id > $id))
+RETURN t.ext_id AS ext_id, t.deleted_at AS deleted_at
+ORDER BY t.deleted_at, t.ext_id
+LIMIT $limit
+"""
+
+# Formatted with a label from SYNCED_LABELS only, so the id constraint's index is used
+TOMBSTONE_AND_DELETE = """
+MATCH (n:{label} {{id: $id}})
+MERGE (t:Tombstone {{ext_id: $ext_id}})
+SET t.deleted_at = timestamp()
+DETACH DELETE n
+"""
+
+READ_STATE = "MATCH (s:SyncState {id: $id}) RETURN s {.*} AS state"
+WRITE_STATE = "MERGE (s:SyncState {id: $id}) SET s += $state"
+
+
+def delete_entity(tx, label: str, node_id: str) -> None:
+    """
+    Delete a synced node and leave a tombstone so the sync removes its vector.
+    Use this instead of a bare DETACH DELETE for Company/Person nodes.
+    """
+    ext_id = f"{SYNCED_LABELS[label]}:{node_id}"  # KeyError for any other label
+    tx.run(TOMBSTONE_AND_DELETE.format(label=label), id=node_id, ext_id=ext_id)
+
+
+def neo4j_driver() -> Driver:
+    uri = os.getenv("NEO4J_URI", "bolt://neo4j:7687")
+    user = os.getenv("NEO4J_USER", "neo4j")
+    pwd = os.getenv("NEO4J_PASSWORD", "neo4jpass")
+    return GraphDatabase.driver(uri, auth=(user, pwd))
+
+
+class GraphVectorSync:
+    """
+    Keeps Qdrant `atlas_entities` in step with Company/Person nodes in Neo4j.
+
+    Each page is upserted to Qdrant before its high-water mark is saved, so a crash
+    replays at most one page (upserts are idempotent by deterministic point id).
+    """
+
+    def __init__(
+        self,
+        driver: Driver,
+        qdrant: QdrantClient,
+        embedder: _BaseEmbedder,
+        page_size: int = 256,
+        lag_ms: int = 30_000,
+    ):
+        self.driver = driver
+        self.qdrant = qdrant
+        self.embedder = embedder
+        self.page_size = page_size
+        self.lag_ms = lag_ms
+        self._collection_ready = False
+
+    def ensure_schema(self) -> None:
+        with self.driver.session() as sess:
+            for stmt in SCHEMA:
+                sess.run(stmt).consume()
+            for label in SYNCED_LABELS:
+                sess.run(BACKFILL.format(label=label)).consume()
+
+    def load_state(self) -> dict[str, Any]:
+        with self.driver.session() as sess:
+            rec = sess.run(READ_STATE, id=SYNC_STATE_ID).single()
+        return dict(rec["state"]) if rec else {}
+
+    def save_state(self, state: dict[str, Any]) -> None:
+        with self.driver.session() as sess:
+            sess.run(WRITE_STATE, id=SYNC_STATE_ID, state=state).consume()
+
+    def reset_state(self) -> None:
+        """Forget every high-water mark (labels and deletions): the next pass resyncs all."""
+        state: dict[str, Any] = {"deleted_ts": -1, "deleted_id": ""}
+        for key in SYNCED_LABELS.values():
+            state.update({f"{key}_ts": -1, f"{key}_id": ""})
+        self.save_state(state)
+
+    def _page(self, query: str, ts: int, last_id: str) -> list[dict[str, Any]]:
+        with self.driver.session() as sess:
+            return sess.run(
+                query, ts=ts, id=last_id, limit=self.page_size, lag_ms=self.lag_ms
+            ).data()
+
+    def sync_label(self, label: str) -> int:
+        """Re-embed every node of `label` changed since the stored high-water mark."""
+        key = SYNCED_LABELS[label]
+        state = self.load_state()
+        ts, last_id = state.get(f"{key}_ts", -1), state.get(f"{key}_id", "")
+        total = 0
+        while True:
+            rows = self._page(CHANGED[label], ts, last_id)
+            if not rows:
+                return total
+            if label == "Company":
+                entities = [company_entity(r["node"]) for r in rows]
+            else:
+                entities = [person_entity(r["node"], r["company"] or {}) for r in rows]
+            self.embedder = upsert_chunk(
+                self.qdrant, self.embedder, entities, ensure=not self._collection_ready
+            )
+            self._collection_ready = True
+            last = rows[-1]["node"]
+            ts, last_id = last["updated_at"], last["id"]
+            self.save_state({f"{key}_ts": ts, f"{key}_id": last_id})
+            total += len(rows)
+            if len(rows) < self.page_size:
+                return total
+
+    def sync_deletions(self) -> int:
+        """Delete vectors for nodes tombstoned since the stored high-water mark."""
+        state = self.load_state()
+        ts, last_id = state.get("deleted_ts", -1), state.get("deleted_id", "")
+        total = 0
+        while True:
+            rows = self._page(DELETED, ts, last_id)
+            if not rows:
+                return total
+            self.qdrant.delete(
+                collection_name=COLLECTION,
+                points_selector=PointIdsList(points=[_qdrant_point_id(r["ext_id"]) for r in rows]),
+                wait=True,
+            )
+            ts, last_id = rows[-1]["deleted_at"], rows[-1]["ext_id"]
+            self.save_state({"deleted_ts": ts, "deleted_id": last_id})
+            total += len(rows)
+            if len(rows) < self.page_size:
+                return total
+
+    def run_once(self) -> dict[str, int]:
+        stats = {key: self.sync_label(label) for label, key in SYNCED_LABELS.items()}
+        if self._collection_ready or self._collection_exists():
+            stats["deleted"] = self.sync_deletions()
+        return stats
+
+    def _collection_exists(self) -> bool:
+        names = {c.name for c in self.qdrant.get_collections().collections}
+        self._collection_ready = COLLECTION in names
+        return self._collection_ready
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Incremental Neo4j -> Qdrant sync")
+    parser.add_argument("--interval", type=float, default=60.0, help="Seconds between passes")
+    parser.add_argument("--page-size", type=int, default=256, help="Nodes per page")
+    parser.add_argument(
+        "--lag-ms", type=int, default=30_000, help="Leave changes younger than this for later"
+    )
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    parser.add_argument(
+        "--reset", action="store_true", help="Forget high-water marks and resync everything"
+    )
+    args = parser.parse_args()
+
+    driver = neo4j_driver()
+    sync = GraphVectorSync(
+        driver, qdrant_client(), build_embedder(), page_size=args.page_size, lag_ms=args.lag_ms
+    )
+    sync.ensure_schema()
+    if args.reset:
+        sync.reset_state()
+
+    try:
+        while True:
+            started = time.time()
+            stats = sync.run_once()
+            print(f"[sync] {stats} in {time.time() - started:.1f}s")
+            if args.once:
+                break
+            time.sleep(args.interval)
+    finally:
+        driver.close()
+
+
+if __name__ == "__main__":
+    main()
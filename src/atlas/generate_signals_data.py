@@ -606,7 +606,7 @@ def create_neo4j_data(driver):
                     c.past_gmv = $past_gmv,
                     c.has_contact = $has_contact,
                     c.is_supplier = true,
-                    c.updated_at = datetime()
+                    c.updated_at = timestamp()
             """, company)
             print(f"  Created: {company['name']}")
 
@@ -0,0 +1,298 @@
+"""
+Persistent cache for paid provider responses.
+
+Entries are keyed by (provider, endpoint, normalized params): string params are
+trimmed, case-insensitive ones (domains, emails, names) lowercased, empty values and
+credentials dropped, and the result hashed, so `ACME.com ` and `acme.com` share one
+entry. Each provider has its own TTL (see DEFAULT_TTLS). Negative answers (e.g. a
+404 returned as None) are cached too; errors are not.
+
+Backends:
+  SQLiteBackend  local file, default (ATLAS_CACHE_PATH)
+  RedisBackend   shared across workers (ATLAS_CACHE_BACKEND=redis, REDIS_URL)
+
+Async callers use `acached` / `aget` / `aset`, which run Redis calls in a worker
+thread instead of blocking the event loop.
+
+Set ATLAS_CACHE=off to bypass caching entirely.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+DAY = 24 * 3600
+
+# Seconds an entry stays valid, per provider
+DEFAULT_TTLS = {
+    "apollo": 30 * DAY,
+    "hunter": 14 * DAY,
+    "kvk": 7 * DAY,
+    "google_places": 30 * DAY,
+}
+DEFAULT_TTL = 7 * DAY
+
+# Never part of a cache key
+SECRET_PARAMS = {"api_key", "apikey", "key", "token"}
+
+# Lowercased before keying; ids such as place_id are case-sensitive and left alone
+CASE_INSENSITIVE_PARAMS = {"domain", "email", "first_name", "last_name", "query"}
+
+_MISS = object()
+
+
+def normalize_params(params: dict[str, Any]) -> dict[str, Any]:
+    out = {}
+    for name, value in params.items():
+        if name.lower() in SECRET_PARAMS or value is None or value == "":
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if name in CASE_INSENSITIVE_PARAMS:
+                value = value.lower()
+        out[name] = value
+    return out
+
+
+def cache_key(provider: str, endpoint: str, params: dict[str, Any]) -> str:
+    canonical = json.dumps(normalize_params(params), sort_keys=True, default=str)
+    digest = hashlib.sha256(f"{endpoint}\n{canonical}".encode()).hexdigest()
+    return f"{provider}:{digest}"
+
+
+class SQLiteBackend:
+    """Single-file cache; safe to share between threads of one process."""
+
+    # Local file, sub-millisecond: called inline from async code too
+    blocking = False
+
+    def __init__(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if not row or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+
+    def clear(self, provider: str | None = None) -> None:
+        with self._lock, self._conn:
+            if provider:
+                self._conn.execute("DELETE FROM responses WHERE key LIKE ?", (f"{provider}:%",))
+            else:
+                self._conn.execute("DELETE FROM responses")
+
+    def purge_expired(self) -> int:
+        with self._lock, self._conn:
+            cur = self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+        return cur.rowcount
+
+
+class RedisBackend:
+    """Cache shared by every worker pointing at the same Redis; expiry is native."""
+
+    # A network round trip per call: async callers run it in a worker thread.
+    # (A thread, not redis.asyncio: connectors run on more than one event loop.)
+    blocking = True
+
+    def __init__(self, url: str, namespace: str = "atlas:cache"):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis is not installed")
+        self._redis = redis.from_url(url)
+        self.namespace = namespace
+
+    def get(self, key: str) -> str | None:
+        value = self._redis.get(f"{self.namespace}:{key}")
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self._redis.setex(f"{self.namespace}:{key}", ttl, value)
+
+    def clear(self, provider: str | None = None) -> None:
+        pattern = f"{self.namespace}:{provider}:*" if provider else f"{self.namespace}:*"
+        for key in self._redis.scan_iter(match=pattern, count=500):
+            self._redis.delete(key)
+
+
+class ResponseCache:
+    """
+    Read-through cache in front of provider calls.
+
+    Usage:
+        people = cache.cached("hunter", "domain-search", {"domain": d}, lambda: fetch(d))
+        org = await cache.acached("apollo", "organizations/enrich", {"domain": d}, fetch)
+    """
+
+    def __init__(self, backend=None, ttls: dict[str, int] | None = None):
+        self.backend = backend
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._hits: dict[str, int] = defaultdict(int)
+        self._misses: dict[str, int] = defaultdict(int)
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get(self, provider: str, endpoint: str, params: dict[str, Any]) -> Any:
+        """Cached value, or `_MISS`; use `is_hit` to tell them apart."""
+        if not self.enabled:
+            return _MISS
+        try:
+            raw = self.backend.get(cache_key(provider, endpoint, params))
+        except Exception:
+            raw = None
+        return self._decode(provider, raw)
+
+    async def aget(self, provider: str, endpoint: str, params: dict[str, Any]) -> Any:
+        """`get` for async callers; never blocks the event loop on a network backend."""
+        if not self.enabled:
+            return _MISS
+        try:
+            raw = await self._call(self.backend.get, cache_key(provider, endpoint, params))
+        except Exception:
+            raw = None
+        return self._decode(provider, raw)
+
+    def set(self, provider: str, endpoint: str, params: dict[str, Any], value: Any) -> None:
+        if not self.enabled:
+            return
+        ttl = self.ttls.get(provider, DEFAULT_TTL)
+        try:
+            self.backend.set(
+                cache_key(provider, endpoint, params), json.dumps(value, default=str), ttl
+            )
+        except Exception:
+            # A cache that can't write must never fail the call it fronts
+            pass
+
+    async def aset(self, provider: str, endpoint: str, params: dict[str, Any], value: Any) -> None:
+        """`set` for async callers; never blocks the event loop on a network backend."""
+        if not self.enabled:
+            return
+        ttl = self.ttls.get(provider, DEFAULT_TTL)
+        try:
+            await self._call(
+                self.backend.set,
+                cache_key(provider, endpoint, params),
+                json.dumps(value, default=str),
+                ttl,
+            )
+        except Exception:
+            pass
+
+    async def _call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if getattr(self.backend, "blocking", True):
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    def _decode(self, provider: str, raw: str | None) -> Any:
+        if raw is None:
+            self._misses[provider] += 1
+            return _MISS
+        self._hits[provider] += 1
+        return json.loads(raw)
+
+    @staticmethod
+    def is_hit(value: Any) -> bool:
+        return value is not _MISS
+
+    def cached(
+        self, provider: str, endpoint: str, params: dict[str, Any], fetch: Callable[[], Any]
+    ) -> Any:
+        value = self.get(provider, endpoint, params)
+        if self.is_hit(value):
+            return value
+        value = fetch()
+        self.set(provider, endpoint, params, value)
+        return value
+
+    async def acached(
+        self,
+        provider: str,
+        endpoint: str,
+        params: dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        value = await self.aget(provider, endpoint, params)
+        if self.is_hit(value):
+            return value
+        value = await fetch()
+        await self.aset(provider, endpoint, params, value)
+        return value
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Hits, misses and hit rate per provider since this process started."""
+        out = {}
+        for provider in sorted(set(self._hits) | set(self._misses)):
+            hits, misses = self._hits[provider], self._misses[provider]
+            out[provider] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            }
+        return out
+
+
+_default_cache: ResponseCache | None = None
+_default_lock = threading.Lock()
+
+
+def _backend_from_env():
+    if os.getenv("ATLAS_CACHE", "on").lower() in {"off", "0", "false", "no"}:
+        return None
+    if os.getenv("ATLAS_CACHE_BACKEND", "sqlite").lower() == "redis":
+        url = os.getenv("REDIS_URL")
+        if url and REDIS_AVAILABLE:
+            try:
+                backend = RedisBackend(url)
+                backend._redis.ping()
+                return backend
+            except Exception:
+                pass
+    path = os.getenv("ATLAS_CACHE_PATH", str(Path.home() / ".cache" / "atlas" / "responses.sqlite"))
+    try:
+        return SQLiteBackend(path)
+    except Exception:
+        return None
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide cache configured from the environment (created on first use)."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache(_backend_from_env())
+        return _default_cache
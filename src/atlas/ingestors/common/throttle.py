@@ -0,0 +1,32 @@
+import threading
+import time
+
+
+class Throttle:
+    """
+    Thread-safe token bucket for the `requests`-based ingestors.
+
+    Allows `rate` calls per second on average with bursts of up to `burst` calls.
+    `acquire()` blocks the calling thread for exactly as long as the next token needs.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
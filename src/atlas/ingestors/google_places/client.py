@@ -1,41 +1,60 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from atlas.ingestors.common.base import CompanyIngestor
+from atlas.ingestors.common.response_cache import ResponseCache, get_response_cache
+from atlas.ingestors.common.throttle import Throttle
+
+# Text Search returns at most 3 pages of 20 results
+MAX_PAGES = 3
+
+# A fresh next_page_token is rejected (INVALID_REQUEST) for a short while
+PAGE_TOKEN_DELAY = 2.0
+
+# Only the Place Details fields we actually map (billed and sent per field)
+DETAIL_FIELDS = "website"
 
 
 class GooglePlacesIngestor(CompanyIngestor):
     """Google Places API ingestor"""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://maps.googleapis.com/maps/api/place",
+        max_pages: int = MAX_PAGES,
+        concurrency: int = 8,
+        rate_limit: float = 10.0,
+        timeout: float = 10.0,
+        cache: ResponseCache | None = None,
+    ):
         self.api_key = api_key
-        self.base_url = "https://maps.googleapis.com/maps/api/place"
+        self.base_url = base_url.rstrip("/")
+        self.max_pages = max(1, min(max_pages, MAX_PAGES))
+        self.concurrency = max(1, concurrency)
+        self.throttle = Throttle(rate_limit, burst=self.concurrency)
+        self.timeout = timeout
+        self.cache = cache or get_response_cache()
+
+        # One keep-alive pool shared by the detail workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def search(self, query: str, limit: int = 20) -> list[dict]:
         """Search companies"""
-        resp = requests.get(
-            f"{self.base_url}/textsearch/json",
-            params={"query": query, "key": self.api_key},
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        places = self._text_search(query, limit)
 
-        if data.get("status") != "OK":
-            return []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            websites = list(pool.map(self._website, (p["place_id"] for p in places)))
 
         companies = []
-        for place in data.get("results", [])[:limit]:
-            detail_resp = requests.get(
-                f"{self.base_url}/details/json",
-                params={
-                    "place_id": place["place_id"],
-                    "key": self.api_key,
-                    "fields": "website,name",
-                },
-            )
-            detail = detail_resp.json().get("result", {})
-            website = detail.get("website")
+        for place, website in zip(places, websites):
             domain = self._extract_domain(website)
 
             if not domain:
@@ -57,6 +76,53 @@ class GooglePlacesIngestor(CompanyIngestor):
 
         return companies
 
+    def _get(self, endpoint: str, params: dict) -> dict:
+        self.throttle.acquire()
+        resp = self.session.get(
+            f"{self.base_url}/{endpoint}/json",
+            params={**params, "key": self.api_key},
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    def _text_search(self, query: str, limit: int) -> list[dict]:
+        """Follow next_page_token until `limit` places or `max_pages` pages"""
+        places: list[dict] = []
+        params = {"query": query}
+        for _ in range(self.max_pages):
+            data = self._get("textsearch", params)
+            if data.get("status") == "INVALID_REQUEST" and "pagetoken" in params:
+                time.sleep(PAGE_TOKEN_DELAY)
+                data = self._get("textsearch", params)
+            if data.get("status") != "OK":
+                break
+
+            places.extend(data.get("results", []))
+            token = data.get("next_page_token")
+            if len(places) >= limit or not token:
+                break
+            time.sleep(PAGE_TOKEN_DELAY)
+            params = {"pagetoken": token}
+
+        return places[:limit]
+
+    def _website(self, place_id: str) -> str | None:
+        """Place Details lookup (cached); a failed lookup just drops that place"""
+        params = {"place_id": place_id, "fields": DETAIL_FIELDS}
+        cached = self.cache.get("google_places", "details", params)
+        if self.cache.is_hit(cached):
+            return cached
+        try:
+            data = self._get("details", params)
+        except requests.RequestException:
+            return None
+        if data.get("status") != "OK":
+            return None
+        website = data.get("result", {}).get("website")
+        self.cache.set("google_places", "details", params, website)
+        return website
+
     def _extract_domain(self, url: str) -> str | None:
         """Extract clean domain(without www prefix)"""
         if not url:
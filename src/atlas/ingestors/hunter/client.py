@@ -1,22 +1,34 @@
 import requests
 
 from atlas.ingestors.common.base import CompanyPeopleFinder
+from atlas.ingestors.common.response_cache import ResponseCache, get_response_cache
 
 
 class HunterPeopleFinder(CompanyPeopleFinder):
     """Hunter.io API people finder"""
 
-    def __init__(self, api_key: str):
+    # Hunter allows 15 requests/second on domain search
+    rate_limit_per_sec = 15
+
+    def __init__(self, api_key: str, cache: ResponseCache | None = None):
         self.api_key = api_key
         self.base_url = "https://api.hunter.io/v2"
+        self.cache = cache or get_response_cache()
 
     def find_by_company_domain(self, domain: str) -> list[dict]:
         """Find people at domain via Hunter.io API"""
+        cached = self.cache.get("hunter", "domain-search", {"domain": domain})
+        if self.cache.is_hit(cached):
+            return cached
+
         resp = requests.get(
             f"{self.base_url}/domain-search",
             params={"domain": domain, "api_key": self.api_key, "limit": 10},
         )
 
+        # Throttling and server errors are transient: raise so the caller can retry
+        if resp.status_code == 429 or resp.status_code >= 500:
+            resp.raise_for_status()
         if resp.status_code != 200:
             return []
 
@@ -39,4 +51,6 @@ class HunterPeopleFinder(CompanyPeopleFinder):
                 }
             )
 
+        # Only successful lookups are cached; auth or quota errors return [] uncached
+        self.cache.set("hunter", "domain-search", {"domain": domain}, people)
         return people
@@ -9,6 +9,8 @@ import os
 from minio import Minio
 from neo4j import GraphDatabase
 
+from atlas.etl.common.checkpoint import Checkpoint, DeadLetterStore, run_chunked
+from atlas.etl.common.entity_resolution import EntityResolver, deduplicate
 from atlas.etl.common.idempotency import new_batch_id
 
 
@@ -19,7 +21,29 @@ class ETLPipeline:
         self.mc = minio_client
         self.neo4j = neo4j_driver
 
-    def run(self, prefix: str, bucket: str = "datalake", load_to_qdrant: bool = False):
+    def run(
+        self,
+        prefix: str,
+        bucket: str = "datalake",
+        load_to_qdrant: bool = False,
+        chunk_size: int = 500,
+        resume: bool = True,
+        resolve_entities: bool = False,
+    ):
+        """
+        Load a batch into Neo4j in chunks of `chunk_size` companies.
+
+        Each committed chunk is checkpointed under `{prefix}/_checkpoints/`, so a rerun
+        after a crash resumes from the last committed chunk (pass resume=False to start
+        over). Companies that fail to write land in `{prefix}/_deadletter/` instead of
+        aborting the load. Neo4j ("graph") and Qdrant ("vector") are checkpointed
+        separately: a finished stage is skipped, the other still runs or resumes.
+
+        With resolve_entities=True, companies that are the same entity (same domain or
+        fuzzy-matching name, see atlas.etl.common.entity_resolution) are merged before
+        loading. Resolution is deterministic, so checkpoint offsets stay valid as long
+        as the flag is the same; resuming with it changed raises ValueError.
+        """
         print(f"Reading from s3://{bucket}/{prefix}/companies.json")
 
         obj = self.mc.get_object(bucket, f"{prefix}/companies.json")
@@ -29,24 +53,52 @@ class ETLPipeline:
         if not companies:
             raise ValueError("No companies found")
 
+        if resolve_entities:
+            before = len(companies)
+            companies = deduplicate(companies, EntityResolver(name_key="name"))
+            print(f"Entity resolution: {before} -> {len(companies)} companies")
+
         total_people = sum(len(c.get("people", [])) for c in companies)
         print(f"Loaded {len(companies)} companies, {total_people} people")
 
-        batch_id = new_batch_id()
-        print(f"Loading to Neo4j (batch: {batch_id})")
-
-        with self.neo4j.session() as sess:
-            sess.execute_write(self._cypher_upsert, companies, batch_id)
-
-        print(f"Neo4j loaded successfully")
+        source = "companies.json"
+        checkpoint = Checkpoint(self.mc, bucket, prefix, stage="graph", resume=resume)
+        checkpoint.bind(resolve_entities=resolve_entities)
+        batch_id = checkpoint.batch_id
+        if checkpoint.done:
+            print(f"Batch {batch_id} already in Neo4j; rerun with resume=False to reload")
+        else:
+            self._load_to_neo4j(companies, bucket, prefix, checkpoint, source, chunk_size)
 
         if load_to_qdrant:
-            print(f"Loading to Qdrant...")
-            self._load_to_qdrant(companies)
-            print(f"Qdrant loaded successfully")
+            self._load_to_qdrant(
+                companies, bucket, prefix, source, chunk_size, resume, resolve_entities
+            )
 
         return batch_id
 
+    def _load_to_neo4j(self, companies, bucket, prefix, checkpoint, source, chunk_size):
+        batch_id = checkpoint.batch_id
+        dead_letters = DeadLetterStore(self.mc, bucket, prefix, "graph", run_id=new_batch_id())
+
+        done = checkpoint.offset(source)
+        if done:
+            print(f"Resuming batch {batch_id} at company {done}/{len(companies)}")
+        print(f"Loading to Neo4j (batch: {batch_id})")
+
+        def write_chunk(chunk):
+            with self.neo4j.session() as sess:
+                sess.execute_write(self._cypher_upsert, chunk, batch_id)
+
+        written, failed = run_chunked(
+            companies, write_chunk, checkpoint, dead_letters, source, chunk_size
+        )
+        checkpoint.finish()
+
+        print(f"Neo4j loaded successfully ({written} written, {failed} failed)")
+        if failed:
+            print(f"Dead letters: s3://{bucket}/{dead_letters.key}")
+
     def _cypher_upsert(self, tx, companies, batch_id):
         tx.run(
             """
@@ -55,7 +107,7 @@ MERGE (co:Company {domain: c.domain})
   ON CREATE SET 
     co.id=c.id, co.name=c.name, co.location=c.location,
     co.rating=c.rating, co.website=c.website, co.types=c.types,
-    co.created_at=timestamp()
+    co.created_at=timestamp(), co.updated_at=timestamp()
   ON MATCH SET 
     co.name=c.name, co.location=c.location, co.updated_at=timestamp()
 WITH c, co
@@ -64,7 +116,7 @@ MERGE (pe:Person {id: p.id})
   ON CREATE SET 
     pe.full_name=p.full_name, pe.title=p.title, pe.department=p.department,
     pe.seniority=p.seniority, pe.linkedin=p.linkedin, pe.confidence=p.confidence,
-    pe.created_at=timestamp()
+    pe.created_at=timestamp(), pe.updated_at=timestamp()
   ON MATCH SET 
     pe.full_name=p.full_name, pe.title=p.title, pe.updated_at=timestamp()
 MERGE (pe)-[:WORKS_AT]->(co)
@@ -77,15 +129,49 @@ MERGE (pe)-[:HAS_EMAIL]->(e)
             batch_id=batch_id,
         )
 
-    def _load_to_qdrant(self, companies):
-        try:
-            from atlas.etl.apollo_to_vector.etl_apollo_qdrant import (
-                embed_and_upsert_companies,
+    def _load_to_qdrant(
+        self, companies, bucket, prefix, source, chunk_size, resume, resolve_entities
+    ):
+        """Embed companies and their people into Qdrant, under its own "vector" checkpoint"""
+        from atlas.etl.apollo_to_vector.etl_apollo_qdrant import (
+            build_embedder,
+            collect_entities,
+            qdrant_client,
+            upsert_chunk,
+        )
+
+        checkpoint = Checkpoint(self.mc, bucket, prefix, stage="vector", resume=resume)
+        checkpoint.bind(resolve_entities=resolve_entities)
+        if checkpoint.done:
+            print("Batch already in Qdrant; rerun with resume=False to reload")
+            return
+        dead_letters = DeadLetterStore(self.mc, bucket, prefix, "vector", run_id=new_batch_id())
+
+        done = checkpoint.offset(source)
+        # Invalid companies were already dead-lettered by the run we're resuming
+        entities = collect_entities({"companies": companies}, source, dead_letters, skip_invalid=done > 0)
+        dead_letters.flush()
+        if done:
+            print(f"Resuming Qdrant load at entity {done}/{len(entities)}")
+        print("Loading to Qdrant...")
+
+        qc = qdrant_client()
+        state = {"embedder": build_embedder(), "collection_ready": False}
+
+        def write_chunk(chunk):
+            state["embedder"] = upsert_chunk(
+                qc, state["embedder"], chunk, ensure=not state["collection_ready"]
             )
+            state["collection_ready"] = True
+
+        written, failed = run_chunked(
+            entities, write_chunk, checkpoint, dead_letters, source, chunk_size
+        )
+        checkpoint.finish()
 
-            embed_and_upsert_companies(companies)
-        except Exception as e:
-            print(f"Warning: Qdrant load skipped: {e}")
+        print(f"Qdrant loaded successfully ({written} points, {failed} failed)")
+        if len(dead_letters):
+            print(f"Dead letters: s3://{bucket}/{dead_letters.key}")
 
 
 def get_minio_client() -> Minio:
@@ -1,9 +1,13 @@
 import datetime
 import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 from atlas.ingestors.common.base import CompanyIngestor, CompanyPeopleFinder
 from atlas.ingestors.common.s3_writer import ensure_bucket, put_json
 from atlas.ingestors.common.sidecar import make_sidecar
+from atlas.ingestors.common.throttle import Throttle
 
 
 class IngestionPipeline:
@@ -13,6 +17,12 @@ class IngestionPipeline:
     High-level flow:
     1. Search for companies using a CompanyIngestor (e.g., Google Places)
     2. Optionally enrich each company with people data using a CompanyPeopleFinder (e.g., Hunter.io)
+       - up to `concurrency` lookups run in parallel on a thread pool
+       - calls are throttled to `rate_limit` per second (default: the finder's
+         `rate_limit_per_sec`, if it declares one)
+       - each lookup is retried `max_retries` times with exponential backoff
+       - with a streaming ingestor (`iter_search_sync`, e.g. ApolloConnector),
+         lookups start while later search pages are still loading
     3. Save the results to MinIO data lake with metadata
 
     Returns a MinIO prefix that can be used for subsequent ETL processing.
@@ -22,9 +32,17 @@ class IngestionPipeline:
         self,
         company_ingestor: CompanyIngestor,
         people_finder: CompanyPeopleFinder | None = None,
+        concurrency: int = 4,
+        rate_limit: float | None = None,
+        max_retries: int = 2,
+        retry_backoff: float = 1.0,
     ):
         self.company_ingestor = company_ingestor
         self.people_finder = people_finder
+        self.concurrency = max(1, concurrency)
+        self.rate_limit = rate_limit or getattr(people_finder, "rate_limit_per_sec", None)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
 
     def run(self, query: str, limit: int = 20) -> str:
         """
@@ -34,24 +52,15 @@ class IngestionPipeline:
         bucket = os.getenv("MINIO_BUCKET", "datalake")
         ensure_bucket(bucket)
 
-        # Step 1: Search companies
+        # Step 1 + 2: Search companies, enriching with people as they arrive (optional)
         print(f"Searching: {query}")
-        companies = self.company_ingestor.search(query, limit)
+        found = self._search(query, limit)
+        companies = self._enrich(found) if self.people_finder else list(found)
         print(f"Found {len(companies)} companies")
 
         if not companies:
             raise ValueError("No companies found")
 
-        # Step 2: Enrich with people (optional)
-        if self.people_finder:
-            print("Enriching with people data...")
-            for i, company in enumerate(companies, 1):
-                domain = company.get("domain")
-                print(f"  {i}/{len(companies)} {company['name']} ({domain})")
-                people = self.people_finder.find_by_company_domain(domain)
-                company["people"] = people
-                print(f"    Found {len(people)} people")
-
         # Step 3: Save to MinIO
         ts = datetime.datetime.utcnow().isoformat() + "Z"
         source = "enriched" if self.people_finder else "companies"
@@ -65,3 +74,54 @@ class IngestionPipeline:
 
         print(f"\nSaved to s3://{bucket}/{prefix}")
         return prefix
+
+    def _search(self, query: str, limit: int) -> Iterable[dict]:
+        """
+        Companies from the ingestor. Async connectors are driven through their
+        `*_sync` wrappers, streaming when the connector supports it.
+        """
+        ingestor = self.company_ingestor
+        if hasattr(ingestor, "iter_search_sync"):
+            return ingestor.iter_search_sync(query, limit)
+        if hasattr(ingestor, "search_sync"):
+            return ingestor.search_sync(query, limit)
+        return ingestor.search(query, limit)
+
+    def _enrich(self, found: Iterable[dict]) -> list[dict]:
+        """
+        Look up people for every company concurrently; results keep input order.
+        Lookups are submitted as companies arrive from `found`. A company whose
+        lookup still fails after retries gets no people and an `_enrich_error`
+        note instead of aborting the batch.
+        """
+        print(f"Enriching with people data (concurrency={self.concurrency})...")
+        throttle = Throttle(self.rate_limit, burst=self.concurrency) if self.rate_limit else None
+        finder = self.people_finder
+        find_people = getattr(finder, "find_by_company_domain_sync", finder.find_by_company_domain)
+
+        def lookup(company: dict) -> tuple[list[dict], Exception | None]:
+            domain = company.get("domain")
+            for attempt in range(self.max_retries + 1):
+                if throttle:
+                    throttle.acquire()
+                try:
+                    return find_people(domain), None
+                except Exception as e:
+                    if attempt == self.max_retries:
+                        return [], e
+                    time.sleep(self.retry_backoff * 2**attempt)
+            return [], None
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            submitted = [(company, pool.submit(lookup, company)) for company in found]
+            companies = [company for company, _ in submitted]
+            for i, (company, future) in enumerate(submitted, 1):
+                people, error = future.result()
+                company["people"] = people
+                print(f"  {i}/{len(submitted)} {company['name']} ({company.get('domain')})")
+                if error:
+                    company["_enrich_error"] = str(error)
+                    print(f"    Failed after {self.max_retries + 1} attempts: {error}")
+                else:
+                    print(f"    Found {len(people)} people")
+        return companies
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 from atlas.services.query_api.cache import cache_get, cache_set, key_of
@@ -20,7 +21,25 @@ from neo4j import Session
 from qdrant_client import QdrantClient
 from qdrant_client.models import FieldCondition, Filter, MatchValue
 
-app = FastAPI(title="Graph Query API", version="0.6.0")  # bumped for intent analysis
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Refuse to start with Apify webhooks enabled but unauthenticated
+    from atlas.connectors.apify.webhooks import webhook_config
+
+    webhook_config()
+    yield
+    # Close pooled connector clients (see ConnectorRegistry.get_pooled)
+    from atlas.connectors.registry import ConnectorRegistry
+
+    await ConnectorRegistry.close_pooled()
+
+
+app = FastAPI(
+    title="Graph Query API",
+    version="0.6.0",  # bumped for intent analysis
+    lifespan=lifespan,
+)
 
 # Add CORS middleware
 app.add_middleware(
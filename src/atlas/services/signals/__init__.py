@@ -9,6 +9,7 @@ from .signal_types import (
     SIGNAL_DEFINITIONS,
     CATEGORY_TAXONOMY,
 )
+from .keyword_matcher import KeywordMatcher
 from .signal_engine import SignalDetectionEngine
 from .confidence_scorer import ConfidenceScorer
 from .vector_rag import SignalVectorRAG
@@ -21,6 +22,7 @@ __all__ = [
     "SIGNAL_DEFINITIONS",
     "CATEGORY_TAXONOMY",
     "SignalDetectionEngine",
+    "KeywordMatcher",
     "ConfidenceScorer",
     "SignalVectorRAG",
 ]
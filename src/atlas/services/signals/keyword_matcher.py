@@ -0,0 +1,138 @@
+"""
+iBood Signals Intelligence - Keyword Matcher
+
+Finds every keyword of every signal type and category in one pass over a text.
+
+All keyword phrases are compiled once: into a word-level trie (phrase -> the
+groups it belongs to), and into one regex matching any first word of a phrase,
+itself built as a character trie so the regex engine branches on each
+character instead of trying every alternative. The regex scans the text in C;
+only at its hits are the following words checked against the trie. Cost is
+linear in the text length and independent of how many keywords are defined.
+
+Matching is on whole words, case-insensitive, ignoring punctuation between
+words ("eco-friendly" matches "eco friendly"; "CES" doesn't match "services").
+Phrases don't continue across sentence punctuation (. ! ?), so every hit lies
+within one sentence. Regular plurals of a phrase's last word match too
+("appliance" -> "appliances").
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Hashable, Iterable, Mapping
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+# Punctuation a phrase can't span
+_SENTENCE_BREAK_RE = re.compile(r"[.!?]")
+
+# Trie node key holding the (group, keyword) pairs that end at that node
+_END = ""
+
+Span = tuple[int, int]
+Hits = dict[Hashable, dict[str, list[Span]]]
+
+
+def _plurals(word: str) -> set[str]:
+    """The word plus its regular English plural forms"""
+    forms = {word, word + "s"}
+    if word.endswith(("s", "x", "z", "ch", "sh")):
+        forms.add(word + "es")
+    if len(word) > 1 and word.endswith("y") and word[-2] not in "aeiou":
+        forms.add(word[:-1] + "ies")
+    return forms
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex matching exactly `words`, factored by common prefixes"""
+    root: dict = {}
+    for word in words:
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[_END] = True
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(node[ch]) for ch in sorted(node) if ch != _END]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if _END in node else body
+
+    return build(root)
+
+
+class KeywordMatcher:
+    """
+    Compiled keyword groups.
+
+    Usage:
+        matcher = KeywordMatcher({"surplus": ["overstock", "excess inventory"]})
+        hits = matcher.scan(text)          # {"surplus": {"overstock": [(12, 21)]}}
+        matcher.count(hits, "surplus")     # distinct keywords found
+    """
+
+    def __init__(self, groups: Mapping[Hashable, Iterable[str]]):
+        self.groups = {group: list(keywords) for group, keywords in groups.items()}
+        self._trie: dict = {}
+        for group, keywords in self.groups.items():
+            for keyword in keywords:
+                words = _WORD_RE.findall(keyword.lower())
+                if not words:
+                    continue
+                node = self._trie
+                for word in words[:-1]:
+                    node = node.setdefault(word, {})
+                for last in _plurals(words[-1]):
+                    end = node.setdefault(last, {}).setdefault(_END, [])
+                    if (group, keyword) not in end:
+                        end.append((group, keyword))
+
+        # Any first word of a phrase, as a whole word
+        first_words = r"(?<![^\W_])" + _trie_pattern(self._trie) + r"(?![^\W_])"
+        self._first_word_re = re.compile(first_words)
+        self._first_word_re_ci = re.compile(first_words, re.IGNORECASE)
+
+    def scan(self, text: str) -> Hits:
+        """
+        All keyword occurrences in text, grouped.
+
+        Returns:
+            {group: {keyword: [(start, end), ...]}} with character spans into
+            text; groups without any hit are left out
+        """
+        hits: Hits = {}
+        if not self._trie or not text:
+            return hits
+
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            matches = self._first_word_re.finditer(lowered)
+        else:
+            # Lowercasing changed offsets (rare Unicode); match on the original
+            lowered = text
+            matches = self._first_word_re_ci.finditer(text)
+
+        for match in matches:
+            start, end = match.span()
+            node = self._trie[match.group().lower()]
+            while True:
+                for group, keyword in node.get(_END, ()):
+                    hits.setdefault(group, {}).setdefault(keyword, []).append((start, end))
+                if len(node) == (_END in node):
+                    break  # no longer phrase continues here
+                word = _WORD_RE.search(lowered, end)
+                if word is None or _SENTENCE_BREAK_RE.search(lowered, end, word.start()):
+                    break
+                node = node.get(word.group().lower())
+                if node is None:
+                    break
+                end = word.end()
+
+        return hits
+
+    @staticmethod
+    def count(hits: Hits, group: Hashable) -> int:
+        """Number of distinct keywords of a group that were found"""
+        return len(hits.get(group, ()))
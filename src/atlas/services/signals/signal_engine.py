@@ -10,6 +10,7 @@ from __future__ import annotations
 import re
 import os
 import uuid
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import Any
 from dataclasses import dataclass, field
@@ -21,9 +22,27 @@ from .signal_types import (
     SIGNAL_DEFINITIONS, CATEGORY_TAXONOMY
 )
 from .confidence_scorer import ConfidenceScorer
+from .keyword_matcher import KeywordMatcher
 from .vector_rag import SignalVectorRAG
 
 
+# Every signal and category keyword, compiled once; one scan per text finds all
+# of them. Groups are ("signal", SignalType) and ("category", ProductCategory).
+SIGNAL_MATCHER = KeywordMatcher({
+    **{
+        ("signal", signal_type): definition.get("keywords", [])
+        for signal_type, definition in SIGNAL_DEFINITIONS.items()
+    },
+    **{
+        ("category", category): [*info.get("keywords", []), *info.get("subcategories", [])]
+        for category, info in CATEGORY_TAXONOMY.items()
+    },
+})
+
+# Sentences are the runs of text between sentence punctuation
+_SENTENCE_RE = re.compile(r"[^.!?]+")
+
+
 @dataclass
 class DetectedSignal:
     """A detected signal from text analysis"""
@@ -126,18 +145,27 @@ class SignalDetectionEngine:
             List of detected signals
         """
         detected = []
-        text_lower = text.lower()
+
+        # Find all signal and category keywords in one pass, and segment the
+        # text once; quotes and summaries come from the sentences hits fall in
+        hits = SIGNAL_MATCHER.scan(text)
+        sentences = [(m.start(), m.group().strip()) for m in _SENTENCE_RE.finditer(text)]
+        sentence_starts = [start for start, _ in sentences]
+        signal_categories = categories or self._detect_categories(text, hits)
 
         # Check each signal type
         for signal_type, definition in SIGNAL_DEFINITIONS.items():
-            keywords = definition.get("keywords", [])
+            group = ("signal", signal_type)
 
-            # Count keyword matches
-            matches = sum(1 for kw in keywords if kw.lower() in text_lower)
+            # Count distinct keyword matches
+            matches = SIGNAL_MATCHER.count(hits, group)
 
             if matches >= 2:  # At least 2 keyword matches
+                # Sentences containing a keyword, in text order
+                relevant = self._hit_sentences(hits.get(group, {}), sentence_starts, sentences)
+
                 # Extract relevant quote
-                quote = self._extract_quote(text, keywords)
+                quote = self._extract_quote(relevant)
 
                 # Calculate confidence
                 confidence, factors = self.scorer.score(
@@ -162,14 +190,14 @@ class SignalDetectionEngine:
                     signal_type=signal_type,
                     signal_priority=definition["priority"],
                     title=f"{company_name}: {definition['label']}",
-                    summary=self._generate_summary(text, definition, matches),
+                    summary=self._generate_summary(relevant, definition),
                     confidence_score=confidence,
                     deal_potential_score=deal_potential,
                     source_url=source_url,
                     source_type=source_type,
                     source_date=source_date or datetime.now(),
                     expires_at=expires_at,
-                    categories=categories or self._detect_categories(text),
+                    categories=list(signal_categories),
                     evidence={"quotes": [quote] if quote else [], "keyword_matches": matches},
                     timing_recommendation=self._generate_timing(definition["priority"], urgency_days),
                 )
@@ -178,44 +206,43 @@ class SignalDetectionEngine:
 
         return detected
 
-    def _extract_quote(self, text: str, keywords: list[str]) -> str | None:
-        """Extract the most relevant quote containing keywords"""
-        sentences = re.split(r'[.!?]', text)
+    @staticmethod
+    def _hit_sentences(
+        keyword_hits: dict[str, list[tuple[int, int]]],
+        sentence_starts: list[int],
+        sentences: list[tuple[int, str]],
+    ) -> list[str]:
+        """Stripped sentences containing at least one of the hits, in text order"""
+        indices = {
+            bisect_right(sentence_starts, start) - 1
+            for spans in keyword_hits.values()
+            for start, _ in spans
+        }
+        return [sentences[i][1] for i in sorted(indices) if i >= 0]
 
-        for sentence in sentences:
-            sentence = sentence.strip()
+    def _extract_quote(self, relevant: list[str]) -> str | None:
+        """Extract the most relevant quote containing keywords"""
+        for sentence in relevant:
             if len(sentence) < 20:
                 continue
 
-            matches = sum(1 for kw in keywords if kw.lower() in sentence.lower())
-            if matches >= 1:
-                # Truncate if too long
-                if len(sentence) > 200:
-                    sentence = sentence[:200] + "..."
-                return f'"{sentence}"'
+            # Truncate if too long
+            if len(sentence) > 200:
+                sentence = sentence[:200] + "..."
+            return f'"{sentence}"'
 
         return None
 
-    def _generate_summary(self, text: str, definition: dict, matches: int) -> str:
+    def _generate_summary(self, relevant: list[str], definition: dict) -> str:
         """Generate a summary of the detected signal"""
         label = definition.get("label", "Signal")
         why = definition.get("why_matters", "")
 
         # Take first few relevant sentences
-        sentences = re.split(r'[.!?]', text)
-        relevant = []
-        for s in sentences:
-            s = s.strip()
-            if len(s) > 30:
-                # Check if sentence contains any keywords
-                keywords = definition.get("keywords", [])
-                if any(kw.lower() in s.lower() for kw in keywords):
-                    relevant.append(s)
-                    if len(relevant) >= 2:
-                        break
-
-        if relevant:
-            return ". ".join(relevant) + "."
+        summary = [s for s in relevant if len(s) > 30][:2]
+
+        if summary:
+            return ". ".join(summary) + "."
         else:
             return f"{label} detected. {why}"
 
@@ -233,27 +260,20 @@ class SignalDetectionEngine:
         else:
             return f"Nurture: Build relationship over {urgency_days} days"
 
-    def _detect_categories(self, text: str) -> list[ProductCategory]:
-        """Detect product categories from text"""
-        detected = []
-        text_lower = text.lower()
-
-        for category, info in CATEGORY_TAXONOMY.items():
-            keywords = info.get("keywords", [])
-            subcats = info.get("subcategories", [])
-
-            # Check category keywords
-            matches = sum(1 for kw in keywords if kw.lower() in text_lower)
-
-            # Check subcategory mentions
-            for subcat in subcats:
-                if subcat.lower() in text_lower:
-                    matches += 1
-
-            if matches >= 2:
-                detected.append(category)
+    def _detect_categories(
+        self,
+        text: str,
+        hits: dict | None = None,
+    ) -> list[ProductCategory]:
+        """Detect product categories from text (keyword and subcategory mentions)"""
+        if hits is None:
+            hits = SIGNAL_MATCHER.scan(text)
 
-        return detected
+        return [
+            category
+            for category in CATEGORY_TAXONOMY
+            if SIGNAL_MATCHER.count(hits, ("category", category)) >= 2
+        ]
 
     def enrich_with_rag(self, signal: DetectedSignal) -> DetectedSignal:
         """
@@ -295,7 +315,7 @@ class SignalDetectionEngine:
 
         query = """
         MERGE (c:Company {id: $company_id})
-        SET c.name = $company_name
+        SET c.name = $company_name, c.updated_at = timestamp()
 
         CREATE (s:Signal {
             id: $signal_id,